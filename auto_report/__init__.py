@@ -0,0 +1,110 @@
+"""
+Core computations of the Auto Correlation and Cpk Report Generator.
+
+The modules in this package hold the array-based statistics used by
+Auto_Report_Gen-GUI.py so that they can be imported and benchmarked without
+starting the GUI. Importing the package has no side effects: nothing is read,
+printed or written until a function is called, and the modules themselves (with
+pandas, numpy and openpyxl) are only imported when one of their names is first
+used, so that `python -m auto_report --help` and the GUI start quickly.
+
+Each stage of a report can be run on its own:
+
+    from auto_report import (load_limits, load_datalogs, compute_correlation,
+                             compute_cpk, build_summary, write_report)
+
+    limit = load_limits('LTC4441_Ref_Lot_Limits.csv')
+    datalogs = load_datalogs(rb_files, [nb1_files, nb2_files])
+    correlation = compute_correlation(limit, datalogs.data)
+    cpk = compute_cpk(limit, correlation)
+
+generate_report chains all the stages and writes the Excel report.
+"""
+
+import importlib
+
+# Public name -> module of the package that defines it
+_EXPORTS = {
+    'UnitBlock': 'align',
+    'align_datalog': 'align',
+    'align_datalogs': 'align',
+    'align_unit_block': 'align',
+    'mismatch_report': 'align',
+    'BatchResult': 'batch',
+    'run_batch': 'batch',
+    'write_batch_index': 'batch',
+    'cached_load_limits': 'cache',
+    'cached_read_datalog': 'cache',
+    'cached_unit_block': 'cache',
+    'evict_cache': 'cache',
+    'CAPABILITY_LABELS': 'capability',
+    'capability_labels': 'capability',
+    'evaluate_capability': 'capability',
+    'STATUS_LABELS': 'correlation',
+    'board_result_codes': 'correlation',
+    'evaluate_correlation': 'correlation',
+    'status_labels': 'correlation',
+    'status_tally': 'correlation',
+    'Datalog': 'datalog',
+    'DatalogStatistics': 'datalog',
+    'read_datalog': 'datalog',
+    'read_datalog_statistics': 'datalog',
+    'export_tables': 'export',
+    'memoized': 'incremental',
+    'read_datalogs': 'ingest',
+    'read_unit_blocks': 'ingest',
+    'LimitIndex': 'limits',
+    'compile_limits': 'limits',
+    'limit_rows': 'limits',
+    'CorrelationResult': 'pipeline',
+    'CpkResult': 'pipeline',
+    'LoadedDatalogs': 'pipeline',
+    'ReportSheet': 'pipeline',
+    'build_summary': 'pipeline',
+    'compute_correlation': 'pipeline',
+    'compute_cpk': 'pipeline',
+    'generate_report': 'pipeline',
+    'load_datalogs': 'pipeline',
+    'load_limits': 'pipeline',
+    'load_statistics': 'pipeline',
+    'report_file_name': 'pipeline',
+    'report_sheets': 'pipeline',
+    'write_report': 'pipeline',
+    'StageRecord': 'profiling',
+    'profile_stage': 'profiling',
+    'write_profile': 'profiling',
+    'round_decimal': 'rounding',
+    'round_exact': 'rounding',
+    'SummaryStats': 'stats',
+    'board_statistics': 'stats',
+    'build_datalog_tensor': 'stats',
+    'pool_statistics': 'stats',
+    'stack_statistics': 'stats',
+    'statistics_mean_std': 'stats',
+    'summary_statistics': 'stats',
+    'unit_statistics': 'stats',
+    'write_workbook_streaming': 'streaming',
+    'correlation_long_table': 'tables',
+    'cpk_long_table': 'tables',
+    'unit_statistics_table': 'tables',
+    'DatalogSet': 'watch',
+    'complete_set': 'watch',
+    'group_datalogs': 'watch',
+    'watch_folder': 'watch',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    # Import the module of a public name on its first use and keep the name for the next ones
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
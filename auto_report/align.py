@@ -0,0 +1,234 @@
+from collections import namedtuple
+
+import numpy as np  # For numerical operations
+import pandas as pd  # For the mismatch report
+
+from .datalog import DatalogStatistics
+from .limits import limit_rows, normalize_keys
+from .stats import SummaryStats, summary_statistics
+
+# Column names of the mismatch report
+MISMATCH_COLUMNS = ['Board', 'Unit', 'Test #', 'Description', 'Issue']
+
+# Issues of the mismatch report
+MISSING = 'Missing from datalog'
+EXTRA = 'Not in limit file'
+DUPLICATE = 'Duplicate in datalog'
+
+# Statistics of one datalog aligned on the limit rows, one (board, unit) block of a report:
+# - statistics: SummaryStats of shape (test,), one entry per limit row.
+# - mismatches: Test numbers, descriptions and issues of the tests that do not match
+#   the limit file, as returned by unit_mismatches.
+UnitBlock = namedtuple('UnitBlock', ['statistics', 'mismatches'])
+
+
+def _align_rows(limits, datalog, match_description):
+    """
+    Match the tests of a datalog to the limit rows.
+
+    Returns:
+    - tuple: Limit row of every datalog row (-1 if none), the mask of the datalog rows
+      to use, and the limit rows missing from, the datalog rows not in and the
+      datalog rows repeated in the datalog.
+    """
+    rows = limit_rows(limits, datalog.test_numbers, datalog.descriptions if match_description else None)
+    num_tests = len(limits.test_numbers)
+
+    # A test found twice keeps its first row
+    found = rows >= 0
+    duplicate = found & pd.Series(rows).duplicated().to_numpy()
+    used = found & ~duplicate
+
+    present = np.zeros(num_tests, dtype=bool)
+    present[rows[used]] = True
+
+    return rows, used, np.flatnonzero(~present), np.flatnonzero(~found), np.flatnonzero(duplicate)
+
+
+def _in_limit_order(limits, rows):
+    """
+    Whether the datalog lists exactly the limit tests, in the same order.
+    """
+    return len(rows) == len(limits.test_numbers) and np.array_equal(rows, np.arange(len(rows)))
+
+
+def align_datalog(limits, datalog, match_description=False):
+    """
+    Reorder the tests of one datalog to the rows of the limit file, joining on 'Test #'.
+
+    Every datalog test is looked up in the hashed limit index, so the cost is
+    linear in the number of tests whatever their order. A datalog that lists the
+    limit tests in the limit file order is returned without being copied.
+
+    Parameters:
+    - limits: LimitIndex returned by compile_limits.
+    - datalog: Datalog returned by read_datalog.
+    - match_description: Join on the (test number, description) pair instead of the test number alone.
+
+    Returns:
+    - tuple: A tuple containing:
+        - numpy.ndarray: (device, test) values with one column per limit row, NaN for
+          the tests the datalog does not have.
+        - numpy.ndarray: Limit rows missing from the datalog.
+        - numpy.ndarray: Datalog rows not in the limit file.
+        - numpy.ndarray: Datalog rows repeating a test already seen in the datalog.
+    """
+    rows, used, missing, extra, duplicate = _align_rows(limits, datalog, match_description)
+
+    # Fast path: the datalog lists exactly the limit tests, in the same order
+    if _in_limit_order(limits, rows):
+        return datalog.values.T, missing, extra, duplicate
+
+    values = np.full((datalog.values.shape[1], len(limits.test_numbers)), np.nan)
+    values[:, rows[used]] = datalog.values[used].T
+
+    return values, missing, extra, duplicate
+
+
+def align_datalog_statistics(limits, datalog, match_description=False):
+    """
+    Reorder the per-test statistics of one datalog to the rows of the limit file, like align_datalog.
+
+    Parameters:
+    - limits: LimitIndex returned by compile_limits.
+    - datalog: DatalogStatistics returned by read_datalog_statistics.
+    - match_description: Join on the (test number, description) pair instead of the test number alone.
+
+    Returns:
+    - tuple: The SummaryStats with one entry per limit row (no values for the tests
+      the datalog does not have), then the missing, extra and duplicate rows as in align_datalog.
+    """
+    rows, used, missing, extra, duplicate = _align_rows(limits, datalog, match_description)
+
+    if _in_limit_order(limits, rows):
+        return datalog.statistics, missing, extra, duplicate
+
+    num_tests = len(limits.test_numbers)
+    count, mean, m2 = np.zeros(num_tests), np.full(num_tests, np.nan), np.zeros(num_tests)
+    count[rows[used]] = datalog.statistics.count[used]
+    mean[rows[used]] = datalog.statistics.mean[used]
+    m2[rows[used]] = datalog.statistics.m2[used]
+
+    return SummaryStats(count, mean, m2), missing, extra, duplicate
+
+
+def unit_mismatches(limits, datalog, missing, extra, duplicate):
+    """
+    List the tests of one datalog that do not match the limit file.
+
+    Parameters:
+    - limits: LimitIndex returned by compile_limits.
+    - datalog: Datalog or DatalogStatistics the rows were found in.
+    - missing, extra, duplicate: Rows returned by align_datalog (or align_datalog_statistics).
+
+    Returns:
+    - tuple: Test numbers, descriptions and issues (object arrays of strings), one entry per
+      test: the missing tests first, then the extra and the duplicate ones.
+    """
+    test_numbers = [limits.test_numbers[missing], datalog.test_numbers[extra], datalog.test_numbers[duplicate]]
+    descriptions = [limits.descriptions[missing], datalog.descriptions[extra], datalog.descriptions[duplicate]]
+    issues = np.repeat(np.array([MISSING, EXTRA, DUPLICATE], dtype=object), [len(rows) for rows in test_numbers])
+
+    return (
+        np.concatenate([normalize_keys(keys) for keys in test_numbers]),
+        np.concatenate([normalize_keys(keys) for keys in descriptions]),
+        issues,
+    )
+
+
+def mismatch_report(boards):
+    """
+    Build the mismatch report of a run from the mismatches of every datalog.
+
+    Parameters:
+    - boards: List (one entry per board, RB first) of lists (one entry per unit) of the
+              (test numbers, descriptions, issues) returned by unit_mismatches.
+
+    Returns:
+    - pandas.DataFrame: One row per test missing from, extra in or repeated in a datalog
+      (empty when every datalog matches the limit file).
+    """
+    mismatches = []
+    for b, board in enumerate(boards):
+        board_name = 'RB' if b == 0 else f'NB{b}'
+        for u, (test_numbers, descriptions, issues) in enumerate(board):
+            if len(issues):
+                mismatches.append(pd.DataFrame({
+                    'Board': board_name,
+                    'Unit': f'U{u + 1}',
+                    'Test #': test_numbers,
+                    'Description': descriptions,
+                    'Issue': issues,
+                }))
+
+    if mismatches:
+        return pd.concat(mismatches, ignore_index=True)
+    return pd.DataFrame(columns=MISMATCH_COLUMNS)
+
+
+def align_datalogs(limits, rb, nb, match_description=False):
+    """
+    Align the RB and NB datalogs on the limit file and report the tests that do not match.
+
+    Parameters:
+    - limits: LimitIndex returned by compile_limits.
+    - rb: RB datalogs (Datalog or DatalogStatistics), one per unit.
+    - nb: NB datalogs, one list of units per board.
+    - match_description: Join on the (test number, description) pair instead of the test number alone.
+
+    Returns:
+    - tuple: A tuple containing:
+        - list: (device, test) arrays of every board (RB first) and unit, ready for
+          build_datalog_tensor; SummaryStats, ready for stack_statistics, for DatalogStatistics.
+        - pandas.DataFrame: Mismatch report (see mismatch_report).
+    """
+    boards = []
+    mismatches = []
+    for board in [rb] + list(nb):
+        units = []
+        unit_issues = []
+        for datalog in board:
+            align = align_datalog_statistics if isinstance(datalog, DatalogStatistics) else align_datalog
+            values, missing, extra, duplicate = align(limits, datalog, match_description)
+            units.append(values)
+            unit_issues.append(unit_mismatches(limits, datalog, missing, extra, duplicate))
+        boards.append(units)
+        mismatches.append(unit_issues)
+
+    return boards, mismatch_report(mismatches)
+
+
+def align_unit_block(limits, datalog, match_description=False):
+    """
+    Align one datalog on the limit file and reduce it to its per-test statistics.
+
+    The statistics are the same as those compute_correlation takes from the datalog
+    tensor, so a report can be assembled from blocks computed (and cached) one file at a time.
+
+    Parameters:
+    - limits: LimitIndex returned by compile_limits.
+    - datalog: Datalog returned by read_datalog, or DatalogStatistics returned by read_datalog_statistics.
+    - match_description: Join on the (test number, description) pair instead of the test number alone.
+
+    Returns:
+    - UnitBlock: The aligned statistics and the mismatches of the datalog.
+    """
+    if isinstance(datalog, DatalogStatistics):
+        statistics, missing, extra, duplicate = align_datalog_statistics(limits, datalog, match_description)
+    else:
+        values, missing, extra, duplicate = align_datalog(limits, datalog, match_description)
+        # Reduce a C-ordered copy, device row by device row like the devices of the datalog tensor,
+        # so the sums are added in the same order
+        statistics = summary_statistics(np.ascontiguousarray(values), axis=0)
+
+    return UnitBlock(statistics, unit_mismatches(limits, datalog, missing, extra, duplicate))
+
+
+def mismatch_counts(report):
+    """
+    Count the issues of a mismatch report per board and unit.
+
+    Returns:
+    - pandas.DataFrame: One row per board and unit with mismatches, one column per issue.
+    """
+    return report.groupby(['Board', 'Unit'], sort=False)['Issue'].value_counts().unstack(fill_value=0)
@@ -0,0 +1,176 @@
+"""
+Batch runner: many correlation jobs on a process pool, one report per job and a roll-up index.
+"""
+
+import os  # For output paths
+import time  # For per-job timing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd  # For the roll-up index
+
+from .cache import DEFAULT_CACHE_DIR, cached_load_limits
+from .limits import load_limits
+from .pipeline import generate_report
+
+# Outcome of one batch job:
+# - name: Job name (its job file, or its position in the manifest).
+# - test_card: 'Test Card Name' of the job.
+# - status: 'ok' or 'failed'.
+# - output: Path of the report (or export directory), None if the job failed.
+# - seconds: Wall-clock time of the job.
+# - error: Error message of a failed job, '' otherwise.
+BatchResult = namedtuple('BatchResult', ['name', 'test_card', 'status', 'output', 'seconds', 'error'])
+
+# Column names of the roll-up index
+INDEX_COLUMNS = ['Job', 'Test Card', 'Status', 'Report', 'Seconds', 'Error']
+
+# Limits parsed once by the parent, keyed by limit file; set in every worker process by _init_worker
+_limits = {}
+
+
+def _init_worker(limits):
+    """
+    Keep the parsed limits in the worker process, so they are sent once per process rather than once per job.
+    """
+    global _limits
+    _limits = limits
+
+
+def _error_message(error):
+    return f"{type(error).__name__}: {error}"
+
+
+def failed_result(name, inputs, error, seconds=0.0):
+    """
+    Return the BatchResult of a job that failed with the given exception.
+    """
+    test_card = inputs.get('product_info', {}).get('Test Card Name', '')
+    return BatchResult(name, test_card, 'failed', None, seconds, _error_message(error))
+
+
+def _print_result(result):
+    if result.status == 'ok':
+        print(f"[{result.name}] Report has been written to '{result.output}' ({result.seconds:.1f} s)")
+    else:
+        print(f"[{result.name}] Job failed: {result.error}")
+
+
+def _run_job(name, inputs, options):
+    """
+    Run one job in a worker process. Any error is returned as a failed BatchResult, never raised.
+    """
+    start = time.perf_counter()
+    try:
+        output = generate_report(**inputs, limit=_limits[inputs['limit_file']], **options)
+    except Exception as e:
+        return failed_result(name, inputs, e, time.perf_counter() - start)
+    return BatchResult(name, inputs['product_info']['Test Card Name'], 'ok', output, time.perf_counter() - start, '')
+
+
+def _output_targets(inputs, options):
+    """
+    Return where a job writes its outputs, as (directory, test card) pairs: the report,
+    mismatch, profile and default export files are all named after the test card in
+    the output directory, and the datasets of a shared export directory are partitioned
+    by test card.
+    """
+    test_card = inputs['product_info']['Test Card Name']
+    targets = [(os.path.abspath(inputs['output_dir']), test_card)]
+    if options.get('export_format') and options.get('export_dir'):
+        targets.append((os.path.abspath(options['export_dir']), test_card))
+    return targets
+
+
+def run_batch(jobs, max_workers=None, read_workers=None, **options):
+    """
+    Run correlation jobs concurrently on a process pool.
+
+    Every distinct limit file is parsed once, in this process, and shared with the
+    workers. A job whose limit file cannot be parsed, or whose outputs would
+    overwrite those of an earlier job (same test card and output or export
+    directory), fails without being run. A job that
+    raises fails on its own: the other jobs keep running. Even a worker process
+    that dies only fails the jobs it took down.
+
+    Parameters:
+    - jobs: List of (name, inputs) pairs, inputs being the product_info, setup_info,
+            nb_file, rb_file, limit_file and output_dir arguments of generate_report.
+    - max_workers: Number of worker processes (None for one per CPU).
+    - read_workers: Number of datalog reading threads of each job (None for the default).
+    - options: Other keyword arguments of generate_report applied to every job (cache_dir,
+               layout, streaming, export_format, export_dir, excel).
+
+    Returns:
+    - list: One BatchResult per job, in the order of the jobs.
+    """
+    options = dict(options, max_workers=read_workers)
+    cache_dir = options.get('cache_dir', DEFAULT_CACHE_DIR)
+
+    # Parse (or load from the parse cache) and compile every limit file once
+    limits = {}
+    limit_errors = {}
+    for _, inputs in jobs:
+        limit_file = inputs['limit_file']
+        if limit_file not in limits and limit_file not in limit_errors:
+            try:
+                if cache_dir is None:
+                    limits[limit_file] = load_limits(limit_file)
+                else:
+                    limits[limit_file] = cached_load_limits(limit_file, cache_dir)
+            except Exception as e:
+                limit_errors[limit_file] = e
+
+    results = [None] * len(jobs)
+    output_targets = set()
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(limits,)) as executor:
+        futures = {}
+        for index, (name, inputs) in enumerate(jobs):
+            if inputs['limit_file'] in limit_errors:
+                results[index] = failed_result(name, inputs, limit_errors[inputs['limit_file']])
+                _print_result(results[index])
+                continue
+
+            # Outputs are named after the test card and the date, so two jobs could write the same files
+            targets = _output_targets(inputs, options)
+            taken = [directory for directory, test_card in targets if (directory, test_card) in output_targets]
+            if taken:
+                error = ValueError(f"Another job already writes the outputs of test card "
+                                   f"'{inputs['product_info']['Test Card Name']}' to '{taken[0]}'")
+                results[index] = failed_result(name, inputs, error)
+                _print_result(results[index])
+                continue
+            output_targets.update(targets)
+
+            os.makedirs(inputs['output_dir'], exist_ok=True)
+            futures[executor.submit(_run_job, name, inputs, options)] = index
+
+        for future in as_completed(futures):
+            index = futures[future]
+            name, inputs = jobs[index]
+            try:
+                results[index] = future.result()
+            except Exception as e:  # The worker process died (BrokenProcessPool)
+                results[index] = failed_result(name, inputs, e)
+            _print_result(results[index])
+
+    return results
+
+
+def write_batch_index(results, index_file):
+    """
+    Write the roll-up index of a batch: one row per job with its status, report and error.
+
+    Parameters:
+    - results: BatchResult tuples, as returned by run_batch.
+    - index_file: Path of the CSV file to write.
+
+    Returns:
+    - pandas.DataFrame: The index.
+    """
+    index = pd.DataFrame(
+        [(r.name, r.test_card, r.status, r.output or '', round(r.seconds, 3), r.error) for r in results],
+        columns=INDEX_COLUMNS,
+    )
+    index.to_csv(index_file, index=False)
+    return index
@@ -0,0 +1,306 @@
+import hashlib  # For content hashing
+import io  # For parsing from the bytes already read
+import os  # For cache directory handling
+import tempfile  # For atomic cache writes
+
+import numpy as np  # For the binary cache format
+import pandas as pd  # For the cached limit tables
+
+from .align import UnitBlock, align_unit_block
+from .datalog import Datalog, read_datalog, read_datalog_statistics
+from .limits import alignment_key, compile_limits, load_limits
+from .stats import SummaryStats
+
+# Default location and size cap of the parse cache
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.auto_report_cache')
+DEFAULT_CACHE_BYTES = 512 * 1024 ** 2
+
+# Bump when read_datalog (or load_limits) changes what it returns, so old entries are not reused
+CACHE_VERSION = b'datalog-2'
+LIMITS_CACHE_VERSION = b'limits-2'
+BLOCK_CACHE_VERSION = b'block-2'
+
+
+def _content_key(data, version=CACHE_VERSION):
+    """
+    Return the cache key of a file's content.
+    """
+    return hashlib.blake2b(version + data, digest_size=16).hexdigest()
+
+
+def _to_strings(values):
+    """
+    Split an object array of strings and missing values into a string array and a missing mask.
+    """
+    missing = np.array([not isinstance(value, str) for value in values], dtype=bool)
+    strings = np.array(['' if is_missing else value for value, is_missing in zip(values, missing)], dtype=str)
+    return strings, missing
+
+
+def _from_strings(strings, missing):
+    """
+    Rebuild the object array written by _to_strings.
+    """
+    values = strings.astype(object)
+    values[missing] = np.nan
+    return values
+
+
+def _store_entry(entry_path, datalog):
+    """
+    Write a datalog to the cache as an uncompressed .npz file, atomically.
+    """
+    arrays = {'values': datalog.values, 'test_numbers': datalog.test_numbers.astype(str)}
+    arrays['descriptions'], arrays['descriptions_missing'] = _to_strings(datalog.descriptions)
+    arrays['units'], arrays['units_missing'] = _to_strings(datalog.units)
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, entry_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _load_entry(entry_path):
+    """
+    Read a datalog written by _store_entry.
+    """
+    with np.load(entry_path, allow_pickle=False) as arrays:
+        return Datalog(
+            test_numbers=arrays['test_numbers'].astype(object),
+            descriptions=_from_strings(arrays['descriptions'], arrays['descriptions_missing']),
+            units=_from_strings(arrays['units'], arrays['units_missing']),
+            values=arrays['values'],
+        )
+
+
+def _store_limits(entry_path, limit):
+    """
+    Write a cleaned limit table to the cache as an uncompressed .npz file, atomically.
+
+    Numeric columns are stored as they are, text columns as strings and a missing mask.
+    """
+    arrays = {'columns': np.array([str(name) for name in limit.columns]), 'index': limit.index.to_numpy()}
+    for j in range(limit.shape[1]):
+        column = limit.iloc[:, j]
+        if column.dtype.kind in 'biuf':
+            arrays[f'column{j}'] = column.to_numpy()
+        else:
+            arrays[f'column{j}'], arrays[f'column{j}_missing'] = _to_strings(column.to_numpy(dtype=object))
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, entry_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _load_limits_entry(entry_path):
+    """
+    Read a limit table written by _store_limits.
+    """
+    with np.load(entry_path, allow_pickle=False) as arrays:
+        columns = {}
+        for j, name in enumerate(arrays['columns']):
+            if f'column{j}_missing' in arrays:
+                columns[str(name)] = _from_strings(arrays[f'column{j}'], arrays[f'column{j}_missing'])
+            else:
+                columns[str(name)] = arrays[f'column{j}']
+        return pd.DataFrame(columns, index=arrays['index'])
+
+
+def _store_block(entry_path, block):
+    """
+    Write the aligned statistics and mismatches of a datalog to the cache as an uncompressed .npz file, atomically.
+    """
+    test_numbers, descriptions, issues = block.mismatches
+    arrays = dict(block.statistics._asdict())
+    arrays.update(test_numbers=test_numbers.astype(str), descriptions=descriptions.astype(str), issues=issues.astype(str))
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, entry_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _load_block(entry_path):
+    """
+    Read the UnitBlock written by _store_block.
+    """
+    with np.load(entry_path, allow_pickle=False) as arrays:
+        return UnitBlock(
+            statistics=SummaryStats(*(arrays[name] for name in SummaryStats._fields)),
+            mismatches=tuple(arrays[name].astype(object) for name in ('test_numbers', 'descriptions', 'issues')),
+        )
+
+
+def evict_cache(cache_dir, max_bytes):
+    """
+    Delete the least recently used cache entries until the cache fits in max_bytes.
+
+    Parameters:
+    - cache_dir: Cache directory.
+    - max_bytes: Maximum total size of the cache entries in bytes.
+
+    Returns:
+    - None
+    """
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith('.npz'):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # Removed by another reader meanwhile
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+
+    # Entries are touched on every hit, so the oldest mtime is the least recently used
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def cached_read_datalog(file_path, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_BYTES):
+    """
+    Read a datalog through the on-disk parse cache.
+
+    The file is read once and its content hashed. When the hash is in the cache,
+    the parsed arrays are loaded from there; otherwise the bytes already read are
+    parsed by read_datalog and stored. Unchanged files are therefore never parsed
+    twice, whatever their path or modification time.
+
+    Parameters:
+    - file_path: Path of the datalog CSV file.
+    - cache_dir: Cache directory (created if needed).
+    - max_bytes: Maximum total size of the cache in bytes; least recently used
+                 entries are evicted beyond it.
+
+    Returns:
+    - Datalog: Same result as read_datalog(file_path).
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    os.makedirs(cache_dir, exist_ok=True)
+    return _parse_cached(data, cache_dir, max_bytes)
+
+
+def _parse_cached(data, cache_dir, max_bytes):
+    """
+    Return the datalog of the bytes of a file from the parse cache, parsing and storing it if it is not there.
+    """
+    entry_path = os.path.join(cache_dir, _content_key(data) + '.npz')
+
+    try:
+        datalog = _load_entry(entry_path)
+        os.utime(entry_path)  # Mark the entry as recently used
+        return datalog
+    except (OSError, ValueError, KeyError):
+        pass  # Not cached yet (or an unreadable entry), parse and store it
+
+    datalog = read_datalog(io.BytesIO(data))
+    _store_entry(entry_path, datalog)
+    evict_cache(cache_dir, max_bytes)
+
+    return datalog
+
+
+def cached_load_limits(limit_file, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_BYTES):
+    """
+    Read the reference lot limits through the on-disk parse cache and compile them.
+
+    Like cached_read_datalog, the file is hashed and the cleaned limit table of an
+    unchanged file is loaded from the cache instead of being parsed and cleaned
+    again.
+
+    Parameters:
+    - limit_file: Path of the limit CSV file.
+    - cache_dir: Cache directory (created if needed).
+    - max_bytes: Maximum total size of the cache in bytes.
+
+    Returns:
+    - LimitIndex: Same result as compile_limits(load_limits(limit_file)).
+    """
+    with open(limit_file, 'rb') as f:
+        data = f.read()
+
+    os.makedirs(cache_dir, exist_ok=True)
+    entry_path = os.path.join(cache_dir, _content_key(data, LIMITS_CACHE_VERSION) + '.npz')
+
+    try:
+        limit = _load_limits_entry(entry_path)
+        os.utime(entry_path)  # Mark the entry as recently used
+        return compile_limits(limit)
+    except (OSError, ValueError, KeyError):
+        pass  # Not cached yet (or an unreadable entry), parse and store it
+
+    limit = load_limits(io.BytesIO(data))
+    _store_limits(entry_path, limit)
+    evict_cache(cache_dir, max_bytes)
+
+    return compile_limits(limit)
+
+
+def cached_unit_block(file_path, limits, match_description=False, cache_dir=DEFAULT_CACHE_DIR,
+                      max_bytes=DEFAULT_CACHE_BYTES, chunk_rows=None):
+    """
+    Read the aligned per-test statistics of one datalog through the on-disk cache.
+
+    The entry is keyed by the content of the file and the join keys of the limits
+    (see limits.alignment_key), so a rerun after some files were swapped or edited
+    only computes the statistics of those files: the (board, unit) blocks of all
+    the other files are loaded as they are, whatever the limit values.
+
+    Parameters:
+    - file_path: Path of the datalog CSV file.
+    - limits: LimitIndex returned by compile_limits.
+    - match_description: Join on the (test number, description) pair instead of the test number alone.
+    - cache_dir: Cache directory (created if needed).
+    - max_bytes: Maximum total size of the cache in bytes.
+    - chunk_rows: Compute the statistics of an uncached file chunk_rows tests at a time
+                  (see read_datalog_statistics) instead of through the parse cache.
+
+    Returns:
+    - UnitBlock: Same result as align.align_unit_block(limits, read_datalog(file_path)).
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    os.makedirs(cache_dir, exist_ok=True)
+    key = alignment_key(limits, match_description).encode()
+    entry_path = os.path.join(cache_dir, _content_key(key + data, BLOCK_CACHE_VERSION) + '.npz')
+
+    try:
+        block = _load_block(entry_path)
+        os.utime(entry_path)  # Mark the entry as recently used
+        return block
+    except (OSError, ValueError, KeyError):
+        pass  # Not cached yet (or an unreadable entry), compute and store it
+
+    if chunk_rows is None:
+        datalog = _parse_cached(data, cache_dir, max_bytes)
+    else:
+        datalog = read_datalog_statistics(file_path, chunk_rows)
+
+    block = align_unit_block(limits, datalog, match_description)
+    _store_block(entry_path, block)
+    evict_cache(cache_dir, max_bytes)
+
+    return block
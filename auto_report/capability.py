@@ -0,0 +1,82 @@
+import numpy as np  # For numerical operations
+import pandas as pd  # For categorical columns
+
+from .rounding import round_exact, CPK_DECIMALS
+
+# Capability labels; the integer code of a label is its position in this tuple
+CAPABILITY_LABELS = ("Good capable", "Not capable", "N/A")
+
+GOOD_CAPABLE = 0
+NOT_CAPABLE = 1
+NOT_AVAILABLE = 2
+
+# Cpk below which a test is not capable
+CPK_LIMIT = 1.3
+
+
+def capability_labels(codes):
+    """
+    Convert a 1D array of capability codes into a categorical column.
+
+    Parameters:
+    - codes: Integer array of codes (0 = "Good capable", 1 = "Not capable", 2 = "N/A").
+
+    Returns:
+    - pandas.Categorical: The capability labels with all three categories.
+    """
+    return pd.Categorical.from_codes(np.asarray(codes), categories=list(CAPABILITY_LABELS))
+
+
+def evaluate_capability(mean, sd, low_limit, high_limit):
+    """
+    Calculate Cp, Cpk and the capability status on whole arrays at once.
+
+    The test axis is the last axis of every input, so one call handles a single
+    board (shape (tests,)) or the RB and all NB together (shape (boards, tests)).
+
+    Parameters:
+    - mean: Mean per test.
+    - sd: Standard deviation per test.
+    - low_limit: Low limit per test (NaN for upper-only tests).
+    - high_limit: High limit per test (NaN for lower-only tests).
+
+    Returns:
+    - dict: Arrays broadcast to the common shape of the inputs:
+        - 'Cp': (High Limit - Low Limit) / (6 * SD) rounded to two decimal places,
+          NaN if the SD is zero or either limit is missing.
+        - 'Cpk': Distance from the mean to the nearest available limit divided by
+          3 * SD, rounded to two decimal places. NaN if the SD is zero or both
+          limits are missing.
+        - 'Cpk Result': Capability codes; "N/A" when Cpk cannot be calculated (no
+          limits, a zero SD or no mean and SD for the test),
+          "Not capable" when Cpk is below 1.3 and "Good capable" otherwise.
+    """
+    mean = np.asarray(mean, dtype=float)
+    sd = np.asarray(sd, dtype=float)
+    low_limit = np.asarray(low_limit, dtype=float)
+    high_limit = np.asarray(high_limit, dtype=float)
+
+    no_low = np.isnan(low_limit)
+    no_high = np.isnan(high_limit)
+    # A test missing from the datalogs of a board has no mean and SD, so no Cpk either
+    not_available = (no_low & no_high) | (sd == 0) | np.isnan(sd) | np.isnan(mean)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Cp needs both limits
+        cp = round_exact((high_limit - low_limit) / (6 * sd), CPK_DECIMALS)
+        cp = np.where(sd == 0, np.nan, cp)
+
+        # Cpk uses the nearest limit, or the only one for one-sided tests
+        upper = (high_limit - mean) / (3 * sd)
+        lower = (mean - low_limit) / (3 * sd)
+        cpk = np.where(no_low, upper, np.where(no_high, lower, np.minimum(upper, lower)))
+        cpk = round_exact(cpk, CPK_DECIMALS)
+        cpk = np.where(not_available, np.nan, cpk)
+
+    result = np.where(not_available, NOT_AVAILABLE, np.where(cpk < CPK_LIMIT, NOT_CAPABLE, GOOD_CAPABLE))
+
+    return {
+        'Cp': cp,
+        'Cpk': cpk,
+        'Cpk Result': result,
+    }
@@ -0,0 +1,422 @@
+"""
+Headless command line entry point of the Auto Correlation and Cpk Report Generator.
+
+Runs the same pipeline as Auto_Report_Gen-GUI.py without tkinter, prompts or
+sleeps. The inputs come from JSON job files, from command line options, or both
+(options override the job file):
+
+    python -m auto_report job1.json job2.json
+    python -m auto_report --test-card-name TC1 --part-name LTC4441 ... \\
+        --rb "data/QRB4441_U*.CSV" --nb "data/QNB1*_U*.CSV" --nb "data/QNB2*_U*.CSV" \\
+        --limit data/LTC4441_Ref_Lot_Limits.csv
+
+A job file looks like:
+
+    {
+        "product_info": {"Test Card Name": "...", "Part Name": "...", "Package": "...",
+                         "Lead Count": "...", "Description": "..."},
+        "setup_info": {"Tester ID": "...", "Reference Board": "...",
+                       "New Board ID": "...", "Test Program": "..."},
+        "rb": "QRB4441_U*.CSV",
+        "nb": ["QNB1*_U*.CSV", "QNB2*_U*.CSV"],
+        "limit": "LTC4441_Ref_Lot_Limits.csv",
+        "output_dir": "reports"
+    }
+
+"rb" and every "nb" entry are a glob pattern or a list of paths; relative paths
+are resolved from the job file's directory.
+
+A batch manifest runs many jobs at once on a process pool, one report per job,
+and writes a roll-up index (batch_index.csv) of their outcomes:
+
+    python -m auto_report --batch lot.json --processes 8
+
+    {
+        "output_dir": "reports",
+        "jobs": [
+            {"name": "TC1", "product_info": {...}, "setup_info": {...}, "rb": "...", "nb": [...], "limit": "..."},
+            "jobs/tc2.json"
+        ]
+    }
+
+Each job is a job dictionary or the path of a job file. "output_dir" is the
+default directory of the jobs' reports and the directory of the index.
+
+A watch folder generates the reports as the tester datalogs land, until stopped
+with Ctrl+C:
+
+    python -m auto_report --watch D:/drop template.json --boards 3 --units 4
+
+The datalogs of a part (QRB4441_U01.CSV, QNB14441_U01.CSV, ...) are queued as
+one job once every board has every unit and the files stopped changing (see
+auto_report/watch.py). The job file, if any, and the options give the rest of
+the job; '{part}' in its strings is replaced by the part number, and without a
+limit file the '*<part>*limit*.csv' file of the drop directory is used.
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import warnings
+
+# The pipeline (pandas, numpy, openpyxl) is only imported once the options are
+# parsed, so --help and option errors answer without loading it
+
+# Command line option name -> product/setup information key
+PRODUCT_FIELDS = {
+    'test_card_name': 'Test Card Name',
+    'part_name': 'Part Name',
+    'package': 'Package',
+    'lead_count': 'Lead Count',
+    'description': 'Description',
+}
+SETUP_FIELDS = {
+    'tester_id': 'Tester ID',
+    'reference_board': 'Reference Board',
+    'new_board_id': 'New Board ID',
+    'test_program': 'Test Program',
+}
+
+
+def natural_key(path):
+    """
+    Sort key that orders U2 before U10.
+    """
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', path)]
+
+
+def expand_files(pattern, base_dir):
+    """
+    Expand a glob pattern (or a list of paths/patterns) into a naturally sorted list of files.
+
+    Parameters:
+    - pattern: Glob pattern string or list of paths/patterns.
+    - base_dir: Directory relative paths are resolved from.
+
+    Returns:
+    - list: Matching file paths.
+    """
+    patterns = [pattern] if isinstance(pattern, str) else list(pattern)
+    files = []
+    for item in patterns:
+        item = os.path.join(base_dir, os.path.expanduser(item))
+        matches = glob.glob(item)
+        files.extend(sorted(matches, key=natural_key) if matches else [item])
+    return files
+
+
+def resolve_job(job, base_dir):
+    """
+    Validate a job and turn its patterns into the inputs of generate_report.
+
+    Parameters:
+    - job: Job dictionary (see the module docstring).
+    - base_dir: Directory relative paths are resolved from.
+
+    Returns:
+    - dict: Keyword arguments for generate_report.
+
+    Raises:
+    - ValueError: If a field is missing or the file counts do not match.
+    """
+    product_info = {key: str(job.get('product_info', {}).get(key, '')).strip() for key in PRODUCT_FIELDS.values()}
+    setup_info = {key: str(job.get('setup_info', {}).get(key, '')).strip() for key in SETUP_FIELDS.values()}
+    for key, value in {**product_info, **setup_info}.items():
+        if not value:
+            raise ValueError(f"{key} cannot be empty")
+
+    if not job.get('rb') or not job.get('nb') or not job.get('limit'):
+        raise ValueError("RB files, NB files and the limit file are required")
+
+    rb_file = expand_files(job['rb'], base_dir)
+    nb_file = [expand_files(pattern, base_dir) for pattern in job['nb']]
+    num_units = len(rb_file)
+    for i, files in enumerate(nb_file):
+        if len(files) != num_units:
+            raise ValueError(f"NB{i + 1} needs {num_units} files, got {len(files)}")
+
+    return {
+        'product_info': product_info,
+        'setup_info': setup_info,
+        'nb_file': nb_file,
+        'rb_file': rb_file,
+        'limit_file': os.path.join(base_dir, os.path.expanduser(job['limit'])),
+        'output_dir': os.path.join(base_dir, os.path.expanduser(job.get('output_dir', '.'))),
+    }
+
+
+def positive_int(value):
+    """
+    argparse type of the counts and sizes: an integer of at least 1.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m auto_report',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('jobs', nargs='*', metavar='JOB', help='JSON job file(s), run one after the other')
+
+    for dest, key in {**PRODUCT_FIELDS, **SETUP_FIELDS}.items():
+        parser.add_argument('--' + dest.replace('_', '-'), dest=dest, help=key)
+
+    parser.add_argument('--rb', help='Glob pattern of the RB files, one per unit')
+    parser.add_argument('--nb', action='append', help='Glob pattern of the files of one NB (repeat per board)')
+    parser.add_argument('--limit', help='Limit CSV file')
+    parser.add_argument('--output-dir', help='Directory for the report (default: current directory)')
+    parser.add_argument('--workers', type=positive_int, default=None, help='Number of file reading threads')
+    parser.add_argument('--cache-dir', help='Parse cache directory (default: ~/.auto_report_cache)')
+    parser.add_argument('--no-cache', action='store_true', help='Always parse the datalogs')
+    parser.add_argument('--layout', choices=['wide', 'long'], default=None,
+                        help='Report layout (default: wide up to 9 boards and 9 units, long beyond)')
+    parser.add_argument('--streaming', action='store_true',
+                        help='Write the workbook row by row with a flat memory footprint (for very large reports)')
+    parser.add_argument('--export', choices=['parquet', 'arrow'], default=None,
+                        help='Also export the tables as Parquet or Arrow IPC datasets (needs pyarrow)')
+    parser.add_argument('--export-dir', default=None,
+                        help='Directory of the exported datasets (default: <output dir>/columnar)')
+    parser.add_argument('--no-excel', action='store_true', help='Skip the Excel workbook (with --export)')
+    parser.add_argument('--chunk-rows', type=positive_int, default=None, metavar='N',
+                        help='Read only the per-test statistics of the datalogs, N tests at a time '
+                             '(for datalogs with thousands of devices per unit)')
+    parser.add_argument('--match-description', action='store_true',
+                        help="Join the datalog tests to the limits on 'Test #' and 'Description'")
+    parser.add_argument('--no-profile', action='store_true',
+                        help='Do not write the <Test Card Name>_Profile_<date>.json stage profile next to the report')
+    parser.add_argument('--cprofile', action='store_true',
+                        help='Also dump a cProfile of the run to <Test Card Name>_Profile_<date>.prof')
+    parser.add_argument('--batch', metavar='MANIFEST', help='Run the jobs of a batch manifest on a process pool')
+    parser.add_argument('--processes', type=positive_int, default=None,
+                        help='Number of batch worker processes (default: one per CPU)')
+    parser.add_argument('--index', default=None,
+                        help='Roll-up index of the batch (default: batch_index.csv in the manifest output directory) '
+                             'or of the watch folder (default: watch_index.csv in its output directory)')
+    parser.add_argument('--watch', metavar='DIR', help='Generate the reports of the datalog sets landing in DIR')
+    parser.add_argument('--boards', type=positive_int, default=None,
+                        help='Number of NB boards of a complete watch folder set (default: any)')
+    parser.add_argument('--units', type=positive_int, default=None,
+                        help='Number of units of a complete watch folder set (default: any)')
+    parser.add_argument('--settle', type=float, default=30.0, metavar='SECONDS',
+                        help='Seconds the files of a watch folder set must stay unchanged before it is queued')
+    parser.add_argument('--poll', type=float, default=5.0, metavar='SECONDS',
+                        help='Watch folder scan interval where inotify is not available')
+    parser.add_argument('--once', action='store_true',
+                        help='Report the complete watch folder sets and exit instead of watching')
+    return parser
+
+
+def merge_options(job, args):
+    """
+    Return a copy of the job with the command line options applied on top of it.
+    """
+    job = dict(job)
+    job['product_info'] = dict(job.get('product_info', {}))
+    job['setup_info'] = dict(job.get('setup_info', {}))
+
+    for dest, key in PRODUCT_FIELDS.items():
+        if getattr(args, dest) is not None:
+            job['product_info'][key] = getattr(args, dest)
+    for dest, key in SETUP_FIELDS.items():
+        if getattr(args, dest) is not None:
+            job['setup_info'][key] = getattr(args, dest)
+
+    for option in ('rb', 'nb', 'limit', 'output_dir'):
+        if getattr(args, option) is not None:
+            job[option] = getattr(args, option)
+
+    return job
+
+
+def cache_directory(args):
+    """
+    Return the parse cache directory of the options, None with --no-cache.
+    """
+    if args.no_cache:
+        return None
+    if args.cache_dir is not None:
+        return args.cache_dir
+
+    from .cache import DEFAULT_CACHE_DIR
+    return DEFAULT_CACHE_DIR
+
+
+def load_manifest(manifest_path, args):
+    """
+    Read a batch manifest and resolve its jobs.
+
+    Parameters:
+    - manifest_path: Path of the manifest (see the module docstring).
+    - args: Parsed command line options, applied on top of every job.
+
+    Returns:
+    - tuple: A tuple containing:
+        - list: (name, generate_report inputs) of every valid job.
+        - list: (position, BatchResult) of every job that could not be resolved.
+        - str: Output directory of the manifest.
+    """
+    from .batch import failed_result
+
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    if isinstance(manifest, list):
+        manifest = {'jobs': manifest}
+
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_path))
+    output_dir = os.path.join(manifest_dir, os.path.expanduser(manifest.get('output_dir', '.')))
+
+    jobs = []
+    failures = []
+    for position, entry in enumerate(manifest.get('jobs', [])):
+        name = entry if isinstance(entry, str) else entry.get('name', f'job{position + 1}')
+        job = {}
+        try:
+            if isinstance(entry, str):
+                # Job file: relative paths are resolved from its own directory
+                job_path = os.path.join(manifest_dir, entry)
+                with open(job_path) as f:
+                    job = json.load(f)
+                base_dir = os.path.dirname(os.path.abspath(job_path))
+            else:
+                job, base_dir = entry, manifest_dir
+            job = merge_options(job, args)
+            job.setdefault('output_dir', output_dir)
+            inputs = resolve_job(job, base_dir)
+        except Exception as e:
+            failures.append((position, failed_result(name, job, e)))
+            continue
+        jobs.append((name, inputs))
+
+    return jobs, failures, output_dir
+
+
+def run_manifest(args):
+    """
+    Run the jobs of the --batch manifest, write the roll-up index and return the process exit code.
+    """
+    from .batch import run_batch, write_batch_index
+
+    jobs, failures, output_dir = load_manifest(args.batch, args)
+    for _, result in failures:
+        print(f"[{result.name}] Job failed: {result.error}", file=sys.stderr)
+
+    results = run_batch(jobs, max_workers=args.processes, read_workers=args.workers,
+                        cache_dir=cache_directory(args), layout=args.layout,
+                        streaming=args.streaming, export_format=args.export, export_dir=args.export_dir,
+                        excel=not args.no_excel, match_description=args.match_description,
+                        chunk_rows=args.chunk_rows, profile=not args.no_profile, cprofile=args.cprofile)
+
+    # Put the jobs that could not be resolved back at their place in the manifest
+    for position, result in failures:
+        results.insert(position, result)
+
+    index_file = args.index or os.path.join(output_dir, 'batch_index.csv')
+    os.makedirs(os.path.dirname(os.path.abspath(index_file)), exist_ok=True)
+    write_batch_index(results, index_file)
+
+    failed = sum(result.status != 'ok' for result in results)
+    print(f"{len(results) - failed} of {len(results)} jobs succeeded, index written to '{index_file}'")
+    return 1 if failed else 0
+
+
+def run_watch(args):
+    """
+    Watch the --watch directory until interrupted (or, with --once, until its sets are reported) and
+    return the process exit code.
+    """
+    from .watch import watch_folder
+
+    if len(args.jobs) > 1:
+        print("--watch takes at most one job file, the template of the jobs", file=sys.stderr)
+        return 2
+
+    base_dir = os.getcwd()
+    template = {}
+    if args.jobs:
+        with open(args.jobs[0]) as f:
+            template = json.load(f)
+        base_dir = os.path.dirname(os.path.abspath(args.jobs[0]))
+    template = merge_options(template, args)
+
+    missing = [key for field, keys in (('product_info', PRODUCT_FIELDS), ('setup_info', SETUP_FIELDS))
+               for key in keys.values() if not str(template[field].get(key, '')).strip()]
+    if missing:
+        print(f"The job file or options must give {', '.join(missing)}", file=sys.stderr)
+        return 2
+
+    # The limit file and the output directory are relative to the job file, the datalogs are in the drop directory
+    if template.get('limit'):
+        template['limit'] = os.path.join(base_dir, os.path.expanduser(template['limit']))
+    output_dir = os.path.join(base_dir, os.path.expanduser(template.get('output_dir', 'reports')))
+
+    try:
+        results = watch_folder(args.watch, template, output_dir, index_file=args.index, boards=args.boards,
+                               units=args.units, settle=args.settle, poll=args.poll, max_workers=args.processes,
+                               once=args.once, cache_dir=cache_directory(args), layout=args.layout,
+                               streaming=args.streaming, export_format=args.export, export_dir=args.export_dir,
+                               excel=not args.no_excel, match_description=args.match_description,
+                               chunk_rows=args.chunk_rows, profile=not args.no_profile, cprofile=args.cprofile)
+    except KeyboardInterrupt:
+        print("Stopped watching")
+        return 0
+
+    return 1 if any(result.status != 'ok' for result in results) else 0
+
+
+def main(argv=None):
+    """
+    Run every job given on the command line and return the process exit code.
+
+    A failing job is reported and the remaining jobs still run; the exit code is
+    1 if any job failed and 0 otherwise.
+    """
+    args = build_parser().parse_args(argv)
+
+    # Ignore warnings to keep output clean
+    warnings.filterwarnings('ignore')
+
+    if args.batch:
+        return run_manifest(args)
+    if args.watch:
+        return run_watch(args)
+
+    from .pipeline import generate_report
+
+    # Job files, read one at a time so that one unreadable file only fails its own job;
+    # without job files the options form a single job (None)
+    job_paths = args.jobs or [None]
+
+    cache_dir = cache_directory(args)
+    failed = 0
+
+    for job_path in job_paths:
+        try:
+            if job_path is None:
+                job, base_dir = {}, os.getcwd()
+            else:
+                with open(job_path) as f:
+                    job = json.load(f)
+                base_dir = os.path.dirname(os.path.abspath(job_path))
+            inputs = resolve_job(merge_options(job, args), base_dir)
+            os.makedirs(inputs['output_dir'], exist_ok=True)
+            output_file = generate_report(**inputs, cache_dir=cache_dir, max_workers=args.workers,
+                                          layout=args.layout, streaming=args.streaming,
+                                          export_format=args.export, export_dir=args.export_dir,
+                                          excel=not args.no_excel, match_description=args.match_description,
+                                          chunk_rows=args.chunk_rows, profile=not args.no_profile,
+                                          cprofile=args.cprofile)
+        except Exception as e:
+            failed += 1
+            print(f"Job failed: {e}" if job_path is None else f"Job '{job_path}' failed: {e}", file=sys.stderr)
+            continue
+        print(f"Report has been written to '{output_file}'")
+
+    return 1 if failed else 0
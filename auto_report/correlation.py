@@ -0,0 +1,140 @@
+import numpy as np  # For numerical operations
+
+from .rounding import round_decimal, DELTA_MEAN_DECIMALS, MEAN_SHIFT_DECIMALS, SD_RATIO_DECIMALS
+
+# Status labels used by the correlation criteria, ordered by severity.
+# The integer code of a label is its position in this tuple, so the worst of
+# two statuses is simply the larger of their codes.
+STATUS_LABELS = ("Passed", "For check", "Failed")
+
+PASSED = 0
+FOR_CHECK = 1
+FAILED = 2
+
+# Mean shift (in % of the limit window) above which a test fails
+MEAN_SHIFT_LIMIT = 5
+
+# NB/RB standard deviation ratio above which a test needs checking
+SD_RATIO_LIMIT = 1.5
+
+
+def status_labels(codes):
+    """
+    Convert an array of status codes into an array of status strings.
+
+    Parameters:
+    - codes: Integer array of codes (0 = "Passed", 1 = "For check", 2 = "Failed").
+
+    Returns:
+    - numpy.ndarray: Object array of the same shape holding the status strings.
+    """
+    return np.asarray(STATUS_LABELS, dtype=object)[codes]
+
+
+def board_result_codes(result):
+    """
+    Return the overall result of every NB and test: "Passed" when every unit passed, "For check" otherwise.
+
+    Parameters:
+    - result: 'Result' status codes returned by evaluate_correlation, shape (boards, units, tests).
+
+    Returns:
+    - numpy.ndarray: Status codes of shape (boards, tests).
+    """
+    return np.where(np.all(np.asarray(result) == PASSED, axis=1), PASSED, FOR_CHECK)
+
+
+def status_tally(codes):
+    """
+    Count the "Passed", "For check" and "Failed" tests of every row of a status code
+    array in one bincount pass, instead of one string scan per status and column.
+
+    Parameters:
+    - codes: Integer array of status codes with the tests on the last axis, e.g. shape (boards, units, tests).
+
+    Returns:
+    - numpy.ndarray: Counts with the test axis replaced by one entry per status, e.g. shape
+      (boards, units, 3); [..., code] is the number of tests with that status.
+    """
+    codes = np.asarray(codes)
+    rows = codes.shape[:-1]
+    num_rows = int(np.prod(rows))
+    num_labels = len(STATUS_LABELS)
+
+    # Give every row its own range of bins
+    offsets = np.arange(num_rows).reshape(rows + (1,)) * num_labels
+    counts = np.bincount((codes + offsets).ravel(), minlength=num_rows * num_labels)
+
+    return counts.reshape(rows + (num_labels,))
+
+
+def evaluate_correlation(rb_mean, rb_sd, nb_mean, nb_sd, low_limit, high_limit, sd_lot):
+    """
+    Evaluate the RB vs NB correlation criteria on whole arrays at once.
+
+    This function replaces the row-wise mean shift, mean shift criteria, SD ratio,
+    SD ratio criteria and unit status evaluations with NumPy operations. The test
+    axis is the last axis of every input, so the limit arrays (one value per test)
+    broadcast against statistics of shape (tests,), (units, tests) or
+    (boards, units, tests).
+
+    Parameters:
+    - rb_mean: Mean of the reference board (RB) per test.
+    - rb_sd: Standard deviation of the reference board (RB) per test.
+    - nb_mean: Mean of the new board(s) (NB) per test.
+    - nb_sd: Standard deviation of the new board(s) (NB) per test.
+    - low_limit: Low limit per test (NaN when the test has no low limit).
+    - high_limit: High limit per test (NaN when the test has no high limit).
+    - sd_lot: Reference lot standard deviation per test.
+
+    Returns:
+    - dict: Arrays broadcast to the common shape of the inputs:
+        - 'Delta Mean': |NB mean - RB mean| rounded to six decimal places.
+        - 'Mean Shift': Delta Mean / (High Limit - Low Limit) * 100 rounded to five
+          decimal places, NaN if either limit is missing and 0 if Delta Mean is 0.
+        - 'Mean Shift Criteria': Status codes of the mean shift criteria.
+        - 'SD Ratio': NB SD / RB SD rounded to six decimal places, 0 if either SD is 0.
+        - 'SD Ratio Criteria': Status codes of the SD ratio criteria.
+        - 'Result': Status codes of the overall unit result.
+    """
+    rb_mean = np.asarray(rb_mean, dtype=float)
+    rb_sd = np.asarray(rb_sd, dtype=float)
+    nb_mean = np.asarray(nb_mean, dtype=float)
+    nb_sd = np.asarray(nb_sd, dtype=float)
+    low_limit = np.asarray(low_limit, dtype=float)
+    high_limit = np.asarray(high_limit, dtype=float)
+    sd_lot = np.asarray(sd_lot, dtype=float)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Absolute difference between the NB and RB means
+        delta_mean = round_decimal(np.abs(nb_mean - rb_mean), DELTA_MEAN_DECIMALS)
+
+        # Mean shift as a percentage of the limit window
+        mean_shift = round_decimal(delta_mean / (high_limit - low_limit) * 100, MEAN_SHIFT_DECIMALS)
+        mean_shift = np.where(delta_mean == 0, 0.0, mean_shift)
+        mean_shift = np.where(np.isnan(low_limit) | np.isnan(high_limit), np.nan, mean_shift)
+
+        # Without a full limit window, the delta mean is compared with the lot SD instead
+        mean_shift_crit = np.where(
+            np.isnan(mean_shift),
+            np.where(delta_mean <= sd_lot, PASSED, FOR_CHECK),
+            np.where(mean_shift <= MEAN_SHIFT_LIMIT, PASSED, FAILED),
+        )
+
+        # Ratio of the NB and RB standard deviations
+        sd_ratio = round_decimal(nb_sd / rb_sd, SD_RATIO_DECIMALS)
+        sd_ratio = np.where((rb_sd == 0) | (nb_sd == 0), 0.0, sd_ratio)
+
+        sd_ratio_crit = np.where(sd_ratio <= SD_RATIO_LIMIT, PASSED, FOR_CHECK)
+
+    # The unit result is the worst of both criteria
+    result = np.maximum(mean_shift_crit, sd_ratio_crit)
+
+    return {
+        'Delta Mean': delta_mean,
+        'Mean Shift': mean_shift,
+        'Mean Shift Criteria': mean_shift_crit,
+        'SD Ratio': sd_ratio,
+        'SD Ratio Criteria': sd_ratio_crit,
+        'Result': result,
+    }
@@ -0,0 +1,153 @@
+import csv  # For the header of chunked datalogs
+import io  # For parsing chunks with pandas
+import itertools  # For reading chunks of lines
+from collections import namedtuple
+
+import numpy as np  # For numerical operations
+import pandas as pd  # For CSV parsing
+
+from .stats import SummaryStats, summary_statistics
+
+# Non-device columns of a tester datalog ("Test #, Description, Device #1..N, Units")
+DESCRIPTION_COLUMN = 'Description'
+UNITS_COLUMN = 'Units'
+
+# A parsed datalog:
+# - test_numbers: Array of the 'Test #' strings, one per test.
+# - descriptions: Array of the test descriptions, one per test.
+# - units: Array of the measurement units, one per test.
+# - values: float64 array of shape (tests, devices).
+Datalog = namedtuple('Datalog', ['test_numbers', 'descriptions', 'units', 'values'])
+
+# The per-test statistics of a datalog, read without keeping its values:
+# - test_numbers, descriptions, units: As in Datalog.
+# - statistics: SummaryStats of the devices of every test, arrays of shape (tests,).
+DatalogStatistics = namedtuple('DatalogStatistics', ['test_numbers', 'descriptions', 'units', 'statistics'])
+
+# Number of test rows parsed at a time by read_datalog_statistics
+DEFAULT_CHUNK_ROWS = 64
+
+
+def read_datalog(file_path):
+    """
+    Read a tester datalog CSV straight into a (test, device) float array.
+
+    The file is parsed once by the C CSV engine and the device columns are taken
+    out as one float64 array, without the object-dtype transpose of the whole
+    table. Rows with more than one missing cell (the datalog footer) are dropped,
+    as before.
+
+    Parameters:
+    - file_path: Path of the datalog CSV file.
+
+    Returns:
+    - Datalog: Test numbers, descriptions, units and the (test, device) values.
+    """
+    # Letting the parser infer the numeric columns is faster than passing dtype=; only the
+    # test numbers are kept as text, as written ('3.10' is not '3.1')
+    return _datalog_from_frame(pd.read_csv(file_path, engine='c', low_memory=False, dtype={0: str}))
+
+
+def _datalog_from_frame(df):
+    """
+    Build a Datalog from the parsed CSV table, dropping the footer rows.
+    """
+    # Remove rows with too many NaNs
+    df = df[df.notna().sum(axis=1).to_numpy() >= df.shape[1] - 1]
+
+    test_column = df.columns[0]
+    device_columns = [col for col in df.columns[1:] if col not in (DESCRIPTION_COLUMN, UNITS_COLUMN)]
+
+    return Datalog(
+        test_numbers=df[test_column].astype(str).to_numpy(),
+        descriptions=df[DESCRIPTION_COLUMN].to_numpy(dtype=object),
+        units=df[UNITS_COLUMN].to_numpy(dtype=object) if UNITS_COLUMN in df else np.full(len(df), None),
+        values=df[device_columns].to_numpy(dtype=np.float64),
+    )
+
+
+def _parse_chunk(header, lines, device_positions, text_positions):
+    """
+    Parse a chunk of datalog rows into their test numbers, descriptions, units and (test, device) values.
+    """
+    try:
+        # Fast path: rows with every cell filled are parsed by numpy without building a DataFrame
+        values = np.loadtxt(lines, delimiter=',', quotechar='"', usecols=device_positions, ndmin=2)
+        text = np.loadtxt(lines, delimiter=',', quotechar='"', usecols=text_positions, dtype=str, ndmin=2)
+        units = text[:, 2].astype(object) if len(text_positions) > 2 else np.full(len(lines), None)
+        return text[:, 0].astype(object), text[:, 1].astype(object), units, values
+    except ValueError:
+        pass  # Missing cells or the footer: parse the chunk like read_datalog
+
+    # The test numbers are kept as text, as they are in a whole file with its footer
+    columns = next(csv.reader([header]))
+    df = pd.read_csv(io.StringIO(header + ''.join(lines)), engine='c', dtype={columns[0]: str})
+    datalog = _datalog_from_frame(df)
+    return datalog.test_numbers, datalog.descriptions, datalog.units, datalog.values
+
+
+def read_datalog_statistics(file_path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Read the per-test count, mean and sum of squared deviations of a datalog in one
+    pass, without holding its whole (test, device) matrix.
+
+    A datalog has one row per test and one column per device, so the file is parsed
+    chunk_rows tests at a time: each chunk holds every device of its tests, is
+    reduced to its SummaryStats and dropped. Memory is bounded by chunk_rows times
+    the number of devices, whatever the number of tests. The values, the dropped
+    footer rows and therefore the statistics are the same as with read_datalog.
+
+    Parameters:
+    - file_path: Path of the datalog CSV file.
+    - chunk_rows: Number of test rows parsed at a time.
+
+    Returns:
+    - DatalogStatistics: Test numbers, descriptions, units and the per-test statistics.
+
+    Raises:
+    - ValueError: If chunk_rows is not a positive number of rows.
+    """
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be a positive number of rows, got {chunk_rows}")
+
+    test_numbers, descriptions, units, parts = [], [], [], []
+
+    with open(file_path) as f:
+        rows = (line for line in f if line.strip())  # Blank lines are skipped, as by pandas
+        header = next(rows)
+
+        columns = next(csv.reader([header]))
+        device_positions = [j for j, name in enumerate(columns[1:], start=1)
+                            if name not in (DESCRIPTION_COLUMN, UNITS_COLUMN)]
+        text_positions = [0, columns.index(DESCRIPTION_COLUMN)]
+        if UNITS_COLUMN in columns:
+            text_positions.append(columns.index(UNITS_COLUMN))
+
+        # Lines with fewer fields than the header has columns minus one (the footer) have more
+        # than one missing cell, so read_datalog drops them; a quoted comma only makes a line look longer
+        min_commas = len(columns) - 2
+        rows = (line for line in rows if line.count(',') >= min_commas)
+
+        while True:
+            lines = list(itertools.islice(rows, chunk_rows))
+            if not lines:
+                break
+
+            chunk = _parse_chunk(header, lines, device_positions, text_positions)
+            test_numbers.append(chunk[0])
+            descriptions.append(chunk[1])
+            units.append(chunk[2])
+            # Reduce a (device, test) copy, so the devices are summed one after the other as in the
+            # (board, unit, device, test) tensor and the rounded statistics are the same. numpy would
+            # sum the devices of a single test pairwise, so a lone test gets a spare NaN column.
+            num_tests = len(chunk[3])
+            block = np.full((chunk[3].shape[1], max(num_tests, 2)), np.nan)
+            block[:, :num_tests] = chunk[3].T
+            parts.append(SummaryStats(*(part[:num_tests] for part in summary_statistics(block, axis=0))))
+
+    return DatalogStatistics(
+        test_numbers=np.concatenate(test_numbers),
+        descriptions=np.concatenate(descriptions),
+        units=np.concatenate(units),
+        statistics=SummaryStats(*(np.concatenate([part[k] for part in parts]) for k in range(len(SummaryStats._fields)))),
+    )
@@ -0,0 +1,121 @@
+"""
+Columnar export of the report tables (Parquet or Arrow IPC) for dashboards.
+
+Needs the optional pyarrow package (pip install pyarrow); the rest of auto_report
+works without it.
+"""
+
+import os  # For output paths
+from datetime import datetime  # For the date partition
+
+import numpy as np  # For numerical operations
+
+from .tables import correlation_long_table, cpk_long_table, unit_statistics_table
+
+# Columns the datasets are partitioned by, as <column>=<value> directories
+PARTITION_COLUMNS = ['test_card', 'board', 'date']
+
+# File extension of every export format
+EXPORT_FORMATS = {'parquet': 'parquet', 'arrow': 'arrow'}
+
+
+def _clean_columns(df):
+    """
+    Strip the stray spaces of column names (' Test #' in the limit files).
+    """
+    return df.rename(columns=lambda name: str(name).strip())
+
+
+def summary_table(summary):
+    """
+    Turn the 'Correlation Summary' sheet back into one typed row per board.
+
+    Parameters:
+    - summary: Summary table returned by build_summary.
+
+    Returns:
+    - pandas.DataFrame: 'Board', the integer test counts and 'Remarks'.
+    """
+    table = summary.set_index('Test Card').T.reset_index(drop=True)
+    table.columns.name = None
+    for column in table.columns:
+        if column != 'Remarks':
+            table[column] = table[column].astype(np.int64)
+    table.insert(0, 'Board', [f'NB{i+1}' for i in range(len(table))])
+    return table
+
+
+def export_tables(product_info, limit, correlation, cpk, summary, export_dir, export_format='parquet',
+                  report_date=None):
+    """
+    Write the report tables as columnar datasets, partitioned by test card, board and date.
+
+    Four datasets are written under export_dir, each a directory tree such as
+    correlation/test_card=TC1/board=NB1/date=2025-01-31/part-0.parquet:
+    - correlation: The correlation results, one row per board, unit and test.
+    - cpk: The Cp/Cpk results, one row per board (RB included) and test.
+    - summary: The correlation summary, one row per board.
+    - unit_stats: The mean and SD of every board, unit and test.
+    Statuses are stored as dictionary-encoded (categorical) columns. Writing the
+    same test card, board and date again replaces the files of that partition.
+
+    Parameters:
+    - product_info: Dictionary of the product information.
+    - limit: Limits returned by load_limits.
+    - correlation: CorrelationResult returned by compute_correlation.
+    - cpk: CpkResult returned by compute_cpk.
+    - summary: Summary table returned by build_summary.
+    - export_dir: Directory of the datasets (created if needed).
+    - export_format: 'parquet' or 'arrow' (Arrow IPC).
+    - report_date: Date of the partition (default: today).
+
+    Returns:
+    - dict: Dataset name -> directory written.
+
+    Raises:
+    - ImportError: If pyarrow is not installed.
+    - ValueError: If the format is unknown.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {export_format}")
+
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError as e:
+        raise ImportError("The Parquet/Arrow export needs pyarrow (pip install pyarrow)") from e
+
+    report_date = (report_date or datetime.now()).strftime("%Y-%m-%d")
+
+    tables = {
+        'correlation': _clean_columns(correlation_long_table(limit, correlation)),
+        'cpk': _clean_columns(cpk_long_table(limit, cpk)),
+        'summary': summary_table(summary),
+        'unit_stats': unit_statistics_table(limit, correlation),
+    }
+
+    # zstd-compressed files; the pandas schema metadata is left out as the column
+    # types (dictionary columns included) already round-trip without it
+    file_format = ds.IpcFileFormat() if export_format == 'arrow' else ds.ParquetFileFormat()
+    file_options = file_format.make_write_options(compression='zstd')
+
+    written = {}
+    for name, df in tables.items():
+        df = df.rename(columns={'Board': 'board'})
+        df.insert(0, 'test_card', product_info['Test Card Name'])
+        df['date'] = report_date
+
+        dataset_dir = os.path.join(export_dir, name)
+        ds.write_dataset(
+            pa.Table.from_pandas(df, preserve_index=False).replace_schema_metadata(None),
+            dataset_dir,
+            format=file_format,
+            file_options=file_options,
+            partitioning=PARTITION_COLUMNS,
+            partitioning_flavor='hive',
+            basename_template='part-{i}.' + EXPORT_FORMATS[export_format],
+            existing_data_behavior='delete_matching',
+        )
+        written[name] = dataset_dir
+
+    return written
@@ -0,0 +1,70 @@
+"""
+Dependency tracking for reruns: every (board, unit) statistics block and every per-board
+correlation and Cpk table is kept in a memo with the key of its inputs, and recomputed
+only when that key changes.
+
+A memo is a plain dict kept by the caller between runs (e.g. a watch loop or a GUI
+session) and passed to generate_report. Each slot holds the last value only, so reruns
+of the same files do not grow the memo; every new datalog path adds a slot, though, so a
+caller that sees many different files has to bound its memos (see watch).
+"""
+
+import hashlib  # For the input keys
+import os  # For file fingerprints
+
+import numpy as np  # For array keys
+import pandas as pd  # For table keys
+
+
+def file_fingerprint(file_path):
+    """
+    Return the (absolute path, size, modification time) of a file, which changes whenever the file is replaced or edited.
+    """
+    stat = os.stat(file_path)
+    return os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns
+
+
+def array_key(*arrays):
+    """
+    Return a digest of the shapes and values of arrays.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array, dtype=float)
+        digest.update(repr(array.shape).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def table_key(df):
+    """
+    Return a digest of the column names, index and values of a DataFrame.
+    """
+    digest = hashlib.blake2b(repr(list(df.columns)).encode(), digest_size=16)
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def memoized(memo, slot, inputs, compute):
+    """
+    Return the value of a memo slot, calling compute only when the slot is empty or was filled from other inputs.
+
+    Parameters:
+    - memo: Memo dict, or None to always compute.
+    - slot: Key of the value in the memo (e.g. ('correlation', board)).
+    - inputs: Hashable key of everything the value depends on.
+    - compute: Function without arguments returning the value.
+
+    Returns:
+    - The value, computed now or in an earlier run from the same inputs.
+    """
+    if memo is None:
+        return compute()
+
+    entry = memo.get(slot)
+    if entry is not None and entry[0] == inputs:
+        return entry[1]
+
+    value = compute()
+    memo[slot] = (inputs, value)
+    return value
@@ -0,0 +1,165 @@
+import time  # For per-file timing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .align import align_unit_block
+from .cache import DEFAULT_CACHE_BYTES, cached_read_datalog, cached_unit_block
+from .datalog import read_datalog, read_datalog_statistics
+from .incremental import file_fingerprint, memoized
+from .limits import alignment_key
+
+
+def _timed_read(file_path, cache_dir, cache_bytes, chunk_rows=None):
+    """
+    Read one datalog (or only its per-test statistics, in chunks), through the
+    parse cache if one is given, and measure the wall-clock time it took.
+    """
+    start = time.perf_counter()
+    if chunk_rows is not None:
+        datalog = read_datalog_statistics(file_path, chunk_rows)
+    elif cache_dir is None:
+        datalog = read_datalog(file_path)
+    else:
+        datalog = cached_read_datalog(file_path, cache_dir, cache_bytes)
+    return datalog, time.perf_counter() - start
+
+
+def _timed_block(file_path, limits, match_description, cache_dir, cache_bytes, chunk_rows, memo):
+    """
+    Return the UnitBlock of one datalog and the wall-clock time it took: from the memo
+    when the file and the limit keys are unchanged since the last run, else from the
+    block cache (or computed).
+    """
+    start = time.perf_counter()
+    inputs = (file_fingerprint(file_path), alignment_key(limits, match_description))
+
+    def compute():
+        if cache_dir is not None:
+            return cached_unit_block(file_path, limits, match_description, cache_dir, cache_bytes, chunk_rows)
+        if chunk_rows is not None:
+            return align_unit_block(limits, read_datalog_statistics(file_path, chunk_rows), match_description)
+        return align_unit_block(limits, read_datalog(file_path), match_description)
+
+    block = memoized(memo, ('unit', inputs[0][0]), inputs, compute)
+    return block, time.perf_counter() - start
+
+
+def _read_files(executor, rb_files, nb_files, read_file, *args):
+    """
+    Run read_file(path, *args) for every RB and NB file on an executor and collect
+    the results in the order of the inputs.
+
+    Returns:
+    - tuple: The results of the RB files, one list of results per board and the
+      wall-clock time in seconds of every file, keyed by path.
+
+    Raises:
+    - ValueError: If files could not be read, naming every one of them.
+    """
+    # (board, path) of every file; board is None for the RB
+    jobs = [(None, path) for path in rb_files]
+    jobs += [(i, path) for i, board_files in enumerate(nb_files) for path in board_files]
+
+    futures = [executor.submit(read_file, path, *args) for _, path in jobs]
+
+    rb = []
+    nb = [[] for _ in nb_files]
+    read_times = {}
+    errors = []
+
+    for (board, file_path), future in zip(jobs, futures):
+        try:
+            result, seconds = future.result()
+        except FileNotFoundError:
+            errors.append(f"File not found: {file_path}")  # Handle the case where the file is not found
+            continue
+        except Exception as e:
+            errors.append(f"An error occurred while reading {file_path}: {e}")  # Handle any other exceptions
+            continue
+
+        read_times[file_path] = seconds
+        if board is None:
+            rb.append(result)
+        else:
+            nb[board].append(result)
+
+    # A missing unit would only surface later as a unit or test count mismatch, so name the files now
+    if errors:
+        raise ValueError(f"{len(errors)} of {len(jobs)} datalog files could not be read:\n" + '\n'.join(errors))
+
+    return rb, nb, read_times
+
+
+def read_datalogs(rb_files, nb_files, max_workers=None, use_processes=False,
+                  cache_dir=None, cache_bytes=DEFAULT_CACHE_BYTES, chunk_rows=None):
+    """
+    Read the RB and NB datalogs concurrently on a worker pool.
+
+    Every file is submitted to the pool at once and the results are collected in
+    the order of the inputs, so the RB unit order and the (board, unit) layout of
+    the NB files are kept. Every file is read before the files that could not be
+    read are reported together.
+
+    Threads are the default: parsing releases the GIL for most of its time and
+    the files usually sit on network shares. Processes can be used for very large
+    files, but only from a script whose pipeline is guarded by
+    `if __name__ == '__main__'`.
+
+    Parameters:
+    - rb_files: List of RB datalog paths, one per unit.
+    - nb_files: List (one entry per board) of lists of NB datalog paths, one per unit.
+    - max_workers: Number of workers (None for the executor's default).
+    - use_processes: Use a process pool instead of a thread pool.
+    - cache_dir: Directory of the parse cache, or None to always parse the files.
+    - cache_bytes: Size cap of the parse cache in bytes.
+    - chunk_rows: Read only the per-test statistics of the files, chunk_rows tests at a
+                  time (see read_datalog_statistics), instead of their values. The parse
+                  cache is not used then.
+
+    Returns:
+    - tuple: A tuple containing:
+        - list: RB datalogs (DatalogStatistics with chunk_rows), one per unit.
+        - list: NB datalogs, one list per board with one datalog per unit.
+        - dict: Wall-clock read time in seconds of every file, keyed by path.
+
+    Raises:
+    - ValueError: If files could not be read, naming every one of them.
+    """
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+
+    with executor_class(max_workers=max_workers) as executor:
+        return _read_files(executor, rb_files, nb_files, _timed_read, cache_dir, cache_bytes, chunk_rows)
+
+
+def read_unit_blocks(rb_files, nb_files, limits, match_description=False, max_workers=None,
+                     cache_dir=None, cache_bytes=DEFAULT_CACHE_BYTES, chunk_rows=None, memo=None):
+    """
+    Read the aligned statistics of the RB and NB datalogs concurrently, one (board, unit) block per file.
+
+    Like read_datalogs, the files are read on a thread pool, in input order, and the
+    files that cannot be read are reported together. A block is only computed for
+    a file that changed: unchanged files are taken from the memo (same path, size
+    and modification time) or from the block cache (same content).
+
+    Parameters:
+    - rb_files: List of RB datalog paths, one per unit.
+    - nb_files: List (one entry per board) of lists of NB datalog paths, one per unit.
+    - limits: LimitIndex the tests are aligned on.
+    - match_description: Join on the (test number, description) pair instead of the test number alone.
+    - max_workers: Number of threads (None for the executor's default).
+    - cache_dir: Directory of the block and parse cache, or None to disable it.
+    - cache_bytes: Size cap of the cache in bytes.
+    - chunk_rows: Compute the statistics of a changed file chunk_rows tests at a time.
+    - memo: Memo dict kept between runs (see incremental.memoized), or None.
+
+    Returns:
+    - tuple: A tuple containing:
+        - list: RB UnitBlocks, one per unit.
+        - list: NB UnitBlocks, one list per board with one block per unit.
+        - dict: Wall-clock time in seconds of every file, keyed by path.
+
+    Raises:
+    - ValueError: If files could not be read, naming every one of them.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return _read_files(executor, rb_files, nb_files, _timed_block, limits, match_description, cache_dir,
+                           cache_bytes, chunk_rows, memo)
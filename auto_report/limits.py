@@ -0,0 +1,154 @@
+import hashlib  # For the alignment key
+from collections import namedtuple
+
+import numpy as np  # For numerical operations
+import pandas as pd  # For data manipulation
+
+# Reference lot limits compiled for lookups:
+# - table: The cleaned limit DataFrame returned by load_limits, as written to the report.
+# - test_numbers: Array of the 'Test #' join keys (see test_keys), one per limit row.
+# - descriptions: Array of the whitespace-stripped descriptions, one per limit row.
+# - low_limit, high_limit, sd_lot: float64 arrays of the limits, one per limit row.
+# - units: Array of the measurement units, one per limit row.
+# - test_index: pandas Index of the test numbers (hashed lookups).
+# - key_index: pandas MultiIndex of the (test number, description) pairs.
+LimitIndex = namedtuple('LimitIndex', [
+    'table', 'test_numbers', 'descriptions', 'low_limit', 'high_limit', 'sd_lot', 'units', 'test_index', 'key_index',
+])
+
+
+def load_limits(limit_file):
+    """
+    Read and clean the reference lot limit file.
+
+    Parameters:
+    - limit_file: Path (or file object) of the limit CSV file (Test #, Description,
+                  Low_Limit, High_Limit, StdDev, Unit).
+
+    Returns:
+    - pandas.DataFrame: The limits with tab-free test numbers and float limits.
+    """
+    # Read the CSV file into a DataFrame, keeping the test numbers as written ('3.10' is not '3.1')
+    limit = pd.read_csv(limit_file, dtype={0: str})
+
+    # Reset the index of the DataFrame, dropping the old index
+    limit.reset_index(drop=True, inplace=True)
+
+    # Convert the 'Test #' column to strings and remove '\t'
+    limit.iloc[:, 0] = limit.iloc[:, 0].astype(str).str.replace(r'\t', '', regex=True)
+
+    # Remove rows with too many NaNs
+    limit.dropna(thresh=limit.shape[1] - 3, inplace=True)
+
+    # Fill any NaN values with numpy's NaN
+    limit.fillna(np.nan, inplace=True)
+
+    # Convert the values in the third column to float
+    limit.iloc[:, 2] = limit.iloc[:, 2].astype('float')
+
+    # Convert the values in the fourth column to float
+    limit.iloc[:, 3] = limit.iloc[:, 3].astype('float')
+
+    return limit
+
+
+def normalize_keys(values):
+    """
+    Return test numbers or descriptions as whitespace-stripped strings ('\\t1.0' -> '1.0'), missing values as ''.
+    """
+    keys = pd.Series(values, dtype=object)
+    return keys.where(keys.notna(), '').astype(str).str.strip().to_numpy(dtype=object)
+
+
+def test_keys(test_numbers):
+    """
+    Return test numbers as join keys: whitespace-stripped strings, with integer-valued
+    test numbers written the same way whatever their formatting ('\t1', '1.0' -> '1.0').
+    Other test numbers are kept as written, so '3.10' and '3.1' are different tests.
+    """
+    keys = normalize_keys(test_numbers)
+    numbers = pd.to_numeric(pd.Series(keys), errors='coerce').to_numpy(dtype=float)
+    integral = np.isfinite(numbers) & (numbers == np.round(numbers))
+    keys[integral] = numbers[integral].astype(str)
+    return keys
+
+
+def compile_limits(limit):
+    """
+    Compile the limits into a LimitIndex: one array per limit column and hashed
+    indexes of the test numbers and of the (test number, description) pairs.
+
+    The statistics code reads the limits of all tests as arrays from here instead
+    of going back to the DataFrame.
+
+    Parameters:
+    - limit: Limits returned by load_limits, or a LimitIndex (returned as is).
+
+    Returns:
+    - LimitIndex: The compiled limits.
+    """
+    if isinstance(limit, LimitIndex):
+        return limit
+
+    test_numbers = test_keys(limit.iloc[:, 0])
+    descriptions = normalize_keys(limit.iloc[:, 1])
+
+    return LimitIndex(
+        table=limit,
+        test_numbers=test_numbers,
+        descriptions=descriptions,
+        low_limit=limit.iloc[:, 2].to_numpy(dtype=float),
+        high_limit=limit.iloc[:, 3].to_numpy(dtype=float),
+        sd_lot=limit.iloc[:, 4].to_numpy(dtype=float),
+        units=limit.iloc[:, 5].to_numpy(dtype=object),
+        test_index=pd.Index(test_numbers),
+        key_index=pd.MultiIndex.from_arrays([test_numbers, descriptions]),
+    )
+
+
+def limit_rows(limits, test_numbers, descriptions=None):
+    """
+    Find the limit row of every test with hashed lookups, in linear time.
+
+    Parameters:
+    - limits: LimitIndex returned by compile_limits.
+    - test_numbers: 'Test #' of the tests to find (compared as test_keys).
+    - descriptions: Descriptions of the tests, to match on the (test number, description)
+                    pair rather than on the test number alone.
+
+    Returns:
+    - numpy.ndarray: Limit row position of every test, -1 for a test without limits.
+      A key listed more than once in the limits matches its first row.
+    """
+    if descriptions is None:
+        index, keys = limits.test_index, test_keys(test_numbers)
+    else:
+        index = limits.key_index
+        keys = pd.MultiIndex.from_arrays([test_keys(test_numbers), normalize_keys(descriptions)])
+
+    if index.is_unique:
+        return index.get_indexer(keys)
+
+    # Look up the first row of every key only
+    first = ~index.duplicated()
+    found = index[first].get_indexer(keys)
+    return np.where(found >= 0, np.flatnonzero(first)[found], -1)
+
+
+def alignment_key(limits, match_description=False):
+    """
+    Return a digest of the join keys of the limits: two limit files with the same
+    test numbers (and descriptions, with match_description) align a datalog the same way.
+
+    Parameters:
+    - limits: LimitIndex returned by compile_limits.
+    - match_description: Whether the datalogs are joined on the (test number, description) pair.
+
+    Returns:
+    - str: Hexadecimal digest.
+    """
+    digest = hashlib.blake2b(b'description' if match_description else b'test', digest_size=16)
+    digest.update('\0'.join(limits.test_numbers).encode())
+    if match_description:
+        digest.update(b'\0\0' + '\0'.join(limits.descriptions).encode())
+    return digest.hexdigest()
@@ -0,0 +1,832 @@
+import os  # For output paths
+from collections import namedtuple
+from datetime import datetime  # For date and time handling
+
+import numpy as np  # For numerical operations
+import pandas as pd  # For data manipulation
+
+from .cache import DEFAULT_CACHE_DIR, cached_load_limits
+from .align import align_datalogs, mismatch_counts, mismatch_report
+from .capability import evaluate_capability, capability_labels, CAPABILITY_LABELS
+from .correlation import (
+    FAILED,
+    FOR_CHECK,
+    PASSED,
+    STATUS_LABELS,
+    board_result_codes,
+    evaluate_correlation,
+    status_labels,
+    status_tally,
+)
+from .export import export_tables
+from .incremental import array_key, memoized, table_key
+from .ingest import read_datalogs, read_unit_blocks
+from .limits import compile_limits, load_limits
+from .profiling import cprofile_run, profile_stage, write_profile
+from .rounding import round_decimal, round_exact, UNIT_MEAN_DECIMALS, UNIT_SD_DECIMALS, BOARD_STAT_DECIMALS
+from .stats import (
+    DEVICE_AXIS,
+    UNIT_AXIS,
+    SummaryStats,
+    build_datalog_tensor,
+    pool_statistics,
+    stack_statistics,
+    statistics_mean_std,
+    summary_statistics,
+)
+from .tables import correlation_long_table, cpk_long_table
+
+# Datalogs of one report:
+# - data: (board, unit, device, test) array with the RB as board 0 and NB1..NBn as boards 1..n
+#   (or (board, unit, test) SummaryStats when only the statistics of the files were read).
+# - rb: RB datalogs, one per unit (None from load_statistics).
+# - nb: NB datalogs, one list of units per board (None from load_statistics).
+# - read_times: Wall-clock read time in seconds of every file, keyed by path.
+# - mismatches: Tests missing from, extra in or repeated in each datalog (see align.align_datalogs),
+#   None when the datalogs were stacked by position.
+LoadedDatalogs = namedtuple('LoadedDatalogs', ['data', 'rb', 'nb', 'read_times', 'mismatches'])
+
+# Correlation results:
+# - tables: One 'NB# Correlation Results' DataFrame per NB.
+# - results: One DataFrame per NB with the result of every unit and of the board.
+# - unit_mean, unit_std: Rounded (board, unit, test) statistics, RB as board 0.
+# - evaluation: Arrays returned by evaluate_correlation, shape (NB, unit, test).
+# - statistics: Unrounded (board, unit, test) SummaryStats the unit statistics come from,
+#   merged into the pooled board statistics by compute_cpk.
+CorrelationResult = namedtuple('CorrelationResult',
+                               ['tables', 'results', 'unit_mean', 'unit_std', 'evaluation', 'statistics'])
+
+# Cpk results:
+# - tables: One 'NB# CPK' DataFrame per NB.
+# - board_mean, board_std: Rounded pooled (board, test) statistics, RB as board 0.
+# - capability: Arrays returned by evaluate_capability, shape (board, test).
+CpkResult = namedtuple('CpkResult', ['tables', 'board_mean', 'board_std', 'capability'])
+
+# Largest run written with one 'NB# Correlation Results' and one 'NB# CPK' sheet per board;
+# bigger runs are written in the long layout (one row per board, unit and test)
+WIDE_LAYOUT_MAX_BOARDS = 9
+WIDE_LAYOUT_MAX_UNITS = 9
+
+# Data rows per sheet in the long layout (Excel's limit of 1,048,576 rows minus the header)
+MAX_SHEET_ROWS = 1048575
+
+# A sheet of the report:
+# - name: Sheet name.
+# - kind: 'info', 'summary' or 'table' (a data sheet with frozen panes and status colours).
+# - tables: DataFrames written one under the other, with a blank row in between.
+# - status_columns: Names of the columns whose cells are coloured by status.
+# - statuses: Status texts coloured in those columns.
+ReportSheet = namedtuple('ReportSheet', ['name', 'kind', 'tables', 'status_columns', 'statuses'])
+
+# Status texts coloured in the correlation and Cpk sheets
+CORRELATION_STATUSES = list(STATUS_LABELS)
+CAPABILITY_STATUSES = list(CAPABILITY_LABELS)
+
+
+def check_value(failed):
+    """
+    Return the release remark of every board from its "Failed test all units" count.
+
+    Parameters:
+    - failed: Array-like of the "Failed test all units" counts, one per board (an
+              empty string for a board without results).
+
+    Returns:
+    - numpy.ndarray: One message per board:
+        - An empty string if the count is an empty string.
+        - "Good to release if no concern" if the count is 0.
+        - "Not acceptable" for any other count.
+    """
+    failed = np.asarray(failed, dtype=object)
+    remarks = np.where(failed == 0, "Good to release if no concern", "Not acceptable").astype(object)
+    remarks[failed == ""] = ""
+    return remarks
+
+
+def load_datalogs(rb_file, nb_file, max_workers=None, cache_dir=None, limit=None, match_description=False,
+                  chunk_rows=None):
+    """
+    Read the RB and NB datalogs and stack them into one array.
+
+    With limits, the tests of every datalog are joined to the limit rows on 'Test #',
+    so the test axis of the array follows the limit file whatever the order of the
+    datalogs; tests a datalog does not have are NaN. Without limits, the datalogs
+    are stacked by position and must all list the same tests.
+
+    Parameters:
+    - rb_file: List of RB datalog paths, one per unit.
+    - nb_file: List (one entry per NB) of lists of datalog paths, one per unit.
+    - max_workers: Number of reading threads (None for the default).
+    - cache_dir: Directory of the datalog parse cache, or None to disable it.
+    - limit: Limits returned by load_limits (or a LimitIndex) to align the tests on.
+    - match_description: Join on the (test number, description) pair instead of the test number alone.
+    - chunk_rows: Read only the per-test statistics of the files, chunk_rows tests at a time,
+                  for datalogs with too many devices to hold in memory (the parse cache is not used).
+
+    Returns:
+    - LoadedDatalogs: The (board, unit, device, test) array (or (board, unit, test) SummaryStats
+      with chunk_rows), the datalogs, the read times and the mismatches.
+
+    Raises:
+    - ValueError: If datalogs could not be read (every one is named) or do not stack.
+    """
+    # Read the RB datalogs (one per unit) and the NB datalogs (one list of units per board) concurrently,
+    # reusing the parsed values of files already seen in a previous run
+    rb, nb, read_times = read_datalogs(rb_file, nb_file, max_workers=max_workers, cache_dir=cache_dir,
+                                       chunk_rows=chunk_rows)
+
+    if limit is None:
+        # Take the (device, test) view of the values (or the statistics) of every RB and NB datalog
+        if chunk_rows is None:
+            boards = [[log.values.T for log in rb]] + [[log.values.T for log in board] for board in nb]
+        else:
+            boards = [[log.statistics for log in rb]] + [[log.statistics for log in board] for board in nb]
+        mismatches = None
+    else:
+        # Join the tests of every datalog to the limit rows and collect the tests that do not match
+        boards, mismatches = align_datalogs(compile_limits(limit), rb, nb, match_description)
+
+    # Stack the RB (board 0) and NB (boards 1 to num_boards) datalogs into one (board, unit, device, test) array,
+    # or their statistics into (board, unit, test) arrays
+    data = build_datalog_tensor(boards) if chunk_rows is None else stack_statistics(boards)
+
+    return LoadedDatalogs(data, rb, nb, read_times, mismatches)
+
+
+def _board_correlation(i, limit, realrbmean, realrbstd, realnbmean, realnbstd, evaluation):
+    """
+    Build the correlation table and the results of board NB{i+1}.
+
+    Parameters:
+    - i: Index of the NB (0 for NB1).
+    - limit: Limit DataFrame.
+    - realrbmean, realrbstd: Rounded RB unit statistics, one column per unit.
+    - realnbmean, realnbstd: Rounded unit statistics of the NB, one column per unit.
+    - evaluation: Arrays returned by evaluate_correlation for all the NB.
+
+    Returns:
+    - tuple: The 'NB# Correlation Results' DataFrame and the DataFrame of the results of every unit and of the board.
+    """
+    num_units = realrbmean.shape[1]
+
+    # Create a list to hold the correlation DataFrames of each unit
+    temp_list = []
+    for j in range(num_units):
+        # Concatenate the means and standard deviations of the RB and NB for the current unit
+        temp = pd.concat([realrbmean.iloc[:,j],realrbstd.iloc[:,j],realnbmean.iloc[:, j], realnbstd.iloc[:, j]], axis=1)
+
+        # Add the evaluated criteria for the current board and unit
+        temp['Delta Mean'] = evaluation['Delta Mean'][i, j]
+        temp['Mean Shift'] = evaluation['Mean Shift'][i, j]
+        temp['Mean Shift Criteria'] = status_labels(evaluation['Mean Shift Criteria'][i, j])
+        temp['SD Ratio'] = evaluation['SD Ratio'][i, j]
+        temp['SD Ratio Criteria'] = status_labels(evaluation['SD Ratio Criteria'][i, j])
+        temp[f'Result Unit {j+1}'] = status_labels(evaluation['Result'][i, j])
+
+        # Append the DataFrame to the list
+        temp_list.append(temp)
+
+    # Create a DataFrame to hold the results of the board
+    nb_results = pd.DataFrame()
+
+    # Create a new column for each unit's result within the current board
+    for j in range(num_units):
+        # Assign the 'Result Unit' data from temp_list to the new DataFrame for the current unit
+        nb_results[f'Result NB{i+1} U{j+1}'] = temp_list[j][f'Result Unit {j+1}']
+
+    # The overall result is "Passed" when all units passed, from the status codes rather than the strings
+    nb_results[f"NB{i+1} Result"] = status_labels(board_result_codes(evaluation['Result'][i:i + 1])[0])
+
+    # Use the last column instead of hardcoding index 4
+    board_data = nb_results.iloc[:, -1].reset_index(drop=True).rename(f"NB{i+1} Result")
+
+    temp = pd.concat([
+        limit.reset_index(drop=True).rename(columns=lambda x: f"{x}"),
+        board_data
+    ], axis=1)
+
+    temp_units = []
+    for j in range(num_units):
+        # Ensure unit data has unique column names
+        unit_df = temp_list[j].rename(columns=lambda x: f"{x}")
+        temp_units.append(unit_df.reset_index(drop=True))
+
+    if temp_units:
+        combined_units = pd.concat(temp_units, axis=1)
+        final_result = pd.concat([temp, combined_units], axis=1)
+    else:
+        final_result = temp
+
+    return final_result, nb_results
+
+
+def load_statistics(rb_file, nb_file, limit, max_workers=None, cache_dir=None, match_description=False,
+                    chunk_rows=None, memo=None):
+    """
+    Read the per-test statistics of the RB and NB datalogs, aligned on the limit rows, one (board, unit) block per file.
+
+    Gives the same statistics and mismatches as load_datalogs followed by the
+    per-unit reduction, without stacking the devices of all the files. Only the
+    blocks of files that changed since the last run are computed: the others come
+    from the memo or from the block cache, so a rerun after swapping one unit file
+    costs about one unit's work.
+
+    Parameters:
+    - rb_file: List of RB datalog paths, one per unit.
+    - nb_file: List (one entry per NB) of lists of datalog paths, one per unit.
+    - limit: Limits returned by load_limits, or a LimitIndex.
+    - max_workers: Number of reading threads (None for the default).
+    - cache_dir: Directory of the block and parse cache, or None to disable it.
+    - match_description: Join on the (test number, description) pair instead of the test number alone.
+    - chunk_rows: Compute the statistics of a changed file chunk_rows tests at a time.
+    - memo: Memo dict kept between runs (see incremental.memoized), or None.
+
+    Returns:
+    - LoadedDatalogs: The (board, unit, test) SummaryStats, the read times and the mismatches (no datalogs).
+
+    Raises:
+    - ValueError: If datalogs could not be read (every one is named) or do not stack.
+    """
+    rb, nb, read_times = read_unit_blocks(rb_file, nb_file, compile_limits(limit), match_description,
+                                          max_workers=max_workers, cache_dir=cache_dir, chunk_rows=chunk_rows,
+                                          memo=memo)
+
+    # Stack the statistics of the RB (board 0) and NB (boards 1 to num_boards) into (board, unit, test) arrays
+    boards = [rb] + nb
+    data = stack_statistics([[block.statistics for block in board] for board in boards])
+    mismatches = mismatch_report([[block.mismatches for block in board] for board in boards])
+
+    return LoadedDatalogs(data, None, None, read_times, mismatches)
+
+
+def compute_correlation(limit, data, memo=None):
+    """
+    Compare every unit of every NB with the same unit of the RB.
+
+    Parameters:
+    - limit: Limits returned by load_limits, or a LimitIndex returned by compile_limits.
+    - data: (board, unit, device, test) array, or (board, unit, test) SummaryStats, returned by load_datalogs.
+    - memo: Memo dict kept between runs (see incremental.memoized), or None.
+
+    Returns:
+    - CorrelationResult: The per-board correlation tables and results and the
+      statistics they were calculated from.
+    """
+    # Calculate the count, mean and sum of squared deviations of every board and unit, shape (board, unit, test),
+    # and the mean and the population standard deviation from them
+    statistics = data if isinstance(data, SummaryStats) else summary_statistics(data, DEVICE_AXIS)
+    unit_mean, unit_std = statistics_mean_std(statistics)
+
+    num_boards = unit_mean.shape[0] - 1
+    num_units = unit_mean.shape[1]
+
+    # Limits matched to the tests of the datalogs by position, read from the compiled limit arrays
+    limits = compile_limits(limit)
+    limit = limits.table
+    num_tests = unit_mean.shape[-1]
+    low_limit = limits.low_limit[:num_tests]
+    high_limit = limits.high_limit[:num_tests]
+
+    # Create a list of column names for the RB means and standard deviations
+    columns_mean_rb = [f'Mean RB U{i+1}' for i in range(0, num_units)]
+    columns_std_rb = [f'SD RB U{i+1}' for i in range(0, num_units)]
+
+    # Round the unit means to six and the unit standard deviations to five decimal places: the RB
+    # correctly rounded (as its values were formatted to text and read back), the NBs with np.round
+    unit_mean = np.concatenate([round_exact(unit_mean[:1], UNIT_MEAN_DECIMALS),
+                                round_decimal(unit_mean[1:], UNIT_MEAN_DECIMALS)])
+    unit_std = np.concatenate([round_exact(unit_std[:1], UNIT_SD_DECIMALS),
+                               round_decimal(unit_std[1:], UNIT_SD_DECIMALS)])
+
+    # Build the RB mean and standard deviation tables, one column per unit
+    realrbmean = pd.DataFrame(unit_mean[0].T, columns=columns_mean_rb)
+    realrbstd = pd.DataFrame(unit_std[0].T, columns=columns_std_rb)
+
+    # Create 2D lists to hold column names for means and standard deviations of each board
+    columns_mean_nb = [[f'Mean NB{i+1} U{j+1}' for j in range(0, num_units)] for i in range(num_boards)]
+    columns_std_nb = [[f'SD NB{i+1} U{j+1}' for j in range(0, num_units)] for i in range(num_boards)]
+
+    # Build the NB mean and standard deviation tables for each board
+    realnbmean = [pd.DataFrame(unit_mean[i + 1].T, columns=columns_mean_nb[i]) for i in range(num_boards)]
+    realnbstd = [pd.DataFrame(unit_std[i + 1].T, columns=columns_std_nb[i]) for i in range(num_boards)]
+
+    # Evaluate the correlation criteria for every board, unit and test in one go
+    # RB statistics have shape (units, tests) and NB statistics (boards, units, tests)
+    sd_lot = limits.sd_lot[:num_tests]
+
+    evaluation = evaluate_correlation(
+        realrbmean.to_numpy(dtype=float).T,
+        realrbstd.to_numpy(dtype=float).T,
+        np.stack([realnbmean[i].to_numpy(dtype=float).T for i in range(num_boards)]),
+        np.stack([realnbstd[i].to_numpy(dtype=float).T for i in range(num_boards)]),
+        low_limit,
+        high_limit,
+        sd_lot,
+    )
+
+    # Build the tables of every board; with a memo, a board whose statistics and limits are
+    # unchanged since the last run keeps its tables
+    limit_inputs = None if memo is None else table_key(limit)
+    nbtrueresult = []
+    nb_results = []
+    for i in range(num_boards):
+        inputs = None if memo is None else (limit_inputs, array_key(unit_mean[0], unit_std[0], unit_mean[i + 1], unit_std[i + 1]))
+        table, result = memoized(memo, ('correlation', i), inputs, lambda: _board_correlation(
+            i, limit, realrbmean, realrbstd, realnbmean[i], realnbstd[i], evaluation))
+        nbtrueresult.append(table)
+        nb_results.append(result)
+
+    return CorrelationResult(nbtrueresult, nb_results, unit_mean, unit_std, evaluation, statistics)
+
+
+def _board_cpk(i, rbcpcpk, meannbdf, stdnbdf, capability):
+    """
+    Build the 'NB# CPK' table of board NB{i+1}: the RB columns followed by the pooled statistics, Cp and Cpk of the NB.
+    """
+    # Concatenate the mean and standard deviation of the board along the columns, ignoring the index
+    meanstdnbdf = pd.concat([meannbdf, stdnbdf], axis=1, ignore_index=True)
+
+    # Set the column names for the concatenated DataFrame of the current board
+    meanstdnbdf.columns = [f'Mean NB{i+1}', f'SD NB{i+1}']
+
+    # Concatenate the rbcpcpk DataFrame with the mean and standard deviation DataFrame for the current board
+    temp = pd.concat([rbcpcpk, meanstdnbdf], axis=1, ignore_index=False)
+
+    # Add the Cp, Cpk and capability status of the current board
+    temp[f"Cp NB{i+1}"] = capability['Cp'][i + 1]
+    temp[f'Cpk NB{i+1}'] = capability['Cpk'][i + 1]
+    temp[f'Cpk NB{i+1} Result'] = capability_labels(capability['Cpk Result'][i + 1])
+
+    return temp
+
+
+def compute_cpk(limit, data, memo=None):
+    """
+    Calculate the Cp and Cpk of the RB and every NB, pooling the devices of all units.
+
+    Parameters:
+    - limit: Limits returned by load_limits, or a LimitIndex returned by compile_limits.
+    - data: CorrelationResult returned by compute_correlation, whose per-unit statistics are
+            merged in O(tests) per unit; or the (board, unit, device, test) array or
+            (board, unit, test) SummaryStats returned by load_datalogs.
+    - memo: Memo dict kept between runs (see incremental.memoized), or None.
+
+    Returns:
+    - CpkResult: The per-board Cpk tables and the statistics they were calculated from.
+    """
+    # Calculate the pooled mean and standard deviation of every board across all its units, shape (board, test),
+    # by merging the statistics of its units rather than going over the values again
+    if isinstance(data, CorrelationResult):
+        data = data.statistics
+    elif not isinstance(data, SummaryStats):
+        data = summary_statistics(data, DEVICE_AXIS)
+    board_mean, board_std = statistics_mean_std(pool_statistics(data, UNIT_AXIS))
+
+    num_boards = board_mean.shape[0] - 1
+
+    # Limits matched to the tests of the datalogs by position, read from the compiled limit arrays
+    limits = compile_limits(limit)
+    limit = limits.table
+    num_tests = board_mean.shape[-1]
+    low_limit = limits.low_limit[:num_tests]
+    high_limit = limits.high_limit[:num_tests]
+
+    # Round the pooled means and standard deviations correctly to four decimal places
+    board_mean = round_exact(board_mean, BOARD_STAT_DECIMALS)
+    board_std = round_exact(board_std, BOARD_STAT_DECIMALS)
+
+    # Split the pooled statistics into the RB and the NB of each board
+    meanrbdf = pd.Series(board_mean[0])
+    stdrbdf = pd.Series(board_std[0])
+    meannbdf = [pd.Series(board_mean[i + 1]) for i in range(num_boards)]
+    stdnbdf = [pd.Series(board_std[i + 1]) for i in range(num_boards)]
+
+    # Concatenate the mean and standard deviation DataFrames for rbdf along the columns, ignoring the index
+    meanstdrbdf = pd.concat([meanrbdf, stdrbdf], axis=1, ignore_index=True)
+
+    # Set the column names for the concatenated DataFrame
+    meanstdrbdf.columns = ['Mean RB', 'SD RB']
+
+    # Calculate Cp, Cpk and the capability status of the RB (board 0) and every NB in one go, shape (board, test)
+    capability = evaluate_capability(board_mean, board_std, low_limit, high_limit)
+
+    # Concatenate the limit DataFrame with the mean and standard deviation DataFrame for rbdf along the columns
+    rbcpcpk = pd.concat([limit, meanstdrbdf], axis=1)
+
+    # Add the Cp, Cpk and capability status of the RB
+    rbcpcpk["Cp RB"] = capability['Cp'][0]
+    rbcpcpk['Cpk RB'] = capability['Cpk'][0]
+    rbcpcpk['Cpk RB Result'] = capability_labels(capability['Cpk Result'][0])
+
+    # Initialize an empty list to hold the DataFrames for each board's Cp and Cpk results
+    nbcpkresult = []
+
+    # Build the table of every board; with a memo, a board whose statistics and limits are
+    # unchanged since the last run keeps its table
+    limit_inputs = None if memo is None else table_key(limit)
+    for i in range(0, num_boards):
+        inputs = None if memo is None else (limit_inputs, array_key(board_mean[0], board_std[0], board_mean[i + 1], board_std[i + 1]))
+        nbcpkresult.append(memoized(memo, ('cpk', i), inputs, lambda: _board_cpk(
+            i, rbcpcpk, meannbdf[i], stdnbdf[i], capability)))
+
+    return CpkResult(nbcpkresult, board_mean, board_std, capability)
+
+
+def build_summary(product_info, correlation):
+    """
+    Build the 'Correlation Summary' table: the number of passed, for check and
+    failed tests of every NB, for all units and per unit, with release remarks.
+
+    Parameters:
+    - product_info: Dictionary of the product information.
+    - correlation: CorrelationResult returned by compute_correlation.
+
+    Returns:
+    - pandas.DataFrame: The summary, one column per NB.
+    """
+    num_boards = len(correlation.results)
+    num_units = correlation.unit_mean.shape[1]
+
+    # Tally the statuses of every board and unit, and of the overall board results, in one bincount pass each,
+    # shape (board, unit, status) and (board, status)
+    result = correlation.evaluation['Result']
+    unit_counts = status_tally(result)
+    board_counts = status_tally(board_result_codes(result))
+
+    # Creating corrtable and adding necessary columns
+    # Add a column for the test card names, formatted with the product info and board index
+    columns = {'Test Card': [f"{product_info['Test Card Name']}_NB{i+1}" for i in range(num_boards)]}
+
+    # Add the counts of passed, for check and failed tests across all units for each board
+    columns['Passed test all units'] = board_counts[:, PASSED]
+    columns['For Check test all units'] = board_counts[:, FOR_CHECK]
+    columns['Failed test all units'] = board_counts[:, FAILED]
+
+    # Adding unit-specific columns for each unit
+    for j in range(num_units):
+        # Add the counts of passed, for check and failed tests for the current unit across all boards
+        columns[f'Passed test U{j+1}'] = unit_counts[:, j, PASSED]
+        columns[f'For Check test U{j+1}'] = unit_counts[:, j, FOR_CHECK]
+        columns[f'Failed test U{j+1}'] = unit_counts[:, j, FAILED]
+
+    corrtable = pd.DataFrame(columns)
+
+    # Add a column for the total number of tests conducted (assuming all boards have the same number of results)
+    corrtable['Total test'] = result.shape[-1]
+
+    # Add the release remarks from the failed test counts of all units
+    corrtable['Remarks'] = check_value(board_counts[:, FAILED])
+
+    # Set the 'Test Card' column as the index of the DataFrame
+    corrtable.set_index('Test Card', inplace=True)
+
+    # Transpose the DataFrame to switch rows and columns
+    corrtable = corrtable.T
+
+    # Optional: Rename the axes for clarity
+    corrtable.rename_axis("Test Card", axis=0, inplace=True)
+    corrtable.rename_axis("Index", axis=1, inplace=True)
+
+    # Reset the index to convert the index back into a column
+    corrtable.reset_index(inplace=True)
+
+    return corrtable
+
+
+def choose_layout(num_boards, num_units):
+    """
+    Return the report layout for a run: 'wide' (one pair of sheets per board) up to
+    WIDE_LAYOUT_MAX_BOARDS boards and WIDE_LAYOUT_MAX_UNITS units, 'long' beyond.
+    """
+    if num_boards <= WIDE_LAYOUT_MAX_BOARDS and num_units <= WIDE_LAYOUT_MAX_UNITS:
+        return 'wide'
+    return 'long'
+
+
+def paginate(df, sheet_name, max_rows=MAX_SHEET_ROWS):
+    """
+    Split a DataFrame into pages of at most max_rows rows, one sheet each.
+
+    Parameters:
+    - df: DataFrame to split.
+    - sheet_name: Name of the first sheet; the next ones get ' (2)', ' (3)', ... appended.
+    - max_rows: Maximum number of data rows per sheet.
+
+    Returns:
+    - list: (sheet name, rows) pairs, the rows being a slice of df.
+    """
+    pages = []
+    for page, start in enumerate(range(0, max(len(df), 1), max_rows)):
+        name = sheet_name if page == 0 else f'{sheet_name} ({page + 1})'
+        pages.append((name, df.iloc[start:start + max_rows]))
+    return pages
+
+
+def report_sheets(product_info, setup_info, correlation, cpk, summary, layout=None, limit=None):
+    """
+    List the sheets of the report, in workbook order, with what to write and colour on each.
+
+    In the long layout the per-board sheets are replaced by a 'Correlation Results'
+    and a 'CPK' table with one row per board, unit and test, continued on
+    numbered sheets when they exceed Excel's row limit.
+
+    Parameters:
+    - product_info: Dictionary of the product information.
+    - setup_info: Dictionary of the setup information.
+    - correlation: CorrelationResult returned by compute_correlation.
+    - cpk: CpkResult returned by compute_cpk.
+    - summary: Summary table returned by build_summary.
+    - layout: 'wide', 'long', or None to pick one with choose_layout.
+    - limit: Limits returned by load_limits, required by the long layout.
+
+    Returns:
+    - list: ReportSheet tuples.
+    """
+    nbtrueresult = correlation.tables
+    nbcpkresult = cpk.tables
+    corrtable = summary
+
+    if layout is None:
+        layout = choose_layout(len(nbtrueresult), correlation.unit_mean.shape[1])
+    if layout not in ('wide', 'long'):
+        raise ValueError(f"Unknown report layout: {layout}")
+    if layout == 'long' and limit is None:
+        raise ValueError("The long layout needs the limits")
+
+    # Create a DataFrame from the product_info dictionary, using the index as the first column and 'Details' as the second column
+    df_product_info = pd.DataFrame.from_dict(product_info, orient='index', columns=['Details']).reset_index()
+
+    # Create a DataFrame from the setup_info dictionary, using the index as the first column and 'Details' as the second column
+    df_setup_info = pd.DataFrame.from_dict(setup_info, orient='index', columns=['Details']).reset_index()
+
+    # Rename the columns of the product info DataFrame for clarity
+    df_product_info.columns = ['Product Info', 'Details']
+
+    # Rename the columns of the setup info DataFrame for clarity
+    df_setup_info.columns = ['Setup Info', 'Details']
+
+    # The setup info goes below the product info, the correlation summary on its own sheet
+    sheets = [
+        ReportSheet('Info', 'info', [df_product_info, df_setup_info], [], []),
+        ReportSheet('Correlation Summary', 'summary', [corrtable], [], []),
+    ]
+
+    if layout == 'wide':
+        # One sheet per board for the correlation results; colour the `Result NB# U#`, criteria and
+        # `NB# Result` cells (every column but the first)
+        for i, df in enumerate(nbtrueresult):
+            sheets.append(ReportSheet(f'NB{i + 1} Correlation Results', 'table', [df], list(df.columns[1:]), CORRELATION_STATUSES))
+
+        # One sheet per board for the CPK results; colour the `Cpk RB Result` and `Cpk NB# Result` cells
+        for i, df in enumerate(nbcpkresult):
+            sheets.append(ReportSheet(f'NB{i + 1} CPK', 'table', [df], ['Cpk RB Result', f'Cpk NB{i + 1} Result'], CAPABILITY_STATUSES))
+
+    else:
+        # The correlation and Cpk results of all boards as two long tables, paginated if needed
+        for sheet_name, page in paginate(correlation_long_table(limit, correlation), 'Correlation Results'):
+            sheets.append(ReportSheet(sheet_name, 'table', [page],
+                                      ['Mean Shift Criteria', 'SD Ratio Criteria', 'Result', 'Board Result'], CORRELATION_STATUSES))
+
+        for sheet_name, page in paginate(cpk_long_table(limit, cpk), 'CPK'):
+            sheets.append(ReportSheet(sheet_name, 'table', [page], ['Cpk Result'], CAPABILITY_STATUSES))
+
+    return sheets
+
+
+def report_file_name(product_info, output_dir='.'):
+    """
+    Return the path of the report: '<Test Card Name>_Correlation_Report_<DD-MM-YYYY>.xlsx'.
+    """
+    # Define the output file name for the Excel report, incorporating the test card name and the current date
+    current_date = datetime.now().strftime("%d-%m-%Y")  # Get the current date in DD-MM-YYYY format
+
+    return os.path.join(output_dir, f'{product_info["Test Card Name"]}_Correlation_Report_{current_date}.xlsx')
+
+
+def mismatch_file_name(product_info, output_dir='.'):
+    """
+    Return the path of the test mismatch report: '<Test Card Name>_Test_Mismatches_<DD-MM-YYYY>.csv'.
+    """
+    current_date = datetime.now().strftime("%d-%m-%Y")  # Get the current date in DD-MM-YYYY format
+
+    return os.path.join(output_dir, f'{product_info["Test Card Name"]}_Test_Mismatches_{current_date}.csv')
+
+
+def profile_file_name(product_info, output_dir='.', extension='.json'):
+    """
+    Return the path of the stage profile of a run: '<Test Card Name>_Profile_<DD-MM-YYYY>.json'.
+    """
+    current_date = datetime.now().strftime("%d-%m-%Y")  # Get the current date in DD-MM-YYYY format
+
+    return os.path.join(output_dir, f'{product_info["Test Card Name"]}_Profile_{current_date}{extension}')
+
+
+def write_report(output_file, product_info, setup_info, correlation, cpk, summary, layout=None, limit=None,
+                 streaming=False, profile=None):
+    """
+    Write the report workbook. The sheets are:
+    - 'Info': The product information, with the setup information below it.
+    - 'Correlation Summary': The summary of the correlation results.
+    - 'NB# Correlation Results': The correlation results of each NB.
+    - 'NB# CPK': The Cp and Cpk results of each NB.
+    - 'Correlation Results' and 'CPK': Replace the two sheets above in the long layout
+      (see report_sheets).
+
+    The column widths follow the content, the data sheets get autofilters and
+    frozen panes, the statuses are coloured with conditional formatting and every
+    cell gets the shared borders and fills.
+
+    Parameters:
+    - output_file: Path of the workbook to write.
+    - product_info: Dictionary of the product information.
+    - setup_info: Dictionary of the setup information.
+    - correlation: CorrelationResult returned by compute_correlation.
+    - cpk: CpkResult returned by compute_cpk.
+    - summary: Summary table returned by build_summary.
+    - layout: 'wide', 'long', or None to pick one with choose_layout.
+    - limit: Limits returned by load_limits, required by the long layout.
+    - streaming: Write the rows one by one with write_workbook_streaming instead of
+                 building every sheet in memory first.
+    - profile: StageRecord list to record the 'excel: tables' and 'excel: styling' stages in
+               (see profiling.profile_stage), or None.
+
+    Returns:
+    - None
+    """
+    # openpyxl is imported when a workbook is written, not with the pipeline
+    from .streaming import write_workbook_streaming
+    from .styling import (
+        add_status_rules,
+        column_ranges,
+        column_widths,
+        register_styles,
+        set_column_widths,
+        style_info_sheet,
+        style_summary_sheet,
+        style_table_sheet,
+    )
+
+    sheets = report_sheets(product_info, setup_info, correlation, cpk, summary, layout=layout, limit=limit)
+
+    if streaming:
+        write_workbook_streaming(output_file, sheets)
+        return
+
+    # Create an Excel writer object to write multiple DataFrames to an Excel file
+    with pd.ExcelWriter(output_file, engine='openpyxl', mode='w') as writer:
+
+        # Write the tables of every sheet, one under the other with a blank row in between
+        with profile_stage(profile, 'excel: tables') as size:
+            for sheet in sheets:
+                startrow = 0
+                for df in sheet.tables:
+                    df.to_excel(writer, sheet_name=sheet.name, index=False, startrow=startrow)
+                    startrow += len(df) + 2
+            size['rows'] = sum(len(df) for sheet in sheets for df in sheet.tables)
+            size['columns'] = max(len(df.columns) for sheet in sheets for df in sheet.tables)
+
+        # Access the workbook and the writer's worksheets
+        workbook = writer.book
+
+        # Apply the shared cell styles range by range and colour the statuses with conditional formatting
+        with profile_stage(profile, 'excel: styling'):
+            register_styles(workbook)
+
+            for sheet in sheets:
+                worksheet = workbook[sheet.name]
+
+                # Adjust the column widths from the tables of the sheet
+                set_column_widths(worksheet, column_widths(sheet.tables))
+
+                if sheet.kind == 'info':
+                    style_info_sheet(worksheet, len(sheet.tables[0]), len(sheet.tables[1]))
+                elif sheet.kind == 'summary':
+                    style_summary_sheet(worksheet)
+                else:
+                    df = sheet.tables[0]
+                    style_table_sheet(worksheet)
+                    add_status_rules(worksheet, column_ranges(df.columns, len(df), sheet.status_columns), sheet.statuses)
+
+
+def generate_report(product_info, setup_info, nb_file, rb_file, limit_file, output_dir='.',
+                    cache_dir=DEFAULT_CACHE_DIR, max_workers=None, layout=None, streaming=False,
+                    export_format=None, export_dir=None, excel=True, limit=None, match_description=False,
+                    chunk_rows=None, memo=None, profile=True, cprofile=False):
+    """
+    Run the whole correlation and Cpk pipeline and write the Excel report.
+
+    This function chains load_limits, load_statistics, compute_correlation,
+    compute_cpk, build_summary and write_report. It does not use the GUI, so it
+    can run unattended. The datalog tests are joined to the limit rows on 'Test #';
+    tests missing from or not in the limit file are listed in a
+    '<Test Card Name>_Test_Mismatches_<DD-MM-YYYY>.csv' file next to the report. With export_format, the tables are also (or, without
+    excel, only) written as Parquet/Arrow datasets by export.export_tables.
+
+    Parameters:
+    - product_info: Dictionary of the product information ('Test Card Name', 'Part Name',
+                    'Package', 'Lead Count', 'Description').
+    - setup_info: Dictionary of the setup information ('Tester ID', 'Reference Board',
+                  'New Board ID', 'Test Program').
+    - nb_file: List (one entry per NB) of lists of datalog paths, one per unit.
+    - rb_file: List of RB datalog paths, one per unit.
+    - limit_file: Path of the reference lot limit CSV file.
+    - output_dir: Directory the report is written to.
+    - cache_dir: Directory of the datalog and limit parse cache, or None to disable it.
+    - max_workers: Number of datalog reading threads (None for the default).
+    - layout: Report layout, 'wide', 'long', or None to pick one from the board and unit counts.
+    - streaming: Write the workbook row by row in openpyxl's write-only mode, for very large reports.
+    - export_format: 'parquet' or 'arrow' to export the tables as columnar datasets (needs pyarrow).
+    - export_dir: Directory of the datasets (default: a 'columnar' directory in output_dir).
+    - excel: Write the Excel workbook.
+    - limit: Limits already returned by load_limits (or a LimitIndex), to share one parse
+             between reports (limit_file is then not read).
+    - match_description: Join the datalog tests to the limits on 'Test #' and 'Description'
+                         instead of 'Test #' alone.
+    - chunk_rows: Read only the per-test statistics of the datalogs, chunk_rows tests at a
+                  time, so files with thousands of devices are never held in memory.
+    - memo: Dict kept by the caller between runs: only the unit statistics and the board
+            tables whose inputs changed since the previous run are computed again.
+    - profile: Write the wall time, CPU time, peak memory and output size of every stage to a
+               '<Test Card Name>_Profile_<DD-MM-YYYY>.json' file next to the report.
+    - cprofile: Also dump a cProfile of the run to '<Test Card Name>_Profile_<DD-MM-YYYY>.prof'.
+
+    Returns:
+    - str: Path of the written report, or of the export directory when no workbook is written.
+    """
+    if not excel and export_format is None:
+        raise ValueError("Nothing to write: enable the Excel report or choose an export format")
+
+    # Wall time, CPU time, peak memory and output size of every stage, for the profile sidecar
+    stages = [] if profile else None
+    start = datetime.now()
+
+    with cprofile_run(profile_file_name(product_info, output_dir, '.prof') if cprofile else None):
+        # Compiled limits, from the parse cache when an unchanged limit file was already seen
+        with profile_stage(stages, 'limits') as size:
+            if limit is None:
+                limit = load_limits(limit_file) if cache_dir is None else cached_load_limits(limit_file, cache_dir)
+            limits = compile_limits(limit)
+            limit = limits.table
+            size['rows'], size['columns'] = limit.shape
+
+        # Per-unit statistics of every datalog, computed again only for the files that changed
+        with profile_stage(stages, 'datalogs') as size:
+            datalogs = load_statistics(rb_file, nb_file, limits, max_workers=max_workers, cache_dir=cache_dir,
+                                       match_description=match_description, chunk_rows=chunk_rows, memo=memo)
+            size['rows'] = len(datalogs.read_times)
+            size['columns'] = datalogs.data.count.shape[-1]
+
+        # Report how long each file took to read, to spot slow network shares
+        for file_path, seconds in datalogs.read_times.items():
+            print(f"Read {file_path} in {seconds:.3f} s")
+
+        # Report the datalogs whose tests do not match the limit file
+        if len(datalogs.mismatches):
+            for (board, unit), counts in mismatch_counts(datalogs.mismatches).iterrows():
+                issues = ', '.join(f"{n} {issue.lower()}" for issue, n in counts.items() if n)
+                print(f"Test mismatch in {board} {unit}: {issues}")
+            mismatch_file = mismatch_file_name(product_info, output_dir)
+            datalogs.mismatches.to_csv(mismatch_file, index=False)
+            print(f"Test mismatches have been written to '{mismatch_file}'")
+
+        with profile_stage(stages, 'correlation') as size:
+            correlation = compute_correlation(limits, datalogs.data, memo=memo)
+            size['rows'], size['columns'] = len(limit), sum(len(table.columns) for table in correlation.tables)
+
+        with profile_stage(stages, 'cpk') as size:
+            cpk = compute_cpk(limits, correlation, memo=memo)
+            size['rows'], size['columns'] = len(limit), sum(len(table.columns) for table in cpk.tables)
+
+        with profile_stage(stages, 'summary') as size:
+            summary = build_summary(product_info, correlation)
+            size['rows'], size['columns'] = summary.shape
+
+        output_file = None
+        if export_format is not None:
+            with profile_stage(stages, 'export'):
+                output_file = export_dir or os.path.join(output_dir, 'columnar')
+                export_tables(product_info, limit, correlation, cpk, summary, output_file, export_format)
+
+        if excel:
+            with profile_stage(stages, 'excel'):
+                output_file = report_file_name(product_info, output_dir)
+                write_report(output_file, product_info, setup_info, correlation, cpk, summary, layout=layout,
+                             limit=limit, streaming=streaming, profile=stages)
+
+    if profile:
+        profile_file = profile_file_name(product_info, output_dir)
+        write_profile(
+            profile_file,
+            stages,
+            test_card=product_info['Test Card Name'],
+            report=output_file,
+            started=start.isoformat(timespec='seconds'),
+            wall_seconds=round((datetime.now() - start).total_seconds(), 6),
+            boards=int(datalogs.data.count.shape[0] - 1),
+            units=int(datalogs.data.count.shape[1]),
+            tests=int(datalogs.data.count.shape[2]),
+            read_seconds={file_path: round(seconds, 6) for file_path, seconds in datalogs.read_times.items()},
+        )
+        print(f"Stage profile has been written to '{profile_file}'")
+
+    return output_file
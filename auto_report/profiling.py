@@ -0,0 +1,119 @@
+"""
+Per-stage instrumentation of a report run: wall time, CPU time, peak memory and
+table sizes of every stage, written as a JSON sidecar next to the report.
+"""
+
+import cProfile  # For the optional hot path profile
+import json  # For the profile sidecar
+import sys  # For the platform-dependent unit of the peak RSS
+import time  # For wall and CPU time
+from collections import namedtuple
+from contextlib import contextmanager
+
+# Measurements of one stage of a run:
+# - stage: Stage name ('limits', 'datalogs', 'correlation', ...).
+# - wall_seconds: Wall-clock time of the stage.
+# - cpu_seconds: CPU time of the process during the stage (all threads, so it can exceed the wall time).
+# - peak_rss_bytes: Peak resident memory of the process at the end of the stage (None where it
+#   cannot be read). It only goes up, so a stage that raises it is the one that needed the memory.
+# - rows, columns: Size of the table (or array) the stage produced, None when not recorded.
+StageRecord = namedtuple('StageRecord', ['stage', 'wall_seconds', 'cpu_seconds', 'peak_rss_bytes', 'rows', 'columns'])
+
+
+def peak_rss():
+    """
+    Return the peak resident set size of the process in bytes, or None where it cannot be read.
+
+    Uses the resource module on Linux and macOS and psutil, when installed, on Windows.
+    """
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        memory = psutil.Process().memory_info()
+        return getattr(memory, 'peak_wset', memory.rss)
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+@contextmanager
+def profile_stage(records, stage):
+    """
+    Measure the block as one stage of a run and append its StageRecord to records.
+
+    The block may set the 'rows' and 'columns' of the dict it is given to record
+    the size of what it produced. With records None nothing is measured.
+
+    Parameters:
+    - records: List the StageRecord is appended to, or None.
+    - stage: Stage name.
+
+    Yields:
+    - dict: Size of the stage output, filled in by the block.
+    """
+    size = {}
+    if records is None:
+        yield size
+        return
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    yield size
+    records.append(StageRecord(
+        stage=stage,
+        wall_seconds=time.perf_counter() - wall_start,
+        cpu_seconds=time.process_time() - cpu_start,
+        peak_rss_bytes=peak_rss(),
+        rows=size.get('rows'),
+        columns=size.get('columns'),
+    ))
+
+
+@contextmanager
+def cprofile_run(profile_file):
+    """
+    Run the block under cProfile and dump its statistics to profile_file (for
+    `python -m pstats` or snakeviz). Only the calling thread is profiled. Nothing
+    is profiled when profile_file is None.
+    """
+    if profile_file is None:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(profile_file)
+
+
+def write_profile(profile_file, records, **info):
+    """
+    Write the stage records of a run as a JSON file.
+
+    Parameters:
+    - profile_file: Path of the JSON file.
+    - records: StageRecord list filled by profile_stage.
+    - info: Other JSON-serializable fields of the run (report path, file read times, ...).
+
+    Returns:
+    - dict: The profile as written.
+    """
+    profile = dict(info)
+    profile['peak_rss_bytes'] = peak_rss()
+    profile['stages'] = [
+        dict(record._asdict(), wall_seconds=round(record.wall_seconds, 6), cpu_seconds=round(record.cpu_seconds, 6))
+        for record in records
+    ]
+
+    with open(profile_file, 'w') as f:
+        json.dump(profile, f, indent=1)
+
+    return profile
@@ -0,0 +1,90 @@
+import numpy as np  # For numerical operations
+
+# Decimal places shown in the report for each kind of statistic
+UNIT_MEAN_DECIMALS = 6
+UNIT_SD_DECIMALS = 5
+BOARD_STAT_DECIMALS = 4
+DELTA_MEAN_DECIMALS = 6
+MEAN_SHIFT_DECIMALS = 5
+SD_RATIO_DECIMALS = 6
+CPK_DECIMALS = 2
+
+# Veltkamp splitting constant (2**27 + 1) for float64
+_SPLITTER = 134217729.0
+
+
+def round_decimal(values, decimals):
+    """
+    Round statistics to a fixed number of decimal places.
+
+    This is the rounding step used where the report has always rounded with
+    np.round: the NB unit means and standard deviations and the correlation
+    statistics. It rounds half to even on the scaled value, so values just off a
+    half-way point can round differently from round() (see round_exact).
+
+    Parameters:
+    - values: Scalar or array-like of floats.
+    - decimals: Number of decimal places to keep.
+
+    Returns:
+    - numpy.ndarray or float: Rounded values with the shape of the input. NaN and
+      infinite values are returned unchanged.
+    """
+    rounded = np.round(np.asarray(values, dtype=float), decimals)
+    return rounded if rounded.ndim else float(rounded)
+
+
+def _two_product_error(a, b, product):
+    """
+    Return the exact rounding error of the float64 product a * b (Dekker's TwoProduct),
+    so that a * b == product + error holds exactly.
+    """
+    c = _SPLITTER * a
+    a_hi = c - (c - a)
+    a_lo = a - a_hi
+    c = _SPLITTER * b
+    b_hi = c - (c - b)
+    b_lo = b - b_hi
+    return ((a_hi * b_hi - product) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+
+
+def round_exact(values, decimals):
+    """
+    Round values to a number of decimal places exactly like Python's round().
+
+    round_decimal scales by 10**decimals in floating point, which can push a value
+    sitting just below a half-way point (e.g. 65.67499999...) onto it. This function
+    recovers the exact error of that scaling and corrects the rounded integer, so the
+    result is the correctly rounded decimal, still without per-element Python calls.
+    It is used where the report has always rounded with round() (Cp and Cpk) or
+    formatted the value to text and read it back (the RB unit statistics and the
+    pooled board statistics), which round the same way.
+
+    Parameters:
+    - values: Scalar or array-like of floats.
+    - decimals: Number of decimal places to keep.
+
+    Returns:
+    - numpy.ndarray or float: Rounded values with the shape of the input. NaN and
+      infinite values are returned unchanged.
+    """
+    x = np.asarray(values, dtype=float)
+    scale = 10.0 ** decimals
+
+    with np.errstate(over='ignore', invalid='ignore'):
+        product = x * scale
+        error = _two_product_error(x, scale, product)
+        nearest = np.rint(product)
+        residual = product - nearest
+
+        # The exact product is product + error; move to the neighbouring integer
+        # when the error carries it past the half-way point
+        nearest = np.where(error > 0.5 - residual, nearest + 1, nearest)
+        nearest = np.where(error < -0.5 - residual, nearest - 1, nearest)
+        rounded = nearest / scale
+
+    # Values this large are already spaced wider than 10**-decimals, so rounding
+    # them returns the value itself (this also passes NaN and inf through)
+    rounded = np.where(np.abs(x) < 2.0 ** 53 / scale, rounded, x)
+
+    return rounded if rounded.ndim else float(rounded)
@@ -0,0 +1,170 @@
+import warnings  # To silence all-NaN slice warnings
+from collections import namedtuple
+
+import numpy as np  # For numerical operations
+
+# Axes of the datalog tensor
+BOARD_AXIS = 0
+UNIT_AXIS = 1
+DEVICE_AXIS = 2
+TEST_AXIS = 3
+
+# Mergeable summary statistics of a set of measurements, arrays of the same shape:
+# - count: Number of non-missing values.
+# - mean: Mean of the values (NaN when count is 0).
+# - m2: Sum of the squared deviations from the mean (0 when count is 0).
+SummaryStats = namedtuple('SummaryStats', ['count', 'mean', 'm2'])
+
+
+def build_datalog_tensor(boards):
+    """
+    Stack the processed datalogs into one (board, unit, device, test) array.
+
+    Every unit file becomes one (device, test) slice of a contiguous float64 array.
+    Units that logged fewer devices than the largest unit are padded with NaN,
+    which the NaN-aware reductions below ignore, exactly like the NaN cells of the
+    original DataFrames.
+
+    Parameters:
+    - boards: List (one entry per board) of lists (one entry per unit) of 2D
+              array-likes with devices as rows and tests as columns.
+
+    Returns:
+    - numpy.ndarray: Array of shape (boards, units, devices, tests).
+
+    Raises:
+    - ValueError: If the boards do not all have the same number of units or the
+                  datalogs do not all have the same number of tests.
+    """
+    boards = [[np.asarray(unit, dtype=float) for unit in board] for board in boards]
+
+    num_units = len(boards[0])
+    num_tests = boards[0][0].shape[1]
+    max_devices = max(unit.shape[0] for board in boards for unit in board)
+
+    tensor = np.full((len(boards), num_units, max_devices, num_tests), np.nan)
+
+    for b, board in enumerate(boards):
+        if len(board) != num_units:
+            raise ValueError(f"Board {b} has {len(board)} units, expected {num_units}")
+        for u, unit in enumerate(board):
+            if unit.shape[1] != num_tests:
+                raise ValueError(f"Board {b} unit {u + 1} has {unit.shape[1]} tests, expected {num_tests}")
+            tensor[b, u, :unit.shape[0]] = unit
+
+    return tensor
+
+
+def unit_statistics(tensor):
+    """
+    Calculate the mean and population standard deviation of every unit.
+
+    Parameters:
+    - tensor: Datalog array of shape (boards, units, devices, tests).
+
+    Returns:
+    - tuple: Mean and standard deviation (ddof=0) arrays of shape (boards, units, tests).
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        mean = np.nanmean(tensor, axis=DEVICE_AXIS)
+        std = np.nanstd(tensor, axis=DEVICE_AXIS, ddof=0)
+    return mean, std
+
+
+def board_statistics(tensor):
+    """
+    Calculate the mean and population standard deviation of every board, pooling
+    the devices of all its units.
+
+    Parameters:
+    - tensor: Datalog array of shape (boards, units, devices, tests).
+
+    Returns:
+    - tuple: Mean and standard deviation (ddof=0) arrays of shape (boards, tests).
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        mean = np.nanmean(tensor, axis=(UNIT_AXIS, DEVICE_AXIS))
+        std = np.nanstd(tensor, axis=(UNIT_AXIS, DEVICE_AXIS), ddof=0)
+    return mean, std
+
+
+def summary_statistics(values, axis):
+    """
+    Calculate the count, mean and sum of squared deviations of an array along an axis, ignoring NaN.
+
+    Parameters:
+    - values: float array.
+    - axis: Axis to reduce.
+
+    Returns:
+    - SummaryStats: Arrays with the axis removed.
+    """
+    values = np.asarray(values, dtype=float)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        count = np.sum(~np.isnan(values), axis=axis)
+        mean = np.nanmean(values, axis=axis)
+        m2 = np.nansum((values - np.expand_dims(mean, axis)) ** 2, axis=axis)
+    return SummaryStats(count, mean, m2)
+
+
+def pool_statistics(stats, axis):
+    """
+    Merge summary statistics along an axis, as if the underlying values had been pooled.
+
+    Uses the parallel merge of Chan et al.: the pooled mean is the count-weighted
+    mean and the pooled M2 adds the spread of the means to the M2 of every part,
+    so pooling costs one pass over the statistics, not over the values.
+
+    Parameters:
+    - stats: SummaryStats to merge.
+    - axis: Axis of the parts to merge (e.g. the unit axis of (board, unit, test) statistics).
+
+    Returns:
+    - SummaryStats: Pooled statistics with the axis removed.
+    """
+    count = np.sum(stats.count, axis=axis)
+    weighted = np.where(stats.count > 0, stats.count * np.nan_to_num(stats.mean), 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.sum(weighted, axis=axis) / count
+    deviation = np.where(stats.count > 0, stats.count * (stats.mean - np.expand_dims(mean, axis)) ** 2, 0.0)
+    m2 = np.sum(stats.m2, axis=axis) + np.sum(deviation, axis=axis)
+    return SummaryStats(count, np.where(count > 0, mean, np.nan), m2)
+
+
+def statistics_mean_std(stats):
+    """
+    Return the mean and population standard deviation (ddof=0) of summary statistics, NaN where there are no values.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.sqrt(stats.m2 / stats.count)
+    return np.where(stats.count > 0, stats.mean, np.nan), np.where(stats.count > 0, std, np.nan)
+
+
+def stack_statistics(boards):
+    """
+    Stack the per-test summary statistics of every datalog into (board, unit, test) statistics.
+
+    Parameters:
+    - boards: List (one entry per board) of lists (one entry per unit) of SummaryStats of shape (tests,).
+
+    Returns:
+    - SummaryStats: Arrays of shape (boards, units, tests).
+
+    Raises:
+    - ValueError: If the boards do not all have the same number of units or the
+                  datalogs do not all have the same number of tests.
+    """
+    num_units = len(boards[0])
+    num_tests = len(boards[0][0].count)
+    for b, board in enumerate(boards):
+        if len(board) != num_units:
+            raise ValueError(f"Board {b} has {len(board)} units, expected {num_units}")
+        for u, unit in enumerate(board):
+            if len(unit.count) != num_tests:
+                raise ValueError(f"Board {b} unit {u + 1} has {len(unit.count)} tests, expected {num_tests}")
+
+    return SummaryStats(*(np.array([[unit[k] for unit in board] for board in boards], dtype=float)
+                          for k in range(len(SummaryStats._fields))))
@@ -0,0 +1,125 @@
+import numpy as np  # For missing and infinite value handling
+import pandas as pd  # For the tables to write
+from openpyxl import Workbook  # For write-only workbooks
+from openpyxl.cell import WriteOnlyCell  # For styled cells in write-only sheets
+from openpyxl.utils import get_column_letter  # To convert column numbers to letters
+
+from .styling import (
+    CELL_STYLE,
+    HEADER_STYLE,
+    INFO_HEADER_STYLE,
+    KEY_STYLE,
+    SUMMARY_KEY_STYLE,
+    SUMMARY_STYLE,
+    add_status_rules,
+    column_ranges,
+    column_widths,
+    register_styles,
+    set_column_widths,
+)
+
+# Number of table rows converted to Excel values at a time
+STREAM_CHUNK_ROWS = 1024
+
+
+def excel_values(series):
+    """
+    Convert a column to the values pandas writes to Excel: Python scalars, with
+    missing values as '' and infinities as 'inf' / '-inf'.
+
+    Parameters:
+    - series: pandas Series.
+
+    Returns:
+    - numpy.ndarray: Object array of the values.
+    """
+    values = series.to_numpy(dtype=object)
+    if pd.api.types.is_float_dtype(series.dtype):
+        numbers = series.to_numpy(dtype=float)
+        values[np.isposinf(numbers)] = 'inf'
+        values[np.isneginf(numbers)] = '-inf'
+    values[pd.isna(series).to_numpy()] = ''
+    return values
+
+
+def _cell_styles(kind, header, num_columns):
+    """
+    Return the style name of every column of a row of a sheet of the given kind.
+    """
+    if kind == 'info':
+        return [INFO_HEADER_STYLE if header else CELL_STYLE] * num_columns
+    if kind == 'summary':
+        return [SUMMARY_KEY_STYLE] + [SUMMARY_KEY_STYLE if header else SUMMARY_STYLE] * (num_columns - 1)
+    if header:
+        return [HEADER_STYLE] * num_columns
+    return [KEY_STYLE] + [CELL_STYLE] * (num_columns - 1)
+
+
+def _styled_row(worksheet, styles, values):
+    """
+    Yield one styled write-only cell per value.
+    """
+    for style, value in zip(styles, values):
+        cell = WriteOnlyCell(worksheet, value)
+        cell.style = style
+        yield cell
+
+
+def _excel_rows(df, chunk_rows):
+    """
+    Yield the rows of a table as the values pandas writes to Excel, converting the
+    typed columns chunk_rows rows at a time.
+    """
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        yield from zip(*(excel_values(chunk.iloc[:, j]) for j in range(chunk.shape[1])))
+
+
+def write_workbook_streaming(output_file, sheets, chunk_rows=STREAM_CHUNK_ROWS):
+    """
+    Write the report sheets in openpyxl's write-only mode.
+
+    The rows are sent to the file one by one, so the workbook never holds the cell
+    objects of a whole sheet: memory stays flat whatever the number of boards, units
+    and tests. The column widths, the autofilter range and the conditional formatting
+    ranges are computed from the tables. Headers, named styles, status colours and
+    the panes frozen at G2 are the same as in the normal writer. The values are
+    taken from the typed columns chunk_rows rows at a time, so only one chunk of a
+    table is ever held as Python objects.
+
+    Parameters:
+    - output_file: Path of the workbook to write.
+    - sheets: ReportSheet tuples, as returned by pipeline.report_sheets.
+    - chunk_rows: Number of table rows converted to Excel values at a time.
+
+    Returns:
+    - None
+    """
+    workbook = Workbook(write_only=True)
+    register_styles(workbook)
+
+    for sheet in sheets:
+        worksheet = workbook.create_sheet(sheet.name)
+        num_columns = max(len(df.columns) for df in sheet.tables)
+
+        set_column_widths(worksheet, column_widths(sheet.tables))
+
+        if sheet.kind != 'info':
+            num_rows = sum(len(df) + 1 for df in sheet.tables)
+            worksheet.auto_filter.ref = f'A1:{get_column_letter(num_columns)}{num_rows}'
+        if sheet.kind == 'table':
+            worksheet.freeze_panes = 'G2'
+            df = sheet.tables[0]
+            add_status_rules(worksheet, column_ranges(df.columns, len(df), sheet.status_columns), sheet.statuses)
+
+        for t, df in enumerate(sheet.tables):
+            if t > 0:
+                worksheet.append([])  # Blank row between the tables
+
+            worksheet.append(_styled_row(worksheet, _cell_styles(sheet.kind, True, len(df.columns)), df.columns))
+
+            styles = _cell_styles(sheet.kind, False, len(df.columns))
+            for row in _excel_rows(df, chunk_rows):
+                worksheet.append(_styled_row(worksheet, styles, row))
+
+    workbook.save(output_file)
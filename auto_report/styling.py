@@ -0,0 +1,227 @@
+import numpy as np  # For vectorized string lengths
+import pandas as pd  # For the tables to measure
+from openpyxl.formatting.rule import CellIsRule  # For status colouring rules
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side  # For shared cell styles
+from openpyxl.utils import get_column_letter  # To convert column numbers to letters
+
+# Fill colours of the result cells
+STATUS_FILLS = {
+    'Passed': '78e08f',
+    'For check': 'feca57',
+    'Failed': 'ea8685',
+    'Good capable': '78e08f',
+    'Not capable': 'ea8685',
+    'N/A': '95afc0',
+}
+
+# Header fill colours of the data sheets and of the 'Info' sheet
+HEADER_FILL = '82ccdd'
+INFO_HEADER_FILL = '74b9ff'
+
+# Names of the shared cell styles registered in the workbook
+CELL_STYLE = 'Report Cell'
+KEY_STYLE = 'Report Key'
+HEADER_STYLE = 'Report Header'
+INFO_HEADER_STYLE = 'Report Info Header'
+SUMMARY_STYLE = 'Report Summary Cell'
+SUMMARY_KEY_STYLE = 'Report Summary Key'
+
+
+def _solid_fill(color):
+    return PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+
+def register_styles(workbook):
+    """
+    Add the named cell styles of the report to a workbook.
+
+    Every cell of the report uses one of these styles, so the workbook stores six
+    styles instead of one style object per cell. The header styles repeat the bold,
+    centred look pandas gives the header cells.
+
+    Parameters:
+    - workbook: openpyxl Workbook.
+
+    Returns:
+    - None
+    """
+    thin = Side(style='thin')
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    header_alignment = Alignment(horizontal='center', vertical='top')
+    left = Alignment(horizontal='left')
+
+    styles = [
+        NamedStyle(CELL_STYLE, border=border),
+        NamedStyle(KEY_STYLE, border=border, alignment=left),
+        NamedStyle(HEADER_STYLE, border=border, font=Font(bold=True), alignment=header_alignment,
+                   fill=_solid_fill(HEADER_FILL)),
+        NamedStyle(INFO_HEADER_STYLE, border=border, font=Font(bold=True), alignment=header_alignment,
+                   fill=_solid_fill(INFO_HEADER_FILL)),
+        NamedStyle(SUMMARY_STYLE, border=border, alignment=left),
+        NamedStyle(SUMMARY_KEY_STYLE, border=border, font=Font(bold=True), alignment=left),
+    ]
+    for style in styles:
+        if style.name not in workbook.named_styles:
+            workbook.add_named_style(style)
+
+
+def _value_lengths(series):
+    """
+    Return the length of every value of a column as written to Excel (0 for missing values).
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Measure the categories once and look the lengths up by code
+        category_lengths = series.cat.categories.astype(str).str.len().to_numpy()
+        codes = series.cat.codes.to_numpy()
+        return np.where(codes >= 0, category_lengths[codes], 0)
+
+    if series.dtype.kind in 'biuf':
+        # numpy formats floats like str() does ('0.1', '1e-05', 'inf')
+        values = series.to_numpy()
+        lengths = np.char.str_len(values.astype(str))
+        return np.where(np.isnan(values), 0, lengths) if series.dtype.kind == 'f' else lengths
+
+    return series.astype(str).str.len().where(series.notna(), 0).to_numpy()
+
+
+def column_widths(tables):
+    """
+    Compute the column widths of a sheet from the tables written on it.
+
+    A column is as wide as its longest header or value, as written to Excel, plus 2.
+    The lengths are taken column by column with vectorized string operations, so the
+    written worksheet never has to be scanned. Missing values are written as empty
+    cells and count as 0.
+
+    Parameters:
+    - tables: DataFrames written one under the other on the sheet.
+
+    Returns:
+    - list: Width of every column of the sheet, in sheet order.
+    """
+    lengths = []
+    for df in tables:
+        for j, name in enumerate(df.columns):
+            values = _value_lengths(df.iloc[:, j])
+            length = max(len(str(name)), int(values.max()) if len(values) else 0)
+            if j < len(lengths):
+                lengths[j] = max(lengths[j], length)
+            else:
+                lengths.append(length)
+    return [length + 2 for length in lengths]
+
+
+def set_column_widths(worksheet, widths):
+    """
+    Set the width of the columns of a worksheet, starting from column A.
+    """
+    for index, width in enumerate(widths, start=1):
+        worksheet.column_dimensions[get_column_letter(index)].width = width
+
+
+def style_range(worksheet, style_name, min_row, max_row, min_col, max_col):
+    """
+    Apply a named style to a rectangular range of cells.
+    """
+    for row in worksheet.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col):
+        for cell in row:
+            cell.style = style_name
+
+
+def add_status_rules(worksheet, cell_range, statuses):
+    """
+    Colour the cells of a range by their status text with conditional formatting.
+
+    One rule per status covers the whole range, so no cell carries its own fill.
+
+    Parameters:
+    - worksheet: openpyxl Worksheet.
+    - cell_range: Range such as 'B2:AZ300' (several ranges separated by spaces).
+    - statuses: Status texts to colour, keys of STATUS_FILLS.
+
+    Returns:
+    - None
+    """
+    for status in statuses:
+        worksheet.conditional_formatting.add(
+            cell_range,
+            CellIsRule(operator='equal', formula=[f'"{status}"'], fill=_solid_fill(STATUS_FILLS[status])),
+        )
+
+
+def column_ranges(columns, num_rows, names, first_row=2):
+    """
+    Return the space-separated data ranges (e.g. 'K2:K74 P2:P74') of the named columns
+    of a table. Adjacent columns are merged into one range (e.g. 'B2:AU74').
+
+    Parameters:
+    - columns: Column names of the table, in sheet order.
+    - num_rows: Number of data rows of the table.
+    - names: Names of the columns to return the ranges of.
+    - first_row: Sheet row of the first data row.
+
+    Returns:
+    - str: The ranges, in sheet order.
+    """
+    last_row = first_row + max(num_rows, 1) - 1
+    names = set(names)
+
+    # [first, last] column number of every run of adjacent named columns
+    runs = []
+    for index, name in enumerate(columns, start=1):
+        if name in names:
+            if runs and runs[-1][1] == index - 1:
+                runs[-1][1] = index
+            else:
+                runs.append([index, index])
+
+    return ' '.join(f'{get_column_letter(first)}{first_row}:{get_column_letter(last)}{last_row}' for first, last in runs)
+
+
+def style_table_sheet(worksheet):
+    """
+    Style a data sheet: a header row, a left-aligned first column, borders on every
+    cell, an autofilter and the panes frozen at G2.
+    """
+    max_row, max_col = worksheet.max_row, worksheet.max_column
+
+    style_range(worksheet, HEADER_STYLE, 1, 1, 1, max_col)
+    style_range(worksheet, KEY_STYLE, 2, max_row, 1, 1)
+    style_range(worksheet, CELL_STYLE, 2, max_row, 2, max_col)
+
+    worksheet.auto_filter.ref = worksheet.dimensions
+    worksheet.freeze_panes = worksheet['G2']
+
+
+def style_summary_sheet(worksheet):
+    """
+    Style the 'Correlation Summary' sheet: left-aligned bordered cells with a bold first column and an autofilter.
+    """
+    max_row, max_col = worksheet.max_row, worksheet.max_column
+
+    style_range(worksheet, SUMMARY_KEY_STYLE, 1, max_row, 1, 1)
+    style_range(worksheet, SUMMARY_KEY_STYLE, 1, 1, 2, max_col)  # The header keeps the bold pandas look
+    style_range(worksheet, SUMMARY_STYLE, 2, max_row, 2, max_col)
+
+    worksheet.auto_filter.ref = worksheet.dimensions
+
+
+def style_info_sheet(worksheet, product_rows, setup_rows):
+    """
+    Style the 'Info' sheet: the product information table, a blank row and the setup information table.
+
+    Parameters:
+    - worksheet: openpyxl Worksheet.
+    - product_rows: Number of rows of the product information table, without its header.
+    - setup_rows: Number of rows of the setup information table, without its header.
+
+    Returns:
+    - None
+    """
+    max_col = worksheet.max_column
+    setup_header = product_rows + 3
+
+    style_range(worksheet, INFO_HEADER_STYLE, 1, 1, 1, max_col)
+    style_range(worksheet, CELL_STYLE, 2, product_rows + 1, 1, max_col)
+    style_range(worksheet, INFO_HEADER_STYLE, setup_header, setup_header, 1, max_col)
+    style_range(worksheet, CELL_STYLE, setup_header + 1, setup_header + setup_rows, 1, max_col)
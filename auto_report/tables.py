@@ -0,0 +1,101 @@
+import numpy as np  # For numerical operations
+import pandas as pd  # For data manipulation
+
+from .capability import capability_labels
+from .correlation import STATUS_LABELS, board_result_codes
+
+
+def correlation_long_table(limit, correlation):
+    """
+    Build the long-format correlation results: one row per board, unit and test.
+
+    The table is built straight from the (board, unit, test) arrays, so its size and
+    build time grow linearly with boards x units x tests.
+
+    Parameters:
+    - limit: Limits returned by load_limits.
+    - correlation: CorrelationResult returned by compute_correlation.
+
+    Returns:
+    - pandas.DataFrame: The limit columns, 'Board', 'Board Unit', the RB and NB
+      statistics, the criteria, the unit 'Result' and the 'Board Result'.
+    """
+    evaluation = correlation.evaluation
+    num_boards, num_units, num_tests = evaluation['Result'].shape
+    rows = num_boards * num_units * num_tests
+
+    # Repeat the limits of every test for every board and unit
+    table = limit.iloc[:num_tests].iloc[np.tile(np.arange(num_tests), num_boards * num_units)].reset_index(drop=True)
+
+    table['Board'] = np.repeat([f'NB{i+1}' for i in range(num_boards)], num_units * num_tests)
+    table['Board Unit'] = np.tile(np.repeat([f'U{j+1}' for j in range(num_units)], num_tests), num_boards)
+
+    # The RB statistics are compared with every board
+    table['Mean RB'] = np.broadcast_to(correlation.unit_mean[0], (num_boards, num_units, num_tests)).reshape(rows)
+    table['SD RB'] = np.broadcast_to(correlation.unit_std[0], (num_boards, num_units, num_tests)).reshape(rows)
+    table['Mean NB'] = correlation.unit_mean[1:].reshape(rows)
+    table['SD NB'] = correlation.unit_std[1:].reshape(rows)
+
+    table['Delta Mean'] = evaluation['Delta Mean'].reshape(rows)
+    table['Mean Shift'] = evaluation['Mean Shift'].reshape(rows)
+    table['Mean Shift Criteria'] = pd.Categorical.from_codes(evaluation['Mean Shift Criteria'].reshape(rows), STATUS_LABELS)
+    table['SD Ratio'] = evaluation['SD Ratio'].reshape(rows)
+    table['SD Ratio Criteria'] = pd.Categorical.from_codes(evaluation['SD Ratio Criteria'].reshape(rows), STATUS_LABELS)
+    table['Result'] = pd.Categorical.from_codes(evaluation['Result'].reshape(rows), STATUS_LABELS)
+
+    # A test passes on a board when it passes on all the units of the board
+    board_result = board_result_codes(evaluation['Result'])[:, np.newaxis]
+    table['Board Result'] = pd.Categorical.from_codes(
+        np.broadcast_to(board_result, (num_boards, num_units, num_tests)).reshape(rows), STATUS_LABELS)
+
+    return table
+
+
+def cpk_long_table(limit, cpk):
+    """
+    Build the long-format Cpk results: one row per board (RB first) and test.
+
+    Parameters:
+    - limit: Limits returned by load_limits.
+    - cpk: CpkResult returned by compute_cpk.
+
+    Returns:
+    - pandas.DataFrame: The limit columns, 'Board', 'Mean', 'SD', 'Cp', 'Cpk' and 'Cpk Result'.
+    """
+    num_boards, num_tests = cpk.board_mean.shape
+    rows = num_boards * num_tests
+
+    table = limit.iloc[:num_tests].iloc[np.tile(np.arange(num_tests), num_boards)].reset_index(drop=True)
+
+    table['Board'] = np.repeat(['RB'] + [f'NB{i}' for i in range(1, num_boards)], num_tests)
+    table['Mean'] = cpk.board_mean.reshape(rows)
+    table['SD'] = cpk.board_std.reshape(rows)
+    table['Cp'] = cpk.capability['Cp'].reshape(rows)
+    table['Cpk'] = cpk.capability['Cpk'].reshape(rows)
+    table['Cpk Result'] = capability_labels(cpk.capability['Cpk Result'].reshape(rows))
+
+    return table
+
+
+def unit_statistics_table(limit, correlation):
+    """
+    Build the per-unit statistics table: one row per board (RB first), unit and test.
+
+    Parameters:
+    - limit: Limits returned by load_limits.
+    - correlation: CorrelationResult returned by compute_correlation.
+
+    Returns:
+    - pandas.DataFrame: 'Test #', 'Description', 'Board', 'Board Unit', 'Mean' and 'SD'.
+    """
+    num_boards, num_units, num_tests = correlation.unit_mean.shape
+    rows = num_boards * num_units * num_tests
+
+    tests = limit.iloc[:num_tests, :2].iloc[np.tile(np.arange(num_tests), num_boards * num_units)].reset_index(drop=True)
+
+    table = tests.rename(columns=lambda name: str(name).strip())
+    table['Board'] = np.repeat(['RB'] + [f'NB{i}' for i in range(1, num_boards)], num_units * num_tests)
+    table['Board Unit'] = np.tile(np.repeat([f'U{j+1}' for j in range(num_units)], num_tests), num_boards)
+    table['Mean'] = correlation.unit_mean.reshape(rows)
+    table['SD'] = correlation.unit_std.reshape(rows)
+    return table
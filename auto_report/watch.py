@@ -0,0 +1,427 @@
+"""
+Watch-folder daemon: correlation reports generated as the tester datalogs land in a drop directory.
+
+The datalogs are grouped by part from their names, as the tester writes them:
+
+    QRB<part>_U<unit>.CSV           RB datalog of a unit
+    QNB<board><part>_U<unit>.CSV    NB datalog of a unit of board 1, 2, ...
+
+The set of a part is queued as a correlation job once it is complete (every
+NB board has a datalog of every RB unit, or exactly the expected boards x units
+are there) and none of its files changed for `settle` seconds, so a file still
+being copied is never read. The jobs run on a process pool, as in batch.
+
+Every queued set is recorded in a state file with the size and modification
+time of its files, so a restarted watcher skips the sets it already reported
+(a set that failed runs again); a replaced file (e.g. a retest) makes a new set. The directory is watched with
+inotify on Linux and polled elsewhere.
+"""
+
+import ctypes  # For inotify on Linux
+import fnmatch  # For the limit file lookup
+import hashlib  # For the set keys
+import json  # For the state file
+import os  # For directory scans
+import re  # For the datalog names
+import select  # To wait for inotify events
+import sys  # For the platform check
+import tempfile  # For atomic state writes
+import time  # For the settle time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+from .batch import BatchResult, _print_result, failed_result, write_batch_index
+from .cli import resolve_job
+from .incremental import file_fingerprint
+from .pipeline import generate_report
+
+# Datalog names; the part of an NB datalog is only known from the RB datalogs of the part
+RB_PATTERN = re.compile(r'^QRB(?P<part>[^_]+)_U(?P<unit>\d+)\.csv$', re.IGNORECASE)
+NB_PATTERN = re.compile(r'^QNB(?P<board_part>\d[^_]*)_U(?P<unit>\d+)\.csv$', re.IGNORECASE)
+
+# Limit file of a part, looked up in the drop directory when the job does not name one
+LIMIT_PATTERN = '*{part}*limit*.csv'
+
+# inotify events that can complete a set or change one of its files (see inotify(7))
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+WATCH_EVENTS = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# Complete datalog set of a part:
+# - part: Part number of the file names ('4441' for QRB4441_U01.CSV).
+# - rb_file: RB datalog names, one per unit.
+# - nb_file: NB datalog names, one list of units per board.
+DatalogSet = namedtuple('DatalogSet', ['part', 'rb_file', 'nb_file'])
+
+# Memos of a worker process, kept between its jobs, one per part: a rerun of a part
+# recomputes only the units and boards whose files changed (see incremental). Only the
+# parts of the last MEMO_PARTS jobs are kept, so a worker of a watcher that runs for
+# months does not hold the statistics of every part it ever reported.
+MEMO_PARTS = 4
+_memos = OrderedDict()
+
+
+def _part_memo(part):
+    """
+    Return the memo of a part, evicting the memos of the least recently run parts beyond MEMO_PARTS.
+    """
+    memo = _memos.pop(part, {})
+    _memos[part] = memo
+    while len(_memos) > MEMO_PARTS:
+        _memos.popitem(last=False)
+    return memo
+
+
+def group_datalogs(names):
+    """
+    Group datalog file names by part.
+
+    An NB name is matched to the longest part with RB datalogs it ends with, so
+    QNB104441_U01.CSV is board 10 of part 4441 when QRB4441_U01.CSV is there.
+    Board numbers start at 1 and are not zero-padded.
+
+    Parameters:
+    - names: File names in the drop directory.
+
+    Returns:
+    - dict: {part: {'rb': {unit: name}, 'nb': {board: {unit: name}}}}.
+    """
+    groups = {}
+    nb_names = []
+    for name in names:
+        match = RB_PATTERN.match(name)
+        if match:
+            group = groups.setdefault(match['part'], {'rb': {}, 'nb': {}})
+            group['rb'][int(match['unit'])] = name
+            continue
+        match = NB_PATTERN.match(name)
+        if match:
+            nb_names.append((match['board_part'], int(match['unit']), name))
+
+    parts = sorted(groups, key=len, reverse=True)
+    for board_part, unit, name in nb_names:
+        for part in parts:
+            board = board_part[:-len(part)]
+            if board_part.lower().endswith(part.lower()) and board.isdigit() and not board.startswith('0'):
+                groups[part]['nb'].setdefault(int(board), {})[unit] = name
+                break
+
+    return groups
+
+
+def complete_set(part, group, boards=None, units=None):
+    """
+    Return the DatalogSet of a part if it is complete, None otherwise.
+
+    The RB units must be U1..Un and the boards NB1..NBm, every board with a
+    datalog of every RB unit. With boards or units given, exactly that many are
+    required; otherwise the set is complete as soon as it is consistent (and a
+    board that lands later makes a new set).
+
+    Parameters:
+    - part: Part number.
+    - group: Datalogs of the part, as returned by group_datalogs.
+    - boards: Expected number of NB boards, or None.
+    - units: Expected number of units, or None.
+
+    Returns:
+    - DatalogSet or None.
+    """
+    unit_numbers = sorted(group['rb'])
+    board_numbers = sorted(group['nb'])
+    if not unit_numbers or not board_numbers:
+        return None
+    if unit_numbers != list(range(1, len(unit_numbers) + 1)) or (units is not None and len(unit_numbers) != units):
+        return None
+    if board_numbers != list(range(1, len(board_numbers) + 1)) or (boards is not None and len(board_numbers) != boards):
+        return None
+    if any(sorted(group['nb'][board]) != unit_numbers for board in board_numbers):
+        return None
+
+    return DatalogSet(
+        part=part,
+        rb_file=[group['rb'][unit] for unit in unit_numbers],
+        nb_file=[[group['nb'][board][unit] for unit in unit_numbers] for board in board_numbers],
+    )
+
+
+def find_limit_file(directory, part, names):
+    """
+    Return the path of the limit file of a part in the directory, or None.
+    """
+    pattern = LIMIT_PATTERN.format(part=part).lower()
+    matches = sorted(name for name in names if fnmatch.fnmatch(name.lower(), pattern))
+    return os.path.join(directory, matches[0]) if matches else None
+
+
+def set_key(datalog_set, directory, limit_file):
+    """
+    Return a digest of the part, the names, sizes and modification times of the
+    files of a set and of its limit file: it changes whenever a file is replaced.
+    """
+    files = datalog_set.rb_file + [name for board in datalog_set.nb_file for name in board]
+    fingerprints = [file_fingerprint(os.path.join(directory, name)) for name in files]
+    fingerprints.append(file_fingerprint(limit_file))
+    return hashlib.blake2b(repr((datalog_set.part, fingerprints)).encode(), digest_size=16).hexdigest()
+
+
+def load_state(state_file):
+    """
+    Read the sets of a watch state file. Only the reported sets are kept: sets
+    queued but never finished (the watcher stopped first) and sets that failed
+    (e.g. a file still locked by the copier) are left out, so they run again.
+
+    Returns:
+    - dict: {set key: record} of the reported sets.
+    """
+    if not os.path.exists(state_file):
+        return {}
+    with open(state_file) as f:
+        sets = json.load(f).get('sets', {})
+    return {key: record for key, record in sets.items() if record.get('status') == 'ok'}
+
+
+def save_state(state_file, sets):
+    """
+    Write the sets of the watcher to its state file, atomically.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(state_file)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'sets': sets}, f, indent=1)
+        os.replace(tmp_path, state_file)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def open_inotify(directory):
+    """
+    Return an inotify file descriptor watching the directory for new, written,
+    moved and deleted files, or None where inotify is not available.
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_EVENTS) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def wait_for_changes(fd, timeout):
+    """
+    Wait up to timeout seconds, returning early when an inotify event arrives on
+    fd (with fd None, only wait). The pending events are read and dropped: the
+    directory is scanned again after every wait anyway.
+    """
+    if fd is None:
+        time.sleep(timeout)
+        return
+
+    ready, _, _ = select.select([fd], [], [], timeout)
+    while ready:
+        try:
+            if not os.read(fd, 65536):
+                break
+        except BlockingIOError:
+            break
+
+
+def _run_set(name, part, inputs, options):
+    """
+    Run the job of one set in a worker process. Any error is returned as a failed BatchResult, never raised.
+    """
+    start = time.perf_counter()
+    try:
+        output = generate_report(**inputs, memo=_part_memo(part), **options)
+    except Exception as e:
+        return failed_result(name, inputs, e, time.perf_counter() - start)
+    return BatchResult(name, inputs['product_info']['Test Card Name'], 'ok', output, time.perf_counter() - start, '')
+
+
+def _fill_part(value, part):
+    """
+    Replace '{part}' by the part number in the strings of a job template.
+    """
+    if isinstance(value, str):
+        return value.replace('{part}', part)
+    if isinstance(value, dict):
+        return {key: _fill_part(item, part) for key, item in value.items()}
+    return value
+
+
+def watch_folder(drop_dir, template, output_dir, state_file=None, index_file=None, boards=None, units=None,
+                 settle=30.0, poll=5.0, max_workers=None, once=False, **options):
+    """
+    Watch a drop directory and generate the report of every complete datalog set.
+
+    Parameters:
+    - drop_dir: Directory the tester datalogs are copied to.
+    - template: Job dictionary (see cli) without 'rb' and 'nb'; '{part}' in its strings
+                is replaced by the part number of the set. Without 'limit', the limit
+                file is the '*<part>*limit*.csv' file of the drop directory.
+    - output_dir: Directory of the reports; each set gets a '<part>_<date-time>_<key>' subdirectory.
+    - state_file: Record of the processed sets (default: watch_state.json in output_dir).
+    - index_file: Roll-up index of the jobs (default: watch_index.csv in output_dir).
+    - boards: Number of NB boards of a complete set, or None to take any consistent set.
+    - units: Number of units of a complete set, or None.
+    - settle: Seconds a set's files must stay unchanged before it is queued.
+    - poll: Longest wait in seconds between two scans of the directory.
+    - max_workers: Number of worker processes (None for one per CPU).
+    - once: Stop once the sets complete at start-up are reported, instead of watching forever.
+    - options: Other keyword arguments of generate_report applied to every job (cache_dir, layout, ...).
+
+    Returns:
+    - list: BatchResult of every job run by this call.
+    """
+    drop_dir = os.path.abspath(drop_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    state_file = state_file or os.path.join(output_dir, 'watch_state.json')
+    index_file = index_file or os.path.join(output_dir, 'watch_index.csv')
+
+    sets = load_state(state_file)
+    seen = {}        # File name -> (size and modification time, when they were first seen)
+    running = {}     # Future -> set key
+    waiting = set()  # Parts already reported as waiting for their limit file
+    results = []
+
+    def finish(future):
+        # Record the result of a finished job in the state; return True if its worker process died
+        key = running.pop(future)
+        try:
+            result = future.result()
+        except KeyboardInterrupt:
+            # The worker got the Ctrl+C of the watcher: the set stays queued, so it runs again at the next start
+            return False
+        except Exception as e:  # BrokenProcessPool
+            result = failed_result(sets[key]['name'], {}, e)
+        sets[key].update(result._asdict())
+        results.append(result)
+        _print_result(result)
+        return isinstance(future.exception(), BrokenProcessPool)
+
+    fd = open_inotify(drop_dir)
+    print(f"Watching '{drop_dir}' ({'inotify' if fd is not None else f'polling every {poll:g} s'}), "
+          f"{len(sets)} set(s) already processed")
+
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            # Scan the directory and note since when each file is unchanged
+            now = time.monotonic()
+            names = set()
+            for entry in os.scandir(drop_dir):
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                signature = (stat.st_size, stat.st_mtime_ns)
+                if entry.name not in seen or seen[entry.name][0] != signature:
+                    seen[entry.name] = (signature, now)
+                names.add(entry.name)
+            seen = {name: value for name, value in seen.items() if name in names}
+
+            changed = False
+            settling = False
+            for part, group in group_datalogs(names).items():
+                datalog_set = complete_set(part, group, boards, units)
+                if datalog_set is None:
+                    continue
+
+                files = datalog_set.rb_file + [name for board in datalog_set.nb_file for name in board]
+                if any(now - seen[name][1] < settle for name in files):
+                    settling = True
+                    continue
+
+                job = _fill_part(template, part)
+                limit_file = (os.path.join(drop_dir, job['limit']) if job.get('limit')
+                              else find_limit_file(drop_dir, part, names))
+                if limit_file is None or not os.path.exists(limit_file):
+                    if part not in waiting:
+                        print(f"[{part}] Datalog set complete, waiting for its limit file")
+                        waiting.add(part)
+                    continue
+                waiting.discard(part)
+
+                # A limit file dropped with the datalogs must have settled too
+                limit_name = os.path.relpath(limit_file, drop_dir)
+                if limit_name in seen and now - seen[limit_name][1] < settle:
+                    settling = True
+                    continue
+
+                try:
+                    key = set_key(datalog_set, drop_dir, limit_file)
+                except OSError:  # A file was removed since the scan
+                    continue
+                if key in sets:
+                    continue
+
+                changed = True
+                name = f"{part}_{datetime.now():%Y%m%d-%H%M%S}_{key[:6]}"
+                job.update(rb=datalog_set.rb_file, nb=datalog_set.nb_file, limit=limit_file,
+                           output_dir=os.path.join(output_dir, name))
+                sets[key] = {'name': name, 'part': part, 'files': files, 'status': 'queued',
+                             'queued': datetime.now().isoformat(timespec='seconds')}
+                try:
+                    inputs = resolve_job(job, drop_dir)
+                    os.makedirs(inputs['output_dir'], exist_ok=True)
+                except Exception as e:
+                    result = failed_result(name, job, e)
+                    sets[key].update(result._asdict())
+                    results.append(result)
+                    _print_result(result)
+                    continue
+
+                print(f"[{name}] Queued {len(datalog_set.nb_file)} NB x {len(datalog_set.rb_file)} units")
+                running[executor.submit(_run_set, name, part, inputs, options)] = key
+
+            # Record the finished jobs; a pool whose worker died is replaced for the next jobs
+            done = [future for future in running if future.done()]
+            broken = [finish(future) for future in done]
+            if any(broken):
+                executor.shutdown(wait=False)
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            if done or changed:
+                save_state(state_file, sets)
+            if done:
+                write_batch_index([BatchResult(**{field: record[field] for field in BatchResult._fields})
+                                   for record in sets.values() if record['status'] != 'queued'], index_file)
+
+            if once and not running and not settling:
+                return results
+
+            # Wake up for new files, for the next settled set and for the next finished job
+            timeout = poll
+            if settling:
+                timeout = min(timeout, settle / 4)
+            if running:
+                timeout = min(timeout, 1.0)
+            wait_for_changes(fd, timeout)
+    finally:
+        # Let the running jobs finish and record them; the queued ones run again at the next start.
+        # A second Ctrl+C while waiting still saves the state of the jobs already recorded.
+        try:
+            executor.shutdown(wait=True, cancel_futures=True)
+            for future in list(running):
+                if future.cancelled():
+                    running.pop(future)
+                else:
+                    finish(future)
+        finally:
+            try:
+                save_state(state_file, sets)
+            finally:
+                if fd is not None:
+                    os.close(fd)
@@ -0,0 +1,79 @@
+"""
+Benchmark of auto_report.datalog.read_datalog_statistics (per-test statistics read
+in chunks of test rows) against read_datalog followed by the per-unit statistics
+(the whole (test, device) matrix in memory), on a wide characterization datalog.
+
+Both paths are checked to give the same means and standard deviations; the read
+time and the peak traced memory of each are reported.
+
+Usage:
+    python benchmarks/bench_chunked_reader.py --tests 300 --devices 20000 --chunk-rows 32
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auto_report.datalog import read_datalog, read_datalog_statistics  # noqa: E402
+from auto_report.stats import statistics_mean_std, summary_statistics  # noqa: E402
+from bench_datalog_reader import write_datalog  # noqa: E402
+
+
+def full_read(file_path, chunk_rows):
+    datalog = read_datalog(file_path)
+    return statistics_mean_std(summary_statistics(datalog.values, axis=1))
+
+
+def chunked_read(file_path, chunk_rows):
+    return statistics_mean_std(read_datalog_statistics(file_path, chunk_rows).statistics)
+
+
+def measure(read, file_path, chunk_rows):
+    """
+    Return the result, the seconds and the peak traced bytes of one read.
+    """
+    start = time.perf_counter()
+    result = read(file_path, chunk_rows)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    read(file_path, chunk_rows)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tests', type=int, default=200)
+    parser.add_argument('--devices', type=int, default=10000)
+    parser.add_argument('--chunk-rows', type=int, default=32)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, 'QNB1_U01.CSV')
+        write_datalog(file_path, args.tests, args.devices)
+        size = os.path.getsize(file_path)
+
+        full, full_seconds, full_peak = measure(full_read, file_path, args.chunk_rows)
+        chunked, chunked_seconds, chunked_peak = measure(chunked_read, file_path, args.chunk_rows)
+
+    for a, b in zip(full, chunked):
+        np.testing.assert_allclose(a, b, rtol=1e-12)
+
+    print(f"{args.tests} tests x {args.devices} devices ({size / 1024 ** 2:.1f} MiB), chunks of {args.chunk_rows} tests")
+    print("                          time       peak")
+    print(f"whole matrix:         {full_seconds:8.2f} s {full_peak / 1024 ** 2:8.1f} MiB")
+    print(f"chunked statistics:   {chunked_seconds:8.2f} s {chunked_peak / 1024 ** 2:8.1f} MiB")
+    print(f"peak memory ratio:    {full_peak / chunked_peak:8.1f} x")
+
+
+if __name__ == '__main__':
+    main()
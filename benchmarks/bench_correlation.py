@@ -0,0 +1,142 @@
+"""
+Benchmark of the vectorized correlation engine against the row-wise apply path.
+
+The legacy functions below are the DataFrame.apply(axis=1) implementations the
+report generator used before auto_report.correlation existed. Both paths are run
+on the same synthetic statistics, their results are checked to be identical and
+the timings are printed.
+
+Usage:
+    python benchmarks/bench_correlation.py --tests 2000 --boards 9 --units 9
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auto_report.correlation import evaluate_correlation, status_labels  # noqa: E402
+
+
+def legacy_mean_shift(row, index, limit):
+    row2 = limit.iloc[index]
+    low_limit = float(row2.iloc[2])
+    high_limit = float(row2.iloc[3])
+    if np.isnan(low_limit) or np.isnan(high_limit):
+        return np.nan
+    if row.get('Delta Mean', 0) == 0:
+        return 0
+    return np.round(row['Delta Mean'] / (high_limit - low_limit) * 100, 5)
+
+
+def legacy_mean_shift_crit(row, index, limit):
+    sdlot = limit.iloc[index].iloc[4]
+    if np.isnan(row['Mean Shift']):
+        return "Passed" if row['Delta Mean'] <= sdlot else "For check"
+    return "Passed" if row['Mean Shift'] <= 5 else "Failed"
+
+
+def legacy_sd_ratio(row):
+    if row.iloc[1] == 0 or row.iloc[3] == 0:
+        return 0
+    return np.round(row.iloc[3] / row.iloc[1], 6)
+
+
+def legacy_eva_status(row):
+    if row['Mean Shift Criteria'] == "Passed" and row['SD Ratio Criteria'] == "Passed":
+        return "Passed"
+    elif row['Mean Shift Criteria'] == "Failed":
+        return "Failed"
+    return "For check"
+
+
+def make_inputs(num_tests, num_boards, num_units, seed=0):
+    """
+    Build random limits and per-unit statistics shaped like the report inputs.
+    """
+    rng = np.random.default_rng(seed)
+    low = rng.uniform(-10, 0, num_tests)
+    high = low + rng.uniform(0.5, 20, num_tests)
+    # Some tests only have one limit, like the real limit files
+    low[rng.random(num_tests) < 0.1] = np.nan
+    high[rng.random(num_tests) < 0.1] = np.nan
+    limit = pd.DataFrame({
+        'Test #': np.arange(num_tests).astype(str),
+        'Description': [f'TEST {k}' for k in range(num_tests)],
+        'Low_Limit': low,
+        'High_Limit': high,
+        'StdDev': rng.uniform(0.01, 0.5, num_tests),
+        'Unit': 'V',
+    })
+    rb_mean = np.round(rng.normal(0, 1, (num_units, num_tests)), 6)
+    rb_sd = np.round(rng.uniform(0, 0.3, (num_units, num_tests)), 5)
+    nb_mean = np.round(rb_mean + rng.normal(0, 0.3, (num_boards, num_units, num_tests)), 6)
+    nb_sd = np.round(rng.uniform(0, 0.4, (num_boards, num_units, num_tests)), 5)
+    return limit, rb_mean, rb_sd, nb_mean, nb_sd
+
+
+def run_legacy(limit, rb_mean, rb_sd, nb_mean, nb_sd):
+    results = []
+    for i in range(nb_mean.shape[0]):
+        for j in range(nb_mean.shape[1]):
+            df = pd.DataFrame({'a': rb_mean[j], 'b': rb_sd[j], 'c': nb_mean[i, j], 'd': nb_sd[i, j]})
+            df['Delta Mean'] = df.apply(lambda row: np.round(abs(row.iloc[2] - row.iloc[0]), 6), axis=1)
+            df['Mean Shift'] = df.apply(lambda row: legacy_mean_shift(row, row.name, limit), axis=1)
+            df['Mean Shift Criteria'] = df.apply(lambda row: legacy_mean_shift_crit(row, row.name, limit), axis=1)
+            df['SD Ratio'] = df.apply(legacy_sd_ratio, axis=1)
+            df['SD Ratio Criteria'] = df.apply(lambda row: "Passed" if row["SD Ratio"] <= 1.5 else "For check", axis=1)
+            df['Result'] = df.apply(legacy_eva_status, axis=1)
+            results.append(df)
+    return results
+
+
+def run_vectorized(limit, rb_mean, rb_sd, nb_mean, nb_sd):
+    return evaluate_correlation(
+        rb_mean, rb_sd, nb_mean, nb_sd,
+        limit.iloc[:, 2].to_numpy(dtype=float),
+        limit.iloc[:, 3].to_numpy(dtype=float),
+        limit.iloc[:, 4].to_numpy(dtype=float),
+    )
+
+
+def check_identical(legacy, evaluation, num_units):
+    for k, df in enumerate(legacy):
+        i, j = divmod(k, num_units)
+        for key in ('Delta Mean', 'Mean Shift', 'SD Ratio'):
+            np.testing.assert_array_equal(df[key].to_numpy(dtype=float), evaluation[key][i, j])
+        for key in ('Mean Shift Criteria', 'SD Ratio Criteria', 'Result'):
+            assert (df[key].to_numpy() == status_labels(evaluation[key][i, j])).all(), key
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tests', type=int, default=1000)
+    parser.add_argument('--boards', type=int, default=3)
+    parser.add_argument('--units', type=int, default=4)
+    args = parser.parse_args()
+
+    inputs = make_inputs(args.tests, args.boards, args.units)
+
+    start = time.perf_counter()
+    legacy = run_legacy(*inputs)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    evaluation = run_vectorized(*inputs)
+    vectorized_time = time.perf_counter() - start
+
+    check_identical(legacy, evaluation, args.units)
+
+    print(f"{args.tests} tests x {args.boards} boards x {args.units} units")
+    print(f"apply path:      {legacy_time:10.4f} s")
+    print(f"vectorized path: {vectorized_time:10.4f} s")
+    print(f"speedup:         {legacy_time / vectorized_time:10.1f} x")
+
+
+if __name__ == '__main__':
+    main()
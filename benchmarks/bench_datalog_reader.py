@@ -0,0 +1,81 @@
+"""
+Benchmark of auto_report.datalog.read_datalog against the per-file path it replaced
+(pd.read_csv followed by process_dataframes: dropna, set_index, transpose, astype).
+
+A synthetic datalog in the tester layout is written to a temporary directory, read
+by both paths, checked to give identical values and timed.
+
+Usage:
+    python benchmarks/bench_datalog_reader.py --tests 2000 --devices 500
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auto_report.datalog import read_datalog  # noqa: E402
+
+
+def legacy_read(file_path):
+    df = pd.read_csv(file_path)
+    df = df.dropna(thresh=df.shape[1] - 1)
+    df = df.set_index('Description')
+    df = df.drop(df.columns[0], axis=1)
+    df = df.T
+    df = df.drop(index='Units', errors='ignore')
+    df = df.reset_index(drop=True)
+    return df.astype(float)
+
+
+def write_datalog(file_path, num_tests, num_devices, seed=0):
+    """
+    Write a datalog with the header, tab-prefixed test numbers and footer of the tester files.
+    """
+    rng = np.random.default_rng(seed)
+    values = rng.normal(0, 100, (num_tests, num_devices)).round(4)
+    with open(file_path, 'w') as f:
+        f.write('\n')
+        f.write(','.join(['Test #', 'Description'] + [f'Device #{d + 1}' for d in range(num_devices)] + ['Units']) + '\n')
+        for t in range(num_tests):
+            f.write(f'\t{t}.0,"TEST {t}",' + ','.join(map(str, values[t])) + ',mV\n')
+        f.write('\nDLOG Files:\nC:\\datalogs\\synthetic.dl\n\nPasses: Included\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tests', type=int, default=1000)
+    parser.add_argument('--devices', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, 'QNB1_U01.CSV')
+        write_datalog(file_path, args.tests, args.devices)
+
+        legacy_times, reader_times = [], []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            legacy = legacy_read(file_path)
+            legacy_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            datalog = read_datalog(file_path)
+            reader_times.append(time.perf_counter() - start)
+
+    np.testing.assert_array_equal(legacy.to_numpy(), datalog.values.T)
+
+    print(f"{args.tests} tests x {args.devices} devices (best of {args.repeat})")
+    print(f"read_csv + process_dataframes: {min(legacy_times):10.4f} s")
+    print(f"read_datalog:                  {min(reader_times):10.4f} s")
+    print(f"speedup:                       {min(legacy_times) / min(reader_times):10.1f} x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark of the report styling in auto_report.styling (named styles applied to
+ranges and conditional formatting for the statuses) against the per-cell loops it
+replaced (a new PatternFill per status cell and a Border on every cell).
+
+Synthetic 'NB# Correlation Results' sheets are written with pandas, styled by both
+paths and saved; the write and styling times (and, with --memory, the peak traced
+memory) are reported.
+
+Usage:
+    python benchmarks/bench_excel_styling.py --tests 2000 --units 9 --boards 3
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from openpyxl.styles import Border, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auto_report.correlation import STATUS_LABELS  # noqa: E402
+from auto_report.styling import add_status_rules, register_styles, style_table_sheet  # noqa: E402
+
+
+def make_sheet(num_tests, num_units, seed=0):
+    """
+    Build a DataFrame with the columns of an 'NB# Correlation Results' sheet.
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'Test #': np.arange(num_tests).astype(str),
+        'Description': [f'TEST {t}' for t in range(num_tests)],
+        'Low_Limit': rng.normal(size=num_tests),
+        'High_Limit': rng.normal(size=num_tests),
+        'StdDev': rng.random(num_tests),
+        'Unit': 'mV',
+        'NB1 Result': np.asarray(STATUS_LABELS, dtype=object)[rng.integers(0, 2, num_tests)],
+    })
+    for j in range(num_units):
+        for name in ('Mean RB', 'SD RB', 'Mean NB', 'SD NB', 'Delta Mean', 'Mean Shift', 'SD Ratio'):
+            df[f'{name} U{j + 1}'] = rng.normal(size=num_tests).round(5)
+        for name in ('Mean Shift Criteria', 'SD Ratio Criteria', 'Result Unit'):
+            df[f'{name} {j + 1}'] = np.asarray(STATUS_LABELS, dtype=object)[rng.integers(0, 3, num_tests)]
+    return df
+
+
+def legacy_style(worksheet, df):
+    for col_index in range(1, len(df.columns)):
+        column_letter = get_column_letter(col_index + 1)
+        for cell in worksheet[column_letter][1:]:
+            value = cell.value
+            if value == "Passed":
+                cell.fill = PatternFill(start_color="78e08f", end_color="78e08f", fill_type="solid")
+            elif value == "For check":
+                cell.fill = PatternFill(start_color="feca57", end_color="feca57", fill_type="solid")
+            elif value == "Failed":
+                cell.fill = PatternFill(start_color="ea8685", end_color="ea8685", fill_type="solid")
+
+    thin_border = Border(left=Side(style='thin'), right=Side(style='thin'),
+                         top=Side(style='thin'), bottom=Side(style='thin'))
+    fill_color = PatternFill(start_color='82ccdd', end_color='82ccdd', fill_type='solid')
+    for column in worksheet.columns:
+        for cell in worksheet[1]:
+            cell.fill = fill_color
+        for cell in column:
+            cell.border = thin_border
+    worksheet.auto_filter.ref = worksheet.dimensions
+    worksheet.freeze_panes = worksheet['G2']
+
+
+def bulk_style(worksheet, df):
+    register_styles(worksheet.parent)
+    style_table_sheet(worksheet)
+    add_status_rules(worksheet, f'B2:{get_column_letter(len(df.columns))}{len(df) + 1}', STATUS_LABELS)
+
+
+def write(file_path, sheets, style, trace_memory=False):
+    """
+    Write, style and save the sheets.
+
+    Returns:
+    - tuple: Total seconds, seconds spent styling, and the peak traced bytes (0
+      unless trace_memory is set, as tracing slows everything down).
+    """
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    styling = 0.0
+    with pd.ExcelWriter(file_path, engine='openpyxl', mode='w') as writer:
+        for i, df in enumerate(sheets):
+            sheet_name = f'NB{i + 1} Correlation Results'
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+            style_start = time.perf_counter()
+            style(writer.sheets[sheet_name], df)
+            styling += time.perf_counter() - style_start
+    seconds = time.perf_counter() - start
+    peak = 0
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return seconds, styling, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tests', type=int, default=1000)
+    parser.add_argument('--units', type=int, default=4)
+    parser.add_argument('--boards', type=int, default=3)
+    parser.add_argument('--memory', action='store_true', help='Also measure the peak memory (slow)')
+    args = parser.parse_args()
+
+    sheets = [make_sheet(args.tests, args.units, seed=i) for i in range(args.boards)]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, style in (('legacy', legacy_style), ('bulk', bulk_style)):
+            file_path = os.path.join(tmp, f'{name}.xlsx')
+            seconds, styling, _ = write(file_path, sheets, style)
+            peak = write(file_path, sheets, style, trace_memory=True)[2] if args.memory else 0
+            results[name] = (seconds, styling, peak)
+
+    cells = sum(df.size + len(df.columns) for df in sheets)
+    print(f"{args.boards} sheets x {args.tests} tests x {len(sheets[0].columns)} columns ({cells} cells)")
+    print("                            total     styling   peak")
+    for label, name in (('per-cell fills and borders:', 'legacy'), ('named styles + rules:      ', 'bulk')):
+        seconds, styling, peak = results[name]
+        print(f"{label} {seconds:8.2f} s {styling:8.2f} s {peak / 1024 ** 2:8.1f} MiB")
+    print(f"speedup (total / styling):   {results['legacy'][0] / results['bulk'][0]:8.1f} x "
+          f"{results['legacy'][1] / results['bulk'][1]:8.1f} x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark of an incremental rerun: the statistics, correlation and Cpk stages of a
+report recomputed from scratch, against a rerun with a memo (and the block cache)
+after one NB unit file was swapped for another.
+
+The rerun is also timed without the memo, from the block cache only. The tables
+of the incremental rerun are checked to be the same as those of a full
+recomputation of the swapped run.
+
+Usage:
+    python benchmarks/bench_incremental.py --boards 6 --units 9 --tests 500 --devices 50
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auto_report.pipeline import compute_correlation, compute_cpk, load_limits, load_statistics  # noqa: E402
+from bench_datalog_reader import write_datalog  # noqa: E402
+
+
+def write_limits(file_path, num_tests):
+    """
+    Write a limit file for the tests of write_datalog.
+    """
+    with open(file_path, 'w') as f:
+        f.write('Test #,Description,Low_Limit,High_Limit,StdDev,Unit\n')
+        for t in range(num_tests):
+            f.write(f'{t}.0,TEST {t},-400.0,400.0,100.0,mV\n')
+
+
+def run(limit, rb_files, nb_files, cache_dir=None, memo=None):
+    """
+    Run the statistics, correlation and Cpk stages and return their results and the seconds they took.
+    """
+    start = time.perf_counter()
+    data = load_statistics(rb_files, nb_files, limit, cache_dir=cache_dir, memo=memo).data
+    correlation = compute_correlation(limit, data, memo=memo)
+    cpk = compute_cpk(limit, correlation, memo=memo)
+    return correlation, cpk, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--boards', type=int, default=6)
+    parser.add_argument('--units', type=int, default=9)
+    parser.add_argument('--tests', type=int, default=500)
+    parser.add_argument('--devices', type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        limit_file = os.path.join(tmp, 'limits.csv')
+        write_limits(limit_file, args.tests)
+        limit = load_limits(limit_file)
+
+        seed = 0
+        rb_files = []
+        for u in range(args.units):
+            rb_files.append(os.path.join(tmp, f'QRB_U{u + 1:02d}.CSV'))
+            write_datalog(rb_files[-1], args.tests, args.devices, seed=seed)
+            seed += 1
+        nb_files = []
+        for b in range(args.boards):
+            nb_files.append([])
+            for u in range(args.units):
+                nb_files[b].append(os.path.join(tmp, f'QNB{b + 1}_U{u + 1:02d}.CSV'))
+                write_datalog(nb_files[b][-1], args.tests, args.devices, seed=seed)
+                seed += 1
+
+        # The swapped file, as picked in the review window
+        swapped = os.path.join(tmp, 'QNB1_U01_retest.CSV')
+        write_datalog(swapped, args.tests, args.devices, seed=seed)
+
+        cache_dir = os.path.join(tmp, 'cache')
+        memo = {}
+        _, _, full_seconds = run(limit, rb_files, nb_files)
+        _, _, first_seconds = run(limit, rb_files, nb_files, cache_dir, memo)
+        _, _, unchanged_seconds = run(limit, rb_files, nb_files, cache_dir, memo)
+
+        nb_files[0][0] = swapped
+        correlation, cpk, swap_seconds = run(limit, rb_files, nb_files, cache_dir, memo)
+        _, _, cache_seconds = run(limit, rb_files, nb_files, cache_dir)
+        expected_correlation, expected_cpk, _ = run(limit, rb_files, nb_files)
+
+    for table, expected in zip(correlation.tables + cpk.tables, expected_correlation.tables + expected_cpk.tables):
+        pd.testing.assert_frame_equal(table, expected)
+
+    print(f"{args.boards} NB + RB x {args.units} units, {args.tests} tests x {args.devices} devices")
+    print(f"full recomputation:         {full_seconds:8.3f} s")
+    print(f"first run with a memo:      {first_seconds:8.3f} s")
+    print(f"rerun, nothing changed:     {unchanged_seconds:8.3f} s")
+    print(f"rerun, one unit file swapped: {swap_seconds:6.3f} s ({full_seconds / swap_seconds:.1f}x faster)")
+    print(f"same, block cache only:     {cache_seconds:8.3f} s (a new process, e.g. a batch rerun)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+"""
+Stage-by-stage benchmark of the report pipeline over a grid of run sizes.
+
+For every combination of test count, device count and boards x units, synthetic
+datalogs are written with make_datalogs.generate_dataset, then each stage is
+timed on its own (best of --repeat runs, parse cache off):
+
+    limits       load_limits + compile_limits (the limit file cleanup)
+    ingest       read_datalogs (reading and parsing every CSV)
+    align        align_datalogs + build_datalog_tensor (what process_dataframes did)
+    stats        summary_statistics of every board and unit
+    correlation  compute_correlation
+    cpk          compute_cpk
+    summary      build_summary
+    excel        write_report (the styled workbook)
+
+The timings are saved as JSON with the git revision and library versions, so
+two versions can be compared:
+
+    python benchmarks/bench_pipeline.py --output before.json
+    git checkout my-branch
+    python benchmarks/bench_pipeline.py --output after.json --compare before.json
+
+Usage:
+    python benchmarks/bench_pipeline.py --tests 100,1000 --devices 31,300 --layouts 3x4,9x9
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auto_report.align import align_datalogs  # noqa: E402
+from auto_report.ingest import read_datalogs  # noqa: E402
+from auto_report.limits import compile_limits, load_limits  # noqa: E402
+from auto_report.pipeline import build_summary, compute_correlation, compute_cpk, write_report  # noqa: E402
+from auto_report.stats import DEVICE_AXIS, build_datalog_tensor, summary_statistics  # noqa: E402
+from make_datalogs import generate_dataset  # noqa: E402
+
+STAGES = ['limits', 'ingest', 'align', 'stats', 'correlation', 'cpk', 'summary', 'excel']
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def git_revision():
+    """
+    Return the short git revision of the repository ('+' when it has uncommitted changes), or 'unknown'.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=root, capture_output=True,
+                                  text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=root,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return revision + ('+' if dirty else '')
+
+
+def timed(function, repeat):
+    """
+    Call function repeat times and return its last result and the best wall-clock time.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def run_stages(job, output_dir, repeat):
+    """
+    Time every stage of one synthetic run.
+
+    Returns:
+    - dict: Seconds per stage name.
+    """
+    seconds = {}
+    limits, seconds['limits'] = timed(lambda: compile_limits(load_limits(job['limit'])), repeat)
+    (rb, nb, _), seconds['ingest'] = timed(lambda: read_datalogs(job['rb'], job['nb']), repeat)
+    tensor, seconds['align'] = timed(lambda: build_datalog_tensor(align_datalogs(limits, rb, nb)[0]), repeat)
+    statistics, seconds['stats'] = timed(lambda: summary_statistics(tensor, DEVICE_AXIS), repeat)
+    correlation, seconds['correlation'] = timed(lambda: compute_correlation(limits, statistics), repeat)
+    cpk, seconds['cpk'] = timed(lambda: compute_cpk(limits, correlation), repeat)
+    summary, seconds['summary'] = timed(lambda: build_summary(job['product_info'], correlation), repeat)
+
+    output_file = os.path.join(output_dir, 'report.xlsx')
+    _, seconds['excel'] = timed(lambda: write_report(output_file, job['product_info'], job['setup_info'],
+                                                     correlation, cpk, summary, limit=limits.table), repeat)
+    return seconds
+
+
+def parse_list(text, kind=int):
+    return [kind(value) for value in text.split(',') if value]
+
+
+def parse_layout(text):
+    boards, units = text.lower().split('x')
+    return int(boards), int(units)
+
+
+def size_key(record):
+    return (record['tests'], record['devices'], record['boards'], record['units'])
+
+
+def print_results(records, previous=None):
+    """
+    Print the seconds of every stage per run size, with the ratio to a previous result file when given.
+    """
+    old = {size_key(record): record for record in previous['results']} if previous else {}
+
+    print(f"{'tests':>6} {'devices':>7} {'NBxU':>6}  " + ' '.join(f'{stage:>11}' for stage in STAGES + ['total']))
+    for record in records:
+        size = f"{record['tests']:>6} {record['devices']:>7} {record['boards']:>3}x{record['units']:<2}  "
+        times = [record['stages'][stage] for stage in STAGES] + [record['total']]
+        print(size + ' '.join(f'{value:11.4f}' for value in times))
+
+        before = old.get(size_key(record))
+        if before is not None:
+            ratios = [before['stages'].get(stage, np.nan) / record['stages'][stage] for stage in STAGES]
+            ratios.append(before['total'] / record['total'])
+            print(f"{'speedup vs ' + previous['revision']:>22}  " + ' '.join(f'{ratio:10.2f}x' for ratio in ratios))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tests', type=parse_list, default=[100, 1000], help="Comma-separated test counts")
+    parser.add_argument('--devices', type=parse_list, default=[31, 300], help="Comma-separated device counts")
+    parser.add_argument('--layouts', type=lambda text: [parse_layout(value) for value in text.split(',')],
+                        default=[(3, 4), (9, 9)], help="Comma-separated NBxUNITS sizes, e.g. 3x4,9x9")
+    parser.add_argument('--repeat', type=int, default=1, help="Runs per stage; the best time is kept")
+    parser.add_argument('--output', help="Result file (default: benchmarks/results/pipeline_<revision>.json)")
+    parser.add_argument('--compare', help="Result file of another version to compare with")
+    args = parser.parse_args()
+
+    revision = git_revision()
+    records = []
+    for num_tests, num_devices, (num_boards, num_units) in itertools.product(args.tests, args.devices, args.layouts):
+        with tempfile.TemporaryDirectory() as tmp:
+            job = generate_dataset(tmp, num_tests, num_devices, num_boards, num_units)
+            seconds = run_stages(job, tmp, args.repeat)
+        records.append({
+            'tests': num_tests,
+            'devices': num_devices,
+            'boards': num_boards,
+            'units': num_units,
+            'stages': seconds,
+            'total': sum(seconds.values()),
+        })
+        print(f"{num_tests} tests x {num_devices} devices x {num_boards} NB x {num_units} units: "
+              f"{records[-1]['total']:.2f} s", file=sys.stderr)
+
+    result = {
+        'revision': revision,
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'repeat': args.repeat,
+        'results': records,
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f'pipeline_{revision}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(result, f, indent=1)
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+
+    print_results(records, previous)
+    print(f"Results written to '{output}'")
+
+
+if __name__ == '__main__':
+    main()
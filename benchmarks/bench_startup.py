@@ -0,0 +1,162 @@
+"""
+Start-up benchmark: how long each entry point takes before it does any work,
+every run in a fresh interpreter (best of --repeat runs):
+
+    package      import auto_report (the names are imported lazily)
+    cli help     python -m auto_report --help (headless path, no pipeline import)
+    gui help     python Auto_Report_Gen-GUI.py --help (the GUI script run headless)
+    gui banner   Auto_Report_Gen-GUI.py --no-pause until the banner is printed (the
+                 pipeline is not imported before the report is written, so
+                 nothing is left loading in the background)
+    pipeline     import auto_report.pipeline (pandas and numpy, for the first stage)
+    writer       import of the pipeline and the workbook writer (openpyxl)
+    eager        the pipeline, the writer and tkinter, all imported up front as
+                 the GUI script used to do before showing the banner
+
+The timings are saved as JSON next to those of bench_pipeline.py, so two
+versions can be compared:
+
+    python benchmarks/bench_startup.py --output before.json
+    python benchmarks/bench_startup.py --compare before.json
+
+--importtime lists the slowest imports of the pipeline (python -X importtime).
+
+Usage:
+    python benchmarks/bench_startup.py --repeat 5
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from bench_pipeline import RESULTS_DIR, git_revision
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GUI_SCRIPT = os.path.join(ROOT, 'Auto_Report_Gen-GUI.py')
+
+# First line of the banner text the GUI script prints
+BANNER_TEXT = 'Auto Correlation and Cpk Report Generator'
+
+# Entry point name -> command run to completion
+COMMANDS = {
+    'package': [sys.executable, '-c', 'import auto_report'],
+    'cli help': [sys.executable, '-m', 'auto_report', '--help'],
+    'gui help': [sys.executable, GUI_SCRIPT, '--help'],
+    'pipeline': [sys.executable, '-c', 'import auto_report.pipeline'],
+    'writer': [sys.executable, '-c', 'import auto_report.pipeline, auto_report.streaming, auto_report.styling'],
+    'eager': [sys.executable, '-c', 'import auto_report.pipeline, auto_report.streaming, auto_report.styling; '
+                                    'import tkinter, tkinter.messagebox, tkinter.simpledialog, '
+                                    'tkinter.filedialog, tkinter.ttk'],
+}
+ENTRY_POINTS = ['package', 'cli help', 'gui help', 'gui banner', 'pipeline', 'writer', 'eager']
+
+
+def environment():
+    """
+    Return the environment of the child processes: the repository on the path and unbuffered output.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = ROOT + os.pathsep + env.get('PYTHONPATH', '')
+    env['PYTHONUNBUFFERED'] = '1'
+    return env
+
+
+def time_command(command):
+    """
+    Return the seconds a command takes to run to completion. The exit code is not
+    checked, so versions without an entry point (e.g. the GUI script before it took
+    arguments, which stops at the 'Enter' prompt) can still be compared.
+    """
+    start = time.perf_counter()
+    subprocess.run(command, cwd=ROOT, env=environment(), stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def time_banner():
+    """
+    Return the seconds the GUI script takes to print its banner, then stop it at the 'Enter' prompt.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, GUI_SCRIPT, '--no-pause'], cwd=ROOT, env=environment(),
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        for line in process.stdout:
+            if BANNER_TEXT in line:
+                return time.perf_counter() - start
+        raise RuntimeError('The GUI script exited without printing its banner')
+    finally:
+        process.kill()
+        process.wait()
+
+
+def slowest_imports(statement, count=15):
+    """
+    Return the (cumulative microseconds, module) of the slowest imports of a statement.
+    """
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], cwd=ROOT, env=environment(),
+                            capture_output=True, text=True, check=True).stderr
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        imports.append((int(cumulative), module.rstrip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per entry point; the best time is kept")
+    parser.add_argument('--output', help="Result file (default: benchmarks/results/startup_<revision>.json)")
+    parser.add_argument('--compare', help="Result file of another version to compare with")
+    parser.add_argument('--importtime', action='store_true', help="List the slowest imports of the pipeline")
+    args = parser.parse_args()
+
+    seconds = {}
+    for name in ENTRY_POINTS:
+        if name == 'gui banner':
+            seconds[name] = min(time_banner() for _ in range(args.repeat))
+        else:
+            seconds[name] = min(time_command(COMMANDS[name]) for _ in range(args.repeat))
+
+    revision = git_revision()
+    result = {
+        'revision': revision,
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'seconds': seconds,
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f'startup_{revision}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(result, f, indent=1)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)['seconds']
+
+    for name in ENTRY_POINTS:
+        line = f"{name:<11} {seconds[name]:8.3f} s"
+        if name in previous:
+            line += f"   {previous[name]:8.3f} s before ({previous[name] / seconds[name]:.2f}x)"
+        print(line)
+
+    if args.importtime:
+        print("\nSlowest imports of auto_report.pipeline (cumulative):")
+        for cumulative, module in slowest_imports('import auto_report.pipeline'):
+            print(f"{cumulative / 1000:9.1f} ms  {module}")
+
+    print(f"Results written to '{output}'")
+
+
+if __name__ == '__main__':
+    main()
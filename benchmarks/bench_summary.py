@@ -0,0 +1,95 @@
+"""
+Benchmark of the correlation summary tally: build_summary (one bincount pass over
+the status codes) against the legacy build, which scanned every result column of
+every board with .str.contains once per status.
+
+Both summaries are built from the same correlation results of synthetic
+statistics and checked to be identical.
+
+Usage:
+    python benchmarks/bench_summary.py --tests 5000 --boards 9 --units 9
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auto_report.pipeline import build_summary, check_value, compute_correlation  # noqa: E402
+from auto_report.stats import SummaryStats  # noqa: E402
+from bench_correlation import make_inputs  # noqa: E402
+
+
+def legacy_build_summary(product_info, correlation):
+    num_boards = len(correlation.results)
+    num_units = correlation.unit_mean.shape[1]
+    results = correlation.results
+
+    corrtable = pd.DataFrame()
+    corrtable['Test Card'] = [f"{product_info['Test Card Name']}_NB{i+1}" for i in range(num_boards)]
+    corrtable['Passed test all units'] = [results[i][f"NB{i+1} Result"].str.contains('Passed').sum() for i in range(num_boards)]
+    corrtable['For Check test all units'] = [results[i][f"NB{i+1} Result"].str.contains('For check').sum() for i in range(num_boards)]
+    corrtable['Failed test all units'] = [results[i][f"NB{i+1} Result"].str.contains('Failed').sum() for i in range(num_boards)]
+    for j in range(num_units):
+        corrtable[f'Passed test U{j+1}'] = [results[i][f"Result NB{i+1} U{j+1}"].str.contains('Passed').sum() for i in range(num_boards)]
+        corrtable[f'For Check test U{j+1}'] = [results[i][f"Result NB{i+1} U{j+1}"].str.contains('For check').sum() for i in range(num_boards)]
+        corrtable[f'Failed test U{j+1}'] = [results[i][f"Result NB{i+1} U{j+1}"].str.contains('Failed').sum() for i in range(num_boards)]
+    corrtable['Total test'] = len(results[0])
+    corrtable['Remarks'] = check_value(corrtable['Failed test all units'])
+
+    corrtable.set_index('Test Card', inplace=True)
+    corrtable = corrtable.T
+    corrtable.rename_axis("Test Card", axis=0, inplace=True)
+    corrtable.rename_axis("Index", axis=1, inplace=True)
+    corrtable.reset_index(inplace=True)
+    return corrtable
+
+
+def make_correlation(num_tests, num_boards, num_units):
+    """
+    Run compute_correlation on synthetic unit statistics.
+    """
+    limit, rb_mean, rb_sd, nb_mean, nb_sd = make_inputs(num_tests, num_boards, num_units)
+    mean = np.concatenate([rb_mean[np.newaxis], nb_mean])
+    std = np.concatenate([rb_sd[np.newaxis], nb_sd])
+    count = np.full(mean.shape, 30.0)
+    return compute_correlation(limit, SummaryStats(count, mean, std ** 2 * count))
+
+
+def best_time(function, *args, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tests', type=int, default=5000)
+    parser.add_argument('--boards', type=int, default=9)
+    parser.add_argument('--units', type=int, default=9)
+    args = parser.parse_args()
+
+    product_info = {'Test Card Name': 'TC1'}
+    correlation = make_correlation(args.tests, args.boards, args.units)
+
+    legacy, legacy_time = best_time(legacy_build_summary, product_info, correlation)
+    summary, tally_time = best_time(build_summary, product_info, correlation)
+
+    pd.testing.assert_frame_equal(legacy, summary)
+
+    print(f"{args.tests} tests x {args.boards} boards x {args.units} units")
+    print(f"str.contains scans: {legacy_time:10.4f} s")
+    print(f"bincount tally:     {tally_time:10.4f} s")
+    print(f"speedup:            {legacy_time / tally_time:10.1f} x")
+
+
+if __name__ == '__main__':
+    main()
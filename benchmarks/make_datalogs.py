@@ -0,0 +1,198 @@
+"""
+Synthetic tester datalogs and limit files, for scaling runs beyond the 'Sample data' set.
+
+Writes one RB and num_boards NB sets of num_units datalogs in the layout of the
+tester exports (a blank line, the 'Test #, Description, Device #1 ... Device #n,
+Units' header, tab-prefixed test numbers and the 'DLOG Files' footer), a matching
+reference lot limit file (' Test #, Description, Low_Limit, High_Limit, StdDev,
+Unit', some tests with one or no limit) and a job file for `python -m auto_report`.
+
+The files are named like the sample set (QRB4441_U01.CSV, QNB14441_U01.CSV, ...).
+Every test has a nominal value and a device spread; every unit and every NB board
+gets a small offset of its own, so most tests pass and a few need checking.
+
+Usage:
+    python benchmarks/make_datalogs.py out_dir --tests 2000 --devices 300 --boards 9 --units 9
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+# Measurement units and the range of the nominal values of their tests
+UNIT_RANGES = {
+    'V': (0.5, 30.0),
+    'mV': (-1000.0, 1000.0),
+    'uA': (-50.0, 200.0),
+    'mA': (-400.0, 400.0),
+    'nS': (20.0, 500.0),
+    'OHM': (1.0, 100.0),
+}
+
+# Words the test descriptions are made of
+DESCRIPTION_NAMES = ['VIN', 'DRVCC', 'BLANK', 'RBLANK', 'IBLANK', 'TBLANK', 'IVIN', 'GATE', 'SENSE', 'UVLO']
+DESCRIPTION_KINDS = ['CONTINUITY', 'VOLTAGE', 'CURRENT', 'STRESS', 'LINE REG', 'LOAD REG', 'HYSTERESIS', 'DROPOUT']
+
+# Footer the tester writes after the last test
+FOOTER = (
+    '\nDLOG Files:\n{dlog}\n\n'
+    'Alarms: NOT Included!\nFails: NOT Included!\nPasses: Included\nLTX Pre-Retests: NOT Included!\n'
+    'Devices with Invalid wafer map coordinatees: Not Included!\n'
+    'Included Bins: ALL\nIncluded Devices: ALL\nTest Value Filter: OFF\n'
+)
+
+
+def make_tests(num_tests, rng):
+    """
+    Draw the tests of a test program.
+
+    Returns:
+    - dict: Arrays of the test numbers ('1.0', '3.0', '3.1', ...), descriptions, units,
+      nominal values, device spreads, low and high limits (NaN when missing) and lot SDs.
+    """
+    # Test numbers go up in steps, with up to four sub-tests (.0 to .3) per step
+    sub_tests = rng.integers(1, 5, num_tests)
+    numbers = []
+    major = 0
+    for count in sub_tests:
+        major += int(rng.integers(1, 20))
+        numbers.extend(f'{major}.{minor}' for minor in range(count))
+        if len(numbers) >= num_tests:
+            break
+    numbers = np.array(numbers[:num_tests], dtype=object)
+
+    descriptions = np.array([
+        f'{rng.choice(DESCRIPTION_NAMES)} {rng.choice(DESCRIPTION_KINDS)} @{int(rng.integers(1, 30))}V'
+        for _ in range(num_tests)
+    ], dtype=object)
+
+    units = rng.choice(list(UNIT_RANGES), num_tests)
+    low, high = np.array([UNIT_RANGES[unit] for unit in units]).T
+    nominal = rng.uniform(low, high)
+    spread = np.abs(nominal) * rng.uniform(0.001, 0.02, num_tests) + 1e-3
+
+    # Spec window of 6 to 30 device spreads; some tests are one-sided or have no limits
+    window = spread * rng.uniform(6, 30, num_tests)
+    low_limit = nominal - window / 2
+    high_limit = nominal + window / 2
+    low_limit[rng.random(num_tests) < 0.12] = np.nan
+    high_limit[rng.random(num_tests) < 0.12] = np.nan
+
+    return {
+        'numbers': numbers,
+        'descriptions': descriptions,
+        'units': units,
+        'nominal': nominal,
+        'spread': spread,
+        'low_limit': low_limit,
+        'high_limit': high_limit,
+        'sd_lot': spread * rng.uniform(0.8, 1.2, num_tests),
+    }
+
+
+def write_datalog(file_path, tests, values, dlog_name):
+    """
+    Write one datalog: values has one row per test and one column per device.
+    """
+    num_devices = values.shape[1]
+    with open(file_path, 'w') as f:
+        f.write('\n')
+        f.write(','.join(['Test #', 'Description'] + [f'Device #{d + 1}' for d in range(num_devices)] + ['Units']) + '\n')
+        for number, description, unit, row in zip(tests['numbers'], tests['descriptions'], tests['units'], values):
+            f.write(f'\t{number},"{description}",' + ','.join(f'{value:.7g}' for value in row) + f',{unit}\n')
+        f.write(FOOTER.format(dlog=dlog_name))
+
+
+def write_limit_file(file_path, tests):
+    """
+    Write the reference lot limit file of the tests; missing limits are left empty.
+    """
+    def number(value):
+        return '' if np.isnan(value) else f'{value:.6g}'
+
+    with open(file_path, 'w') as f:
+        f.write(' Test #,Description,Low_Limit,High_Limit,StdDev,Unit\n')
+        for k in range(len(tests['numbers'])):
+            f.write(f'"\t{tests["numbers"][k]}",{tests["descriptions"][k]},{number(tests["low_limit"][k])},'
+                    f'{number(tests["high_limit"][k])},{tests["sd_lot"][k]:.4f},{tests["units"][k]}\n')
+
+
+def generate_dataset(output_dir, num_tests=85, num_devices=31, num_boards=3, num_units=4, part='4441', seed=0):
+    """
+    Write the RB and NB datalogs, the limit file and a job file of a synthetic correlation run.
+
+    Parameters:
+    - output_dir: Directory the files are written to (created if needed).
+    - num_tests: Number of tests of every datalog and of the limit file.
+    - num_devices: Number of devices of every datalog.
+    - num_boards: Number of NB boards.
+    - num_units: Number of units of the RB and of every NB.
+    - part: Part number used in the file names.
+    - seed: Random seed; the same arguments always write the same files.
+
+    Returns:
+    - dict: The job written to job.json ('rb', 'nb' and 'limit' are absolute paths).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    tests = make_tests(num_tests, rng)
+
+    limit_file = os.path.join(output_dir, f'LTC{part}_Ref_Lot_Limits.csv')
+    write_limit_file(limit_file, tests)
+
+    nominal = tests['nominal'][:, np.newaxis]
+    spread = tests['spread'][:, np.newaxis]
+
+    rb_files = []
+    nb_files = [[] for _ in range(num_boards)]
+    for board in range(num_boards + 1):
+        # The RB is the reference; every NB is off by a fraction of the device spread
+        board_offset = 0.0 if board == 0 else rng.normal(0, 0.15, (num_tests, 1)) * spread
+        for unit in range(num_units):
+            unit_offset = rng.normal(0, 0.1, (num_tests, 1)) * spread
+            values = nominal + board_offset + unit_offset + rng.normal(0, 1, (num_tests, num_devices)) * spread
+
+            name = f'QRB{part}_U{unit + 1:02d}' if board == 0 else f'QNB{board}{part}_U{unit + 1:02d}'
+            file_path = os.path.join(output_dir, name + '.CSV')
+            write_datalog(file_path, tests, values, f'C:\\datalogs\\{name.replace("_", "")}.dl')
+            if board == 0:
+                rb_files.append(file_path)
+            else:
+                nb_files[board - 1].append(file_path)
+
+    job = {
+        'product_info': {'Test Card Name': f'SYN{part}', 'Part Name': f'LTC{part}', 'Package': 'MSOP',
+                         'Lead Count': '10', 'Description': 'Synthetic datalogs'},
+        'setup_info': {'Tester ID': 'SYN', 'Reference Board': 'RB', 'New Board ID': 'NB',
+                       'Test Program': 'SYNTHETIC'},
+        'rb': [os.path.abspath(path) for path in rb_files],
+        'nb': [[os.path.abspath(path) for path in files] for files in nb_files],
+        'limit': os.path.abspath(limit_file),
+        'output_dir': 'reports',
+    }
+    with open(os.path.join(output_dir, 'job.json'), 'w') as f:
+        json.dump(job, f, indent=1)
+
+    return job
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('output_dir')
+    parser.add_argument('--tests', type=int, default=85)
+    parser.add_argument('--devices', type=int, default=31)
+    parser.add_argument('--boards', type=int, default=3)
+    parser.add_argument('--units', type=int, default=4)
+    parser.add_argument('--part', default='4441')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    generate_dataset(args.output_dir, args.tests, args.devices, args.boards, args.units, args.part, args.seed)
+    print(f"Wrote {args.boards} NB + RB x {args.units} units of {args.tests} tests x {args.devices} devices "
+          f"to '{args.output_dir}' (run: python -m auto_report {os.path.join(args.output_dir, 'job.json')})")
+
+
+if __name__ == '__main__':
+    main()
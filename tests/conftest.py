@@ -0,0 +1,39 @@
+import os
+import sys
+
+import openpyxl
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SAMPLE_DIR = os.path.join(ROOT, 'Sample data')
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# Inputs the baseline report (tests/data/baseline_report.xlsx) was written from by the original script
+PRODUCT_INFO = {'Test Card Name': 'TC1', 'Part Name': 'LTC4441', 'Package': 'MSOP', 'Lead Count': '10',
+                'Description': 'd'}
+SETUP_INFO = {'Tester ID': 'T1', 'Reference Board': 'RB', 'New Board ID': 'NB', 'Test Program': 'TP'}
+
+
+def sheet_values(workbook_path):
+    """
+    Return the cell values of every sheet of a workbook, row by row.
+    """
+    workbook = openpyxl.load_workbook(workbook_path)
+    return {name: [[cell.value for cell in row] for row in workbook[name].iter_rows()]
+            for name in workbook.sheetnames}
+
+
+@pytest.fixture
+def sample_job():
+    """
+    Keyword arguments of generate_report for the 'Sample data' set: 3 NB x 4 units.
+    """
+    return {
+        'product_info': dict(PRODUCT_INFO),
+        'setup_info': dict(SETUP_INFO),
+        'nb_file': [[os.path.join(SAMPLE_DIR, f'QNB{b}4441_U0{u}.CSV') for u in range(1, 5)] for b in range(1, 4)],
+        'rb_file': [os.path.join(SAMPLE_DIR, f'QRB4441_U0{u}.CSV') for u in range(1, 5)],
+        'limit_file': os.path.join(SAMPLE_DIR, 'LTC4441_Ref_Lot_Limits.csv'),
+    }
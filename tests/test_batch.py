@@ -0,0 +1,36 @@
+from auto_report.batch import run_batch
+
+
+def job(sample_job, test_card, output_dir):
+    inputs = {
+        'product_info': dict(sample_job['product_info'], **{'Test Card Name': test_card}),
+        'setup_info': sample_job['setup_info'],
+        'nb_file': sample_job['nb_file'],
+        'rb_file': sample_job['rb_file'],
+        'limit_file': sample_job['limit_file'],
+        'output_dir': str(output_dir),
+    }
+    return (f'{test_card} in {output_dir.name}', inputs)
+
+
+def test_jobs_writing_the_same_outputs_are_not_run(sample_job, tmp_path):
+    jobs = [job(sample_job, 'TC1', tmp_path / 'a'), job(sample_job, 'TC1', tmp_path / 'a'),
+            job(sample_job, 'TC2', tmp_path / 'a'), job(sample_job, 'TC1', tmp_path / 'b')]
+
+    # Without the workbook, the profile, mismatch and export files still collide
+    results = run_batch(jobs, max_workers=1, cache_dir=None, excel=False, export_format='parquet',
+                        export_dir=str(tmp_path / 'export'))
+
+    collisions = [result.error for result in results]
+    assert 'Another job' not in collisions[0] and 'Another job' not in collisions[2]
+    assert collisions[1] == f"ValueError: Another job already writes the outputs of test card 'TC1' to '{tmp_path / 'a'}'"
+    assert collisions[3] == \
+        f"ValueError: Another job already writes the outputs of test card 'TC1' to '{tmp_path / 'export'}'"
+
+
+def test_jobs_with_their_own_outputs_all_run(sample_job, tmp_path):
+    jobs = [job(sample_job, 'TC1', tmp_path / 'a'), job(sample_job, 'TC1', tmp_path / 'b')]
+
+    results = run_batch(jobs, max_workers=2, cache_dir=None, profile=False)
+
+    assert [result.status for result in results] == ['ok', 'ok']
@@ -0,0 +1,71 @@
+import os
+import shutil
+
+import numpy as np
+
+from auto_report import cache
+from auto_report.cache import cached_read_datalog, evict_cache
+from auto_report.datalog import read_datalog
+
+from conftest import SAMPLE_DIR
+
+
+def assert_same_datalog(cached, parsed):
+    assert list(cached.test_numbers) == list(parsed.test_numbers)
+    assert list(cached.descriptions) == list(parsed.descriptions)
+    assert list(cached.units) == list(parsed.units)
+    np.testing.assert_array_equal(cached.values, parsed.values)
+
+
+def entries(cache_dir):
+    return sorted(name for name in os.listdir(cache_dir) if name.endswith('.npz'))
+
+
+def test_unchanged_file_is_loaded_from_the_cache(tmp_path, monkeypatch):
+    file_path = os.path.join(SAMPLE_DIR, 'QRB4441_U01.CSV')
+    cache_dir = str(tmp_path / 'cache')
+
+    first = cached_read_datalog(file_path, cache_dir)
+    assert len(entries(cache_dir)) == 1
+
+    # A hit must not parse the file again
+    def parse(_):
+        raise AssertionError('the cached datalog was parsed again')
+    monkeypatch.setattr(cache, 'read_datalog', parse)
+
+    assert_same_datalog(cached_read_datalog(file_path, cache_dir), first)
+    assert_same_datalog(first, read_datalog(file_path))
+
+
+def test_changed_content_misses_the_cache(tmp_path):
+    file_path = str(tmp_path / 'U01.CSV')
+    cache_dir = str(tmp_path / 'cache')
+    shutil.copy(os.path.join(SAMPLE_DIR, 'QRB4441_U01.CSV'), file_path)
+    cached_read_datalog(file_path, cache_dir)
+
+    # Same path, new content
+    shutil.copy(os.path.join(SAMPLE_DIR, 'QRB4441_U02.CSV'), file_path)
+    datalog = cached_read_datalog(file_path, cache_dir)
+
+    assert len(entries(cache_dir)) == 2
+    assert_same_datalog(datalog, read_datalog(file_path))
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    files = [os.path.join(SAMPLE_DIR, f'QRB4441_U0{u}.CSV') for u in range(1, 4)]
+    for file_path in files:
+        cached_read_datalog(file_path, cache_dir)
+    first, second, third = (cache._content_key(open(path, 'rb').read()) + '.npz' for path in files)
+    assert entries(cache_dir) == sorted([first, second, third])
+
+    # Oldest first: U01, U02, U03; reading U01 again makes U02 the least recently used
+    for age, name in zip([30, 20, 10], [first, second, third]):
+        path = os.path.join(cache_dir, name)
+        os.utime(path, (os.path.getmtime(path) - age,) * 2)
+    cached_read_datalog(files[0], cache_dir)
+
+    sizes = [os.path.getsize(os.path.join(cache_dir, name)) for name in (first, third)]
+    evict_cache(cache_dir, sum(sizes))
+
+    assert entries(cache_dir) == sorted([first, third])
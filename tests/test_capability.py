@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from auto_report.capability import capability_labels, evaluate_capability
+
+
+def legacy_cp(row):
+    # calculate_cp_rb of the original script
+    if row[7] == 0:
+        return np.nan
+    if row[2] is np.nan or row[3] is np.nan or row[7] is np.nan:
+        return np.nan
+    return round((row[3] - row[2]) / (6 * row[7]), 2)
+
+
+def legacy_cpk(row):
+    # calculate_cpk_rb of the original script
+    if np.isnan(row[2]) and np.isnan(row[3]) or row[7] == 0:
+        return np.nan, "N/A"
+    if np.isnan(row[2]):
+        cpk = (row[3] - row[6]) / (3 * row[7])
+    elif np.isnan(row[3]):
+        cpk = (row[6] - row[2]) / (3 * row[7])
+    else:
+        cpk = min(row[3] - row[6], row[6] - row[2]) / (3 * row[7])
+    cpk = round(cpk, 2)
+    return cpk, "Not capable" if cpk < 1.3 else "Good capable"
+
+
+def test_capability_matches_the_apply_path_with_round():
+    rng = np.random.default_rng(0)
+    num_tests = 5000
+    mean = rng.normal(0, 1, num_tests)
+    sd = rng.uniform(0.01, 0.5, num_tests)
+    # High limits that put Cpk on (or within a few ulps of) a half-way point of the second decimal
+    target = (rng.integers(50, 400, num_tests) + 0.5) / 100
+    high = mean + target * 3 * sd
+    high = high + rng.integers(-2, 3, num_tests) * np.spacing(high)
+    low = mean - rng.uniform(1, 5, num_tests) * 3 * sd
+    low[rng.random(num_tests) < 0.1] = np.nan
+    high[rng.random(num_tests) < 0.1] = np.nan
+    sd[rng.random(num_tests) < 0.02] = 0
+
+    # The original rows mix the limit file's text columns with the statistics, so they hold Python floats
+    frame = pd.DataFrame({
+        'Test #': [f'{k}.0' for k in range(num_tests)],
+        'Description': 'TEST',
+        'Low_Limit': low,
+        'High_Limit': high,
+        'StdDev': 0.1,
+        'Unit': 'V',
+        'Mean RB': mean,
+        'SD RB': sd,
+    })
+    frame.columns = range(len(frame.columns))
+    expected_cp = frame.apply(legacy_cp, axis=1).to_numpy(dtype=float)
+    expected = frame.apply(legacy_cpk, axis=1, result_type='expand')
+
+    capability = evaluate_capability(mean, sd, low, high)
+    np.testing.assert_array_equal(capability['Cp'], expected_cp)
+    np.testing.assert_array_equal(capability['Cpk'], expected[0].to_numpy(dtype=float))
+    assert list(capability_labels(capability['Cpk Result'])) == list(expected[1])
+
+
+def test_capability_evaluates_every_board_at_once():
+    rng = np.random.default_rng(1)
+    mean = rng.normal(0, 1, (4, 50))
+    sd = rng.uniform(0.01, 0.5, (4, 50))
+    low, high = np.full(50, -3.0), np.full(50, 3.0)
+    boards = evaluate_capability(mean, sd, low, high)
+    for board in range(4):
+        single = evaluate_capability(mean[board], sd[board], low, high)
+        for key, value in single.items():
+            np.testing.assert_array_equal(boards[key][board], value)
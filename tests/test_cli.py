@@ -0,0 +1,46 @@
+import json
+import os
+
+import pytest
+
+from auto_report.cli import main
+from auto_report.datalog import read_datalog_statistics
+
+from conftest import PRODUCT_INFO, SAMPLE_DIR, SETUP_INFO
+
+
+def write_job(path, output_dir):
+    job = {
+        'product_info': PRODUCT_INFO,
+        'setup_info': SETUP_INFO,
+        'rb': os.path.join(SAMPLE_DIR, 'QRB4441_U*.CSV'),
+        'nb': [os.path.join(SAMPLE_DIR, f'QNB{b}4441_U*.CSV') for b in range(1, 4)],
+        'limit': os.path.join(SAMPLE_DIR, 'LTC4441_Ref_Lot_Limits.csv'),
+        'output_dir': str(output_dir),
+    }
+    with open(path, 'w') as f:
+        json.dump(job, f)
+
+
+def test_unreadable_job_files_fail_alone(tmp_path, capsys):
+    malformed = tmp_path / 'malformed.json'
+    malformed.write_text('{"product_info": ')
+    good = tmp_path / 'good.json'
+    write_job(good, tmp_path / 'reports')
+
+    exit_code = main([str(tmp_path / 'missing.json'), str(malformed), str(good), '--no-cache', '--no-profile'])
+
+    assert exit_code == 1
+    errors = capsys.readouterr().err
+    assert 'missing.json' in errors and 'malformed.json' in errors
+    assert len(list((tmp_path / 'reports').glob('TC1_Correlation_Report_*.xlsx'))) == 1
+
+
+@pytest.mark.parametrize('chunk_rows', ['0', '-5'])
+def test_chunk_rows_must_be_positive(chunk_rows, tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / 'job.json'), '--chunk-rows', chunk_rows])
+    assert 'must be a positive integer' in capsys.readouterr().err
+
+    with pytest.raises(ValueError, match='chunk_rows must be a positive number of rows'):
+        read_datalog_statistics(os.path.join(SAMPLE_DIR, 'QRB4441_U01.CSV'), int(chunk_rows))
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from auto_report.correlation import evaluate_correlation, status_labels
+
+
+def legacy_row(rb_mean, rb_sd, nb_mean, nb_sd, low_limit, high_limit, sd_lot):
+    # One test of one unit, as the DataFrame.apply(axis=1) passes of the original script evaluated it
+    delta_mean = np.round(abs(nb_mean - rb_mean), 6)
+    if np.isnan(low_limit) or np.isnan(high_limit):
+        mean_shift = np.nan
+    elif delta_mean == 0:
+        mean_shift = 0
+    else:
+        mean_shift = np.round(delta_mean / (high_limit - low_limit) * 100, 5)
+
+    if np.isnan(mean_shift):
+        mean_shift_crit = "Passed" if delta_mean <= sd_lot else "For check"
+    else:
+        mean_shift_crit = "Passed" if mean_shift <= 5 else "Failed"
+
+    sd_ratio = 0 if rb_sd == 0 or nb_sd == 0 else np.round(nb_sd / rb_sd, 6)
+    sd_ratio_crit = "Passed" if sd_ratio <= 1.5 else "For check"
+
+    if mean_shift_crit == "Passed" and sd_ratio_crit == "Passed":
+        result = "Passed"
+    elif mean_shift_crit == "Failed":
+        result = "Failed"
+    else:
+        result = "For check"
+    return delta_mean, mean_shift, mean_shift_crit, sd_ratio, sd_ratio_crit, result
+
+
+@pytest.fixture
+def inputs():
+    rng = np.random.default_rng(0)
+    num_boards, num_units, num_tests = 3, 4, 300
+    low = rng.uniform(-10, 0, num_tests)
+    high = low + rng.uniform(0.5, 20, num_tests)
+    # Tests with one or no limit, equal means and zero standard deviations
+    low[rng.random(num_tests) < 0.15] = np.nan
+    high[rng.random(num_tests) < 0.15] = np.nan
+    sd_lot = rng.uniform(0.01, 0.5, num_tests)
+    rb_mean = np.round(rng.normal(0, 1, (num_units, num_tests)), 6)
+    rb_sd = np.round(rng.uniform(0, 0.3, (num_units, num_tests)), 5)
+    nb_mean = np.round(rb_mean + rng.normal(0, 0.3, (num_boards, num_units, num_tests)), 6)
+    nb_sd = np.round(rng.uniform(0, 0.4, (num_boards, num_units, num_tests)), 5)
+    nb_mean[:, :, :20] = rb_mean[:, :20]
+    rb_sd[:, 20:30] = 0
+    nb_sd[:, :, 30:40] = 0
+    return rb_mean, rb_sd, nb_mean, nb_sd, low, high, sd_lot
+
+
+def test_vectorized_criteria_match_the_apply_path(inputs):
+    rb_mean, rb_sd, nb_mean, nb_sd, low, high, sd_lot = inputs
+    evaluation = evaluate_correlation(rb_mean, rb_sd, nb_mean, nb_sd, low, high, sd_lot)
+
+    keys = ['Delta Mean', 'Mean Shift', 'Mean Shift Criteria', 'SD Ratio', 'SD Ratio Criteria', 'Result']
+    labels = {key: status_labels(evaluation[key]) for key in keys if 'Criteria' in key or key == 'Result'}
+    for i in range(nb_mean.shape[0]):
+        for j in range(nb_mean.shape[1]):
+            for k in range(nb_mean.shape[2]):
+                expected = legacy_row(rb_mean[j, k], rb_sd[j, k], nb_mean[i, j, k], nb_sd[i, j, k],
+                                      low[k], high[k], sd_lot[k])
+                for key, value in zip(keys, expected):
+                    actual = labels[key][i, j, k] if key in labels else evaluation[key][i, j, k]
+                    if isinstance(value, str):
+                        assert actual == value, (key, i, j, k)
+                    else:
+                        np.testing.assert_equal(actual, value, err_msg=f'{key} {i} {j} {k}')
+
+
+def test_criteria_broadcast_over_a_single_unit(inputs):
+    rb_mean, rb_sd, nb_mean, nb_sd, low, high, sd_lot = inputs
+    full = evaluate_correlation(rb_mean, rb_sd, nb_mean, nb_sd, low, high, sd_lot)
+    single = evaluate_correlation(rb_mean[1], rb_sd[1], nb_mean[2, 1], nb_sd[2, 1], low, high, sd_lot)
+    for key, value in single.items():
+        np.testing.assert_array_equal(value, full[key][2, 1])
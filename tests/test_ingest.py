@@ -0,0 +1,85 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from auto_report import ingest
+from auto_report.limits import load_limits
+from auto_report.pipeline import compute_correlation, load_datalogs, load_statistics
+from auto_report.stats import DEVICE_AXIS, statistics_mean_std, summary_statistics
+
+
+@pytest.fixture
+def job_copy(tmp_path, sample_job):
+    """
+    The sample job with its datalogs copied to a temporary directory, so they can be swapped.
+    """
+    def copy(path):
+        target = tmp_path / os.path.basename(path)
+        shutil.copy(path, target)
+        return str(target)
+
+    sample_job['rb_file'] = [copy(path) for path in sample_job['rb_file']]
+    sample_job['nb_file'] = [[copy(path) for path in board] for board in sample_job['nb_file']]
+    return sample_job
+
+
+def counting_reads(monkeypatch):
+    reads = []
+
+    def read_datalog(file_path):
+        reads.append(file_path)
+        return ingest_read(file_path)
+
+    ingest_read = ingest.read_datalog
+    monkeypatch.setattr(ingest, 'read_datalog', read_datalog)
+    return reads
+
+
+def test_unreadable_files_are_named(sample_job):
+    missing = sample_job['nb_file'][1][2].replace('U03', 'U09')
+    sample_job['nb_file'][1][2] = missing
+
+    with pytest.raises(ValueError, match='1 of 16 datalog files') as error:
+        load_statistics(sample_job['rb_file'], sample_job['nb_file'], load_limits(sample_job['limit_file']))
+    assert missing in str(error.value)
+
+
+def test_swapping_one_file_recomputes_only_its_block(job_copy, monkeypatch):
+    reads = counting_reads(monkeypatch)
+    limit = load_limits(job_copy['limit_file'])
+    memo = {}
+
+    def run():
+        data = load_statistics(job_copy['rb_file'], job_copy['nb_file'], limit, memo=memo).data
+        return compute_correlation(limit, data, memo=memo)
+
+    first = run()
+    assert len(reads) == 16
+
+    # Swap NB2 U03 for another unit's datalog
+    swapped = job_copy['nb_file'][1][2]
+    shutil.copy(job_copy['nb_file'][1][0], swapped)
+    reads.clear()
+    memo_before = dict(memo)
+    second = run()
+
+    assert reads == [swapped]
+    assert memo[('correlation', 0)] is memo_before[('correlation', 0)]
+    assert memo[('correlation', 2)] is memo_before[('correlation', 2)]
+    assert memo[('correlation', 1)] is not memo_before[('correlation', 1)]
+    assert first.tables[0].equals(second.tables[0])
+    assert not first.tables[1].equals(second.tables[1])
+
+
+def test_both_loaders_give_the_same_statistics(sample_job):
+    limit = load_limits(sample_job['limit_file'])
+    datalogs = load_datalogs(sample_job['rb_file'], sample_job['nb_file'], limit=limit)
+    statistics = load_statistics(sample_job['rb_file'], sample_job['nb_file'], limit)
+
+    mean, std = statistics_mean_std(statistics.data)
+    expected_mean, expected_std = statistics_mean_std(summary_statistics(datalogs.data, DEVICE_AXIS))
+    np.testing.assert_array_equal(mean, expected_mean)
+    np.testing.assert_array_equal(std, expected_std)
+    assert datalogs.mismatches.equals(statistics.mismatches)
@@ -0,0 +1,73 @@
+import io
+
+import numpy as np
+
+from auto_report.align import align_datalog, align_datalog_statistics
+from auto_report.datalog import Datalog, read_datalog, read_datalog_statistics
+from auto_report.limits import compile_limits, limit_rows, load_limits
+from auto_report.limits import test_keys as join_keys  # Not collected as a test
+
+LIMIT_CSV = """Test #,Description,Low_Limit,High_Limit,StdDev,Unit
+"\t1.0",Vcc,0.0,1.0,0.1,V
+3.1,Icc,0.0,1.0,0.1,A
+3.10,Icc,0.0,1.0,0.1,A
+4,Ioff,0.0,1.0,0.1,A
+4,Ileak,0.0,1.0,0.1,A
+"""
+
+
+def limits():
+    return compile_limits(load_limits(io.StringIO(LIMIT_CSV)))
+
+
+def datalog(test_numbers, descriptions):
+    values = np.arange(len(test_numbers) * 2, dtype=float).reshape(-1, 2)
+    return Datalog(np.array(test_numbers, dtype=object), np.array(descriptions, dtype=object),
+                   np.full(len(test_numbers), None), values)
+
+
+def test_integer_test_numbers_match_whatever_their_formatting():
+    assert list(join_keys(['\t1', '1.0', ' 1.00 ', '3.10', '3.1', 'T5', np.nan])) == \
+        ['1.0', '1.0', '1.0', '3.10', '3.1', 'T5', '']
+
+
+def test_decimal_test_numbers_are_not_collapsed():
+    assert list(limit_rows(limits(), ['3.1', '3.10', '3.100'])) == [1, 2, -1]
+
+
+def test_duplicate_limit_keys_match_their_first_row():
+    # '4' is listed twice: the test number alone finds the first row, the pair each row
+    assert list(limit_rows(limits(), ['4', '4.0', '1'])) == [3, 3, 0]
+    assert list(limit_rows(limits(), ['4', '4', '4'], ['Ileak', 'Ioff', 'Ivcc'])) == [4, 3, -1]
+
+
+def test_datalog_is_aligned_on_the_limit_rows():
+    log = datalog(['4', '9', '3.10', '1', '3.10'], ['Ileak', 'Vx', 'Icc', 'Vcc', 'Icc'])
+
+    values, missing, extra, duplicate = align_datalog(limits(), log)
+    assert list(missing) == [1, 4]
+    assert list(extra) == [1]
+    assert list(duplicate) == [4]
+    np.testing.assert_array_equal(values[:, 0], log.values[3])
+    np.testing.assert_array_equal(values[:, 2], log.values[2])
+    np.testing.assert_array_equal(values[:, 3], log.values[0])
+    assert np.isnan(values[:, [1, 4]]).all()
+
+    values, missing, extra, duplicate = align_datalog(limits(), log, match_description=True)
+    assert list(missing) == [1, 3]
+    assert list(duplicate) == [4]
+    np.testing.assert_array_equal(values[:, 4], log.values[0])
+
+
+def test_readers_keep_the_test_numbers_as_written(tmp_path):
+    file_path = tmp_path / 'U01.CSV'
+    file_path.write_text('Test #,Description,Units,D1,D2\n3.1,Icc,A,1,2\n3.10,Icc,A,3,4\n4,Ioff,A,5,6\n')
+
+    whole = read_datalog(str(file_path))
+    chunked = read_datalog_statistics(str(file_path), chunk_rows=2)
+    assert list(whole.test_numbers) == list(chunked.test_numbers) == ['3.1', '3.10', '4']
+
+    values, _, _, _ = align_datalog(limits(), whole)
+    np.testing.assert_array_equal(values[:, 1:4].T, whole.values)
+    statistics, _, _, _ = align_datalog_statistics(limits(), chunked)
+    np.testing.assert_array_equal(statistics.mean[1:4], [1.5, 3.5, 5.5])
@@ -0,0 +1,91 @@
+import math
+import os
+
+import numpy as np
+
+from auto_report.pipeline import check_value, compute_correlation, compute_cpk, generate_report, load_limits
+from auto_report.stats import UNIT_AXIS, SummaryStats, pool_statistics, statistics_mean_std
+
+from conftest import DATA_DIR, SAMPLE_DIR, sheet_values
+
+
+def same_value(a, b):
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return type(a) is type(b) and a == b
+
+
+def test_sample_report_matches_baseline(sample_job, tmp_path):
+    output_file = generate_report(**sample_job, output_dir=str(tmp_path), cache_dir=None, profile=False)
+
+    expected = sheet_values(os.path.join(DATA_DIR, 'baseline_report.xlsx'))
+    actual = sheet_values(output_file)
+    assert list(actual) == list(expected)
+    for name in expected:
+        assert len(actual[name]) == len(expected[name]), name
+        for row, (actual_row, expected_row) in enumerate(zip(actual[name], expected[name])):
+            differences = [(column, a, b) for column, (a, b) in enumerate(zip(actual_row, expected_row))
+                           if not same_value(a, b)]
+            assert not differences, (name, row + 1, differences)
+
+
+def near_ties(decimals, count, seed):
+    # Values within a few ulps of a half-way point of the last decimal place
+    rng = np.random.default_rng(seed)
+    scaled = rng.integers(-10 ** 7, 10 ** 7, count) + 0.5
+    values = scaled / 10 ** decimals
+    return values + rng.integers(-3, 4, count) * np.spacing(values)
+
+
+def test_rb_and_board_statistics_round_like_the_formatted_values():
+    # The original script formatted the RB unit statistics and the pooled board statistics with
+    # f'{x:.Nf}' and read them back; the statistics here sit on near-ties of those decimals
+    limit = load_limits(os.path.join(SAMPLE_DIR, 'LTC4441_Ref_Lot_Limits.csv'))
+    num_tests = len(limit)
+    mean = near_ties(6, 2 * 3 * num_tests, seed=1).reshape(2, 3, num_tests)
+    std = np.abs(near_ties(5, 2 * 3 * num_tests, seed=2)).reshape(2, 3, num_tests)
+    count = np.full(mean.shape, 10.0)
+    statistics = SummaryStats(count, mean, std ** 2 * count)
+
+    unit_mean, unit_std = statistics_mean_std(statistics)
+    board_mean, board_std = statistics_mean_std(pool_statistics(statistics, UNIT_AXIS))
+
+    correlation = compute_correlation(limit, statistics)
+    table = correlation.tables[0]
+    for unit in range(3):
+        np.testing.assert_array_equal(table[f'Mean RB U{unit + 1}'], [float(f'{x:.6f}') for x in unit_mean[0, unit]])
+        np.testing.assert_array_equal(table[f'SD RB U{unit + 1}'], [float(f'{x:.5f}') for x in unit_std[0, unit]])
+
+    cpk = compute_cpk(limit, correlation)
+    np.testing.assert_array_equal(cpk.board_mean, [[float(f'{x:.4f}') for x in row] for row in board_mean])
+    np.testing.assert_array_equal(cpk.board_std, [[float(f'{x:.4f}') for x in row] for row in board_std])
+
+
+def test_release_remarks_follow_the_failed_test_counts():
+    assert list(check_value(np.array([0, 3, 0]))) == \
+        ["Good to release if no concern", "Not acceptable", "Good to release if no concern"]
+    assert list(check_value([0, "", 1])) == ["Good to release if no concern", "", "Not acceptable"]
+
+
+def test_test_missing_from_a_board_is_not_rated(sample_job, tmp_path):
+    # Drop test 7.0 from the four NB1 datalogs
+    nb1 = []
+    for path in sample_job['nb_file'][0]:
+        with open(path) as f:
+            lines = [line for line in f if not line.startswith('\t7.0,')]
+        copy = tmp_path / os.path.basename(path)
+        copy.write_text(''.join(lines))
+        nb1.append(str(copy))
+    sample_job['nb_file'][0] = nb1
+
+    output_file = generate_report(**sample_job, output_dir=str(tmp_path), profile=False)
+
+    sheets = sheet_values(output_file)
+    header, *rows = sheets['NB1 CPK']
+    row = next(row for row in rows if row[0] == '7.0')
+    nb1_columns = header.index('Mean NB1')
+    assert row[nb1_columns:nb1_columns + 4] == [None] * 4
+    assert row[header.index('Cpk NB1 Result')] == 'N/A'
+    assert row[header.index('Cpk RB Result')] == 'Good capable'
+    header, *rows = sheets['NB2 CPK']
+    assert next(row for row in rows if row[0] == '7.0')[header.index('Cpk NB2 Result')] == 'Good capable'
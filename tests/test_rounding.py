@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from auto_report.rounding import round_decimal, round_exact
+
+
+def near_ties(decimals, count=100000, seed=0):
+    # Values within a few ulps of a half-way point of the last decimal place
+    rng = np.random.default_rng(seed)
+    values = (rng.integers(-10 ** 7, 10 ** 7, count) + 0.5) / 10 ** decimals
+    return values + rng.integers(-3, 4, count) * np.spacing(values)
+
+
+@pytest.mark.parametrize('decimals', [2, 4, 5, 6])
+def test_round_exact_matches_formatted_values_on_near_ties(decimals):
+    values = near_ties(decimals, seed=decimals)
+    expected = np.array([float(f'{x:.{decimals}f}') for x in values])
+    np.testing.assert_array_equal(round_exact(values, decimals), expected)
+
+
+@pytest.mark.parametrize('decimals', [2, 4, 6])
+def test_round_exact_matches_round(decimals):
+    values = near_ties(decimals, count=20000, seed=10 + decimals)
+    np.testing.assert_array_equal(round_exact(values, decimals), [round(x, decimals) for x in values.tolist()])
+
+
+def test_round_exact_known_near_ties():
+    assert round_exact(2.30775, 4) == 2.3077
+    assert round_exact(-6.045045, 5) == -6.04505
+    assert round_exact(65.675, 2) == round(65.675, 2)
+
+
+def test_round_exact_passes_special_values_through():
+    values = np.array([np.nan, np.inf, -np.inf, 1e300, 0.0])
+    np.testing.assert_array_equal(round_exact(values, 4), values)
+    assert isinstance(round_exact(1.23456, 2), float)
+
+
+def test_round_decimal_is_np_round():
+    values = near_ties(5, count=20000, seed=3)
+    np.testing.assert_array_equal(round_decimal(values, 5), np.round(values, 5))
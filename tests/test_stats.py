@@ -0,0 +1,49 @@
+import numpy as np
+
+from auto_report.stats import (DEVICE_AXIS, UNIT_AXIS, board_statistics, pool_statistics, statistics_mean_std,
+                               summary_statistics, unit_statistics)
+
+
+def datalog_tensor(seed=0):
+    """
+    Return a (board, unit, device, test) tensor with NaN padding, a missing test and an empty unit.
+    """
+    rng = np.random.default_rng(seed)
+    tensor = rng.normal(2.5, 0.3, size=(3, 4, 20, 6)) * 10.0 ** rng.integers(-6, 4, size=6)
+    tensor[:, 1, 15:] = np.nan  # A unit with fewer devices
+    tensor[1, :, :, 2] = np.nan  # A test the whole board misses
+    tensor[2, 3, :, 4] = np.nan  # A test one unit misses
+    tensor[0, 2, 7, 5] = np.nan  # A missing cell
+    return tensor
+
+
+def test_unit_statistics_match_the_direct_mean_and_std():
+    tensor = datalog_tensor()
+    mean, std = statistics_mean_std(summary_statistics(tensor, DEVICE_AXIS))
+    direct_mean, direct_std = unit_statistics(tensor)
+    np.testing.assert_allclose(mean, direct_mean, rtol=1e-12)
+    np.testing.assert_allclose(std, direct_std, rtol=1e-9)
+
+
+def test_pooled_statistics_match_the_board_mean_and_std():
+    tensor = datalog_tensor()
+    pooled = pool_statistics(summary_statistics(tensor, DEVICE_AXIS), UNIT_AXIS)
+    mean, std = statistics_mean_std(pooled)
+    direct_mean, direct_std = board_statistics(tensor)
+
+    np.testing.assert_array_equal(pooled.count, np.sum(~np.isnan(tensor), axis=(UNIT_AXIS, DEVICE_AXIS)))
+    np.testing.assert_allclose(mean, direct_mean, rtol=1e-12)
+    np.testing.assert_allclose(std, direct_std, rtol=1e-9)
+    assert np.isnan(mean[1, 2]) and np.isnan(std[1, 2])
+
+
+def test_pooling_in_any_grouping_gives_the_same_statistics():
+    stats = summary_statistics(datalog_tensor(1), DEVICE_AXIS)
+    at_once = pool_statistics(stats, UNIT_AXIS)
+
+    halves = [pool_statistics(type(stats)(*(field[:, part] for field in stats)), UNIT_AXIS)
+              for part in (slice(0, 1), slice(1, 4))]
+    in_two = pool_statistics(type(stats)(*(np.stack(fields, axis=1) for fields in zip(*halves))), UNIT_AXIS)
+
+    for expected, actual in zip(at_once, in_two):
+        np.testing.assert_allclose(actual, expected, rtol=1e-12)
@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+
+from auto_report.pipeline import ReportSheet
+from auto_report.streaming import write_workbook_streaming
+
+from conftest import sheet_values
+
+
+def test_chunked_rows_write_the_same_workbook(tmp_path):
+    table = pd.DataFrame({
+        'Test #': [f'{i}.0' for i in range(10)],
+        'Mean': [0.5, np.nan, np.inf, -np.inf, 2.25, 1e-7, 3.0, 4.0, 5.0, 6.0],
+        'Count': np.arange(10),
+        'Result': ['Passed', 'Failed', None, 'For check', 'Passed', 'Passed', '', 'Passed', 'Failed', 'Passed'],
+    })
+    sheets = [ReportSheet('NB1 Correlation', 'table', [table, table.head(3)], ['Result'], ['Passed', 'Failed'])]
+
+    write_workbook_streaming(tmp_path / 'whole.xlsx', sheets)
+    write_workbook_streaming(tmp_path / 'chunked.xlsx', sheets, chunk_rows=3)
+
+    whole = sheet_values(tmp_path / 'whole.xlsx')
+    assert sheet_values(tmp_path / 'chunked.xlsx') == whole
+    rows = whole['NB1 Correlation']
+    assert rows[1][:3] == ['0.0', 0.5, 0] and rows[2][1] is None and rows[3][1] == 'inf' and rows[4][1] == '-inf'
+    assert len(rows) == 1 + 10 + 1 + 1 + 3
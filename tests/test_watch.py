@@ -0,0 +1,104 @@
+import json
+import multiprocessing
+import os
+import shutil
+import time
+
+import pytest
+
+from auto_report import watch
+from auto_report.watch import DatalogSet, complete_set, group_datalogs, load_state, watch_folder
+
+from conftest import PRODUCT_INFO, SAMPLE_DIR, SETUP_INFO
+
+
+def test_sample_datalogs_make_one_complete_set():
+    groups = group_datalogs(sorted(os.listdir(SAMPLE_DIR)))
+
+    assert list(groups) == ['4441']
+    datalog_set = complete_set('4441', groups['4441'])
+    assert datalog_set == DatalogSet(
+        part='4441',
+        rb_file=[f'QRB4441_U0{u}.CSV' for u in range(1, 5)],
+        nb_file=[[f'QNB{b}4441_U0{u}.CSV' for u in range(1, 5)] for b in range(1, 4)],
+    )
+    assert complete_set('4441', groups['4441'], boards=3, units=4) == datalog_set
+
+
+def test_nb_names_go_to_the_longest_matching_part():
+    names = ['QRB4441_U01.CSV', 'QRB41_U01.csv', 'QNB104441_U01.CSV', 'QNB1041_U01.csv', 'QNB2441_U01.CSV',
+             'QNB04441_U01.CSV', 'QNB14441_U1.CSV', 'notes.txt', 'LTC4441_Ref_Lot_Limits.csv']
+    groups = group_datalogs(names)
+
+    assert groups['4441'] == {'rb': {1: 'QRB4441_U01.CSV'},
+                              'nb': {10: {1: 'QNB104441_U01.CSV'}, 1: {1: 'QNB14441_U1.CSV'}}}
+    assert groups['41'] == {'rb': {1: 'QRB41_U01.csv'}, 'nb': {10: {1: 'QNB1041_U01.csv'}, 24: {1: 'QNB2441_U01.CSV'}}}
+
+
+def test_incomplete_sets_are_not_queued():
+    rb = {1: 'QRB4441_U01.CSV', 2: 'QRB4441_U02.CSV'}
+    board = {1: 'QNB14441_U01.CSV', 2: 'QNB14441_U02.CSV'}
+
+    assert complete_set('4441', {'rb': rb, 'nb': {}}) is None
+    assert complete_set('4441', {'rb': rb, 'nb': {1: {1: board[1]}}}) is None  # A unit missing
+    assert complete_set('4441', {'rb': rb, 'nb': {2: board}}) is None  # NB1 missing
+    assert complete_set('4441', {'rb': {2: rb[2]}, 'nb': {1: {2: board[2]}}}) is None  # U1 missing
+    assert complete_set('4441', {'rb': rb, 'nb': {1: board}}, boards=2) is None
+    assert complete_set('4441', {'rb': rb, 'nb': {1: board}}, units=3) is None
+    assert complete_set('4441', {'rb': rb, 'nb': {1: board}}, boards=1, units=2) == \
+        DatalogSet('4441', [rb[1], rb[2]], [[board[1], board[2]]])
+
+
+def interrupted_run_set(name, part, inputs, options, run_set=watch._run_set):
+    # The job of the workers: the sets of part 4442 get a Ctrl+C
+    if part == '4442':
+        raise KeyboardInterrupt
+    return run_set(name, part, inputs, options)
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork', reason="The patched job only reaches forked workers")
+def test_interrupted_watcher_records_the_finished_jobs(tmp_path, monkeypatch):
+    # Two parts: 4441 and a copy named 4442, whose worker gets the Ctrl+C
+    drop_dir = tmp_path / 'drop'
+    drop_dir.mkdir()
+    for name in os.listdir(SAMPLE_DIR):
+        if name.upper().endswith('.CSV') and name.startswith('Q'):
+            shutil.copy(os.path.join(SAMPLE_DIR, name), drop_dir / name)
+            shutil.copy(os.path.join(SAMPLE_DIR, name), drop_dir / name.replace('4441', '4442'))
+
+    def interrupt(fd, timeout):
+        # Ctrl+C once the report of 4441 is written, so its job is not cancelled as still queued
+        deadline = time.monotonic() + 60
+        while not list((tmp_path / 'reports').glob('4441_*/*.xlsx')) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(watch, '_run_set', interrupted_run_set)
+    monkeypatch.setattr(watch, 'wait_for_changes', interrupt)
+
+    template = {'product_info': dict(PRODUCT_INFO, **{'Test Card Name': 'TC{part}'}), 'setup_info': SETUP_INFO,
+                'limit': os.path.join(SAMPLE_DIR, 'LTC4441_Ref_Lot_Limits.csv')}
+    state_file = tmp_path / 'state.json'
+    with pytest.raises(KeyboardInterrupt):
+        watch_folder(str(drop_dir), template, str(tmp_path / 'reports'), state_file=str(state_file), settle=0,
+                     max_workers=2, profile=False)
+
+    with open(state_file) as f:
+        statuses = {record['part']: record['status'] for record in json.load(f)['sets'].values()}
+    assert statuses == {'4441': 'ok', '4442': 'queued'}
+    assert [record['part'] for record in load_state(str(state_file)).values()] == ['4441']
+
+
+def test_failed_and_unfinished_sets_run_again_after_a_restart(tmp_path):
+    state_file = str(tmp_path / 'state.json')
+    watch.save_state(state_file, {'a': {'status': 'ok'}, 'b': {'status': 'failed'}, 'c': {'status': 'queued'}})
+    assert load_state(state_file) == {'a': {'status': 'ok'}}
+
+
+def test_workers_keep_the_memos_of_the_last_parts_only(monkeypatch):
+    monkeypatch.setattr(watch, '_memos', watch.OrderedDict())
+    memos = [watch._part_memo(str(part)) for part in range(watch.MEMO_PARTS)]
+    assert watch._part_memo('0') is memos[0]  # Now the most recently run part
+
+    watch._part_memo('new')
+    assert list(watch._memos) == [str(part) for part in range(2, watch.MEMO_PARTS)] + ['0', 'new']